@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from types import ModuleType
 from typing import Any
 
 import httpx
@@ -19,6 +20,12 @@ from better_notion._api.errors import NotionAPIError
 from better_notion._api.oauth import OAuthTokenHandler
 from better_notion._api.retry import retry_on_rate_limit
 
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # Optional: faster decoding of large query responses
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,6 +52,7 @@ class NotionAPI:
     DEFAULT_BASE_URL = "https://api.notion.com/v1"
     DEFAULT_TIMEOUT = 30.0
     DEFAULT_VERSION = "2022-06-28"
+    DEFAULT_MAX_CONNECTIONS = 1
 
     def __init__(
         self,
@@ -54,6 +62,7 @@ class NotionAPI:
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         version: str = DEFAULT_VERSION,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
     ) -> None:
         """Initialize the Notion API client.
 
@@ -65,6 +74,8 @@ class NotionAPI:
             base_url: Base URL for the API.
             timeout: Request timeout in seconds.
             version: Notion API version.
+            max_connections: Maximum number of pooled HTTP connections, which
+                bounds how many requests run at once.
 
         Raises:
             ValueError: If neither auth nor auth_handler is provided,
@@ -86,13 +97,17 @@ class NotionAPI:
         self._base_url = base_url.rstrip("/") if base_url else self.DEFAULT_BASE_URL
         self._timeout = timeout
         self._version = version
+        self._max_connections = max_connections
 
         # Create HTTP client with connection limits for better compatibility
         self._http = httpx.AsyncClient(
             base_url=self._base_url,
             timeout=httpx.Timeout(timeout),
             headers=self._default_headers(),
-            limits=httpx.Limits(max_keepalive_connections=1, max_connections=1),
+            limits=httpx.Limits(
+                max_keepalive_connections=max_connections,
+                max_connections=max_connections,
+            ),
         )
 
     @property
@@ -266,6 +281,8 @@ class NotionAPI:
                 if notion_request_id:
                     ctx.notion_request_id = notion_request_id
 
+                if orjson is not None:
+                    return orjson.loads(response.content)
                 return response.json()
 
             except httpx.HTTPStatusError as e:
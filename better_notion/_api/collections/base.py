@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Generic, TypeVar
 
@@ -104,20 +105,26 @@ class EntityCollection(BaseCollection[E], ABC):
         data = await self._request("GET", self._get_path(id))
         return self._entity_class(self._api, data)  # type: ignore[call-arg]
 
-    async def get_many(self, ids: list[str]) -> list[E]:
+    async def get_many(self, ids: list[str], *, concurrency: int = 5) -> list[E]:
         """Get multiple entities - returns list[E].
 
+        The Notion API has no batch retrieve endpoint, so entities are fetched
+        with concurrent GETs, at most ``concurrency`` at a time.
+
         Args:
             ids: List of entity IDs.
+            concurrency: Maximum number of requests in flight at once.
 
         Returns:
-            List of entity instances.
+            List of entity instances, in the same order as ``ids``.
         """
-        entities = []
-        for entity_id in ids:
-            entity = await self.get(entity_id)
-            entities.append(entity)
-        return entities
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(entity_id: str) -> E:
+            async with semaphore:
+                return await self.get(entity_id)
+
+        return list(await asyncio.gather(*(fetch(entity_id) for entity_id in ids)))
 
     @abstractmethod
     def _get_path(self, id: str) -> str:
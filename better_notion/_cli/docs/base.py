@@ -4,10 +4,31 @@ This module provides the core data structures for documenting
 CLI commands and workflows in a machine-readable format.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
 
+def _to_builtin(value: Any) -> Any:
+    """Convert shared read-only containers into plain dicts and lists.
+
+    Schema modules share tuples (and read-only mappings) between entries
+    to avoid duplicating literals; serializers expect plain JSON types.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        Value with nested mappings as dicts and tuples as lists
+    """
+    if isinstance(value, Mapping):
+        return {key: _to_builtin(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(item) for item in value]
+    return value
+
+
 @dataclass
 class Concept:
     """A concept represents a high-level idea in the system.
@@ -33,12 +54,12 @@ class Concept:
         return {
             "name": self.name,
             "description": self.description,
-            "properties": self.properties,
+            "properties": _to_builtin(self.properties),
             "relationships": self.relationships,
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkflowStep:
     """A single step in a workflow.
 
@@ -84,7 +105,7 @@ class ErrorRecovery:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Workflow:
     """A workflow represents a sequence of operations.
 
@@ -99,6 +120,7 @@ class Workflow:
         commands: Example commands for this workflow
         prerequisites: Required conditions before starting
         error_recovery: Error handling strategies
+        examples: Concrete example invocations
     """
 
     name: str
@@ -107,10 +129,11 @@ class Workflow:
     commands: list[str] = field(default_factory=list)
     prerequisites: list[str] = field(default_factory=list)
     error_recovery: dict[str, dict[str, Any]] = field(default_factory=dict)
+    examples: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
+        result = {
             "name": self.name,
             "description": self.description,
             "steps": [
@@ -122,8 +145,14 @@ class Workflow:
             "error_recovery": self.error_recovery,
         }
 
+        # Add examples if present
+        if self.examples:
+            result["examples"] = self.examples
 
-@dataclass
+        return result
+
+
+@dataclass(frozen=True, slots=True)
 class Command:
     """Documentation for a single command.
 
@@ -134,21 +163,26 @@ class Command:
         name: Command name
         purpose: What this command does (semantic meaning)
         description: Detailed description
-        flags: Dict of flag -> purpose
+        flags: Read-only mapping of flag -> purpose
         workflow: Which workflow this command belongs to
         when_to_use: When this command should be used
         error_recovery: Error handling strategies
-        subcommands: Dict of subcommand name -> subcommand documentation
+        subcommands: Read-only mapping of subcommand name -> documentation
     """
 
     name: str
     purpose: str
     description: str = ""
-    flags: dict[str, str] = field(default_factory=dict)
+    flags: Mapping[str, str] = field(default_factory=dict)
     workflow: str | None = None
     when_to_use: list[str] = field(default_factory=list)
     error_recovery: dict[str, dict[str, Any]] = field(default_factory=dict)
-    subcommands: dict[str, dict[str, Any]] = field(default_factory=dict)
+    subcommands: Mapping[str, dict[str, Any]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Expose flags and subcommands as read-only mappings."""
+        object.__setattr__(self, "flags", MappingProxyType(dict(self.flags)))
+        object.__setattr__(self, "subcommands", MappingProxyType(dict(self.subcommands)))
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -156,7 +190,7 @@ class Command:
             "name": self.name,
             "purpose": self.purpose,
             "description": self.description,
-            "flags": self.flags,
+            "flags": _to_builtin(self.flags),
             "workflow": self.workflow,
             "when_to_use": self.when_to_use,
             "error_recovery": self.error_recovery,
@@ -164,7 +198,7 @@ class Command:
 
         # Add subcommands if present
         if self.subcommands:
-            result["subcommands"] = self.subcommands
+            result["subcommands"] = _to_builtin(self.subcommands)
 
         return result
 
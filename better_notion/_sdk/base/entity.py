@@ -26,6 +26,8 @@ class BaseEntity(ABC):
         ...     async def children(self): ...
     """
 
+    __slots__ = ("_client", "_data", "_cache")
+
     def __init__(self, client: "NotionClient", data: dict[str, Any]) -> None:
         """Initialize entity with client and API data.
 
@@ -67,7 +67,8 @@ class NotionClient:
         self,
         auth: str,
         base_url: str | None = None,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        max_connections: int = NotionAPI.DEFAULT_MAX_CONNECTIONS,
     ) -> None:
         """Initialize the Notion client.
 
@@ -75,6 +76,7 @@ class NotionClient:
             auth: Notion API token
             base_url: API base URL (default: production)
             timeout: Request timeout in seconds
+            max_connections: Maximum number of concurrent HTTP connections
 
         Example:
             >>> client = NotionClient(auth=os.getenv("NOTION_KEY"))
@@ -89,7 +91,8 @@ class NotionClient:
         self._api = NotionAPI(
             auth=auth,
             base_url=base_url,
-            timeout=timeout
+            timeout=timeout,
+            max_connections=max_connections,
         )
 
         # Shared caches (accessible by managers and entities)
@@ -34,7 +34,8 @@ from better_notion.plugins.base import PluginInterface
 def get_client() -> NotionClient:
     """Get authenticated Notion client."""
     config = Config.load()
-    return NotionClient(auth=config.token, timeout=config.timeout)
+    # Room for the workspace creation waves and batched fetches to run concurrently
+    return NotionClient(auth=config.token, timeout=config.timeout, max_connections=5)
 
 
 class PersonalPlugin(CombinedPluginInterface):
@@ -178,7 +179,7 @@ class PersonalPlugin(CombinedPluginInterface):
                                 initializer._parent_page_id = effective_parent_page
                                 initializer._workspace_id = existing.get("workspace_id")
                                 initializer._workspace_name = existing.get("workspace_name", workspace_name)
-                                initializer.save_database_ids()
+                                await asyncio.to_thread(initializer.save_database_ids)
 
                                 return format_success(
                                     {
@@ -422,8 +423,11 @@ class PersonalPlugin(CombinedPluginInterface):
             parent: str = typer.Option(None, "--parent"),
             tags: str = typer.Option(None, "--tags"),
             energy: str = typer.Option(None, "--energy"),
+            task: list[str] = typer.Option(None, "--task"),
         ):
-            typer.echo(personal_cli.tasks_add(title, priority, domain, project, due, parent, tags, energy))
+            typer.echo(
+                personal_cli.tasks_add(title, priority, domain, project, due, parent, tags, energy, task)
+            )
 
         @tasks_app.command("list")
         def tasks_list_cmd(
@@ -638,17 +642,9 @@ class PersonalPlugin(CombinedPluginInterface):
 
     def register_sdk_managers(self, client: NotionClient) -> dict:
         """Register custom managers for personal entities."""
-        from better_notion.plugins.official.personal_sdk.managers import (
-            DomainManager, TagManager, ProjectManager, TaskManager,
-            RoutineManager,
-        )
-        return {
-            "domains": DomainManager(client),
-            "tags": TagManager(client),
-            "projects": ProjectManager(client),
-            "tasks": TaskManager(client),
-            "routines": RoutineManager(client),
-        }
+        from better_notion.plugins.official.personal_sdk.managers import MANAGER_REGISTRY
+
+        return {name: manager_cls(client) for name, manager_cls in MANAGER_REGISTRY.items()}
 
     def sdk_initialize(self, client: NotionClient) -> None:
         """Initialize plugin resources."""
@@ -20,7 +20,8 @@ from better_notion._sdk.client import NotionClient
 def get_client() -> NotionClient:
     """Get authenticated Notion client."""
     config = Config.load()
-    return NotionClient(auth=config.token, timeout=config.timeout)
+    # Room for the workspace creation waves and batched fetches to run concurrently
+    return NotionClient(auth=config.token, timeout=config.timeout, max_connections=5)
 
 
 def get_workspace_config() -> dict:
@@ -288,8 +289,13 @@ def tasks_add(
     parent: str | None,
     tags: str | None,
     energy: str | None,
+    extra_titles: list[str] | None = None,
 ) -> str:
-    """Add a new task."""
+    """Add a new task.
+
+    Titles in ``extra_titles`` are created alongside ``title`` with the same
+    options, in one concurrent batch.
+    """
     async def _add() -> str:
         try:
             client = get_client()
@@ -329,6 +335,37 @@ def tasks_add(
 
             from better_notion.plugins.official.personal_sdk.models import Task
 
+            if extra_titles:
+                from better_notion.plugins.official.personal_sdk.managers import TaskManager
+
+                client._personal_workspace_config = config
+                created = await TaskManager(client).create_many([
+                    {
+                        "title": task_title,
+                        "priority": priority,
+                        "due_date": due,
+                        "domain_id": domain_id,
+                        "project_id": project_id,
+                        "parent_task_id": parent_task_id,
+                        "tag_ids": tag_ids,
+                        "energy_required": energy,
+                    }
+                    for task_title in [title, *extra_titles]
+                ])
+
+                return format_success({
+                    "message": f"{len(created)} tasks created successfully",
+                    "tasks": [
+                        {
+                            "id": task.id,
+                            "title": task.title,
+                            "status": task.status,
+                            "priority": task.priority,
+                        }
+                        for task in created
+                    ],
+                })
+
             task = await Task.create(
                 client=client,
                 database_id=tasks_db_id,
@@ -529,18 +566,16 @@ def tasks_update(task_id: str, status: str | None, priority: str | None) -> str:
                 properties["Priority"] = Select(name="Priority", value=priority)
 
             if properties:
-                serialized_properties = {
-                    key: prop.to_dict() if hasattr(prop, 'to_dict') else prop
-                    for key, prop in properties.items()
-                }
+                serialized_properties = {key: prop.to_dict() for key, prop in properties.items()}
 
                 data = await client._api.pages.update(
                     page_id=task_id,
                     properties=serialized_properties,
                 )
 
-                # Update task data
+                # Update task data and re-parse the cached fields
                 task._data = data
+                task._invalidate()
 
             return format_success({
                 "message": "Task updated successfully",
@@ -641,10 +676,7 @@ def tasks_archive(task_id: str) -> str:
                 "Archived Date": Date(name="Archived Date", value=datetime.now())
             }
 
-            serialized_properties = {
-                key: prop.to_dict() if hasattr(prop, 'to_dict') else prop
-                for key, prop in properties.items()
-            }
+            serialized_properties = {key: prop.to_dict() for key, prop in properties.items()}
 
             await client._api.pages.update(
                 page_id=task_id,
@@ -927,10 +959,7 @@ def routines_check(routine_id: str) -> str:
                 "Last Completed": Date(name="Last Completed", value=datetime.now())
             }
 
-            serialized_properties = {
-                key: prop.to_dict() if hasattr(prop, 'to_dict') else prop
-                for key, prop in properties.items()
-            }
+            serialized_properties = {key: prop.to_dict() for key, prop in properties.items()}
 
             await client._api.pages.update(
                 page_id=routine_id,
@@ -1292,10 +1321,7 @@ def archive_tasks(older_than: int | None, completed_before: str | None) -> str:
                     "Archived Date": Date(name="Archived Date", value=datetime.now())
                 }
 
-                serialized_properties = {
-                    key: prop.to_dict() if hasattr(prop, 'to_dict') else prop
-                    for key, prop in properties.items()
-                }
+                serialized_properties = {key: prop.to_dict() for key, prop in properties.items()}
 
                 await client._api.pages.update(
                     page_id=task.id,
@@ -1397,10 +1423,7 @@ def archive_restore(task_id: str) -> str:
                 "Status": Select(name="Status", value="Done"),
             }
 
-            serialized_properties = {
-                key: prop.to_dict() if hasattr(prop, 'to_dict') else prop
-                for key, prop in properties.items()
-            }
+            serialized_properties = {key: prop.to_dict() for key, prop in properties.items()}
 
             await client._api.pages.update(
                 page_id=task_id,
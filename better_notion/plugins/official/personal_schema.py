@@ -6,6 +6,10 @@ system that AI agents can consume to understand how to work with the system.
 This is the SINGLE SOURCE OF TRUTH for personal plugin documentation.
 """
 
+import sys
+from types import MappingProxyType
+from typing import Any
+
 from better_notion._cli.docs.base import (
     Command,
     Concept,
@@ -14,283 +18,353 @@ from better_notion._cli.docs.base import (
     WorkflowStep,
 )
 
+__all__ = [
+    "AGENDA_DB_SCHEMA",
+    "DOMAINS_DB_SCHEMA",
+    "PERSONAL_SCHEMA",
+    "PROJECTS_DB_SCHEMA",
+    "REQUIRED_FIELDS",
+    "ROUTINES_DB_SCHEMA",
+    "SCHEMA_BY_TITLE",
+    "SELECT_OPTIONS",
+    "TAGS_DB_SCHEMA",
+    "TASKS_DB_SCHEMA",
+    "WORKSPACE_RELATION_GRAPH",
+    "WORKSPACE_RELATION_GRAPH_IN",
+    "is_valid_select",
+    "missing_required_fields",
+]
+
+# Drop prose-only concept text when running under -OO, like docstrings
+_NO_DOCS = sys.flags.optimize >= 2
+
+# =============================================================================
+# SHARED OPTIONS
+# =============================================================================
+
+_COLOR_OPTIONS = ("Red", "Orange", "Yellow", "Green", "Blue", "Purple", "Gray")
+_PRIORITY_OPTIONS = ("Critical", "High", "Medium", "Low")
+
 # =============================================================================
 # DATABASE SCHEMAS
 # =============================================================================
 
-DOMAINS_DB_SCHEMA = {
-    "title": "Domains",
-    "property_types": {
-        "Name": {
-            "type": "title",
-            "required": True,
-            "description": "Domain name"
-        },
-        "Description": {
-            "type": "text",
-            "required": False,
-            "description": "Domain description"
-        },
-        "Color": {
-            "type": "select",
-            "required": False,
-            "options": ["Red", "Orange", "Yellow", "Green", "Blue", "Purple", "Gray"],
-            "default": "Blue"
-        },
-    },
-    "example_creation": {
-        "command": "notion personal domains create --name 'Work' --description 'Professional activities' --color 'Blue'",
-        "properties": {
-            "Name": "Work",
-            "Description": "Professional activities",
-            "Color": "Blue"
-        }
+
+def _title(description: str) -> dict[str, Any]:
+    """Build a required title property definition."""
+    return {"type": "title", "required": True, "description": description}
+
+
+def _text(description: str) -> dict[str, Any]:
+    """Build an optional text property definition."""
+    return {"type": "text", "required": False, "description": description}
+
+
+def _number(description: str) -> dict[str, Any]:
+    """Build an optional number property definition."""
+    return {"type": "number", "required": False, "description": description}
+
+
+def _date(description: str, required: bool = False) -> dict[str, Any]:
+    """Build a date property definition."""
+    return {"type": "date", "required": required, "description": description}
+
+
+def _select(
+    options: tuple[str, ...],
+    default: str | None = None,
+    required: bool = False,
+    description: str | None = None,
+) -> dict[str, Any]:
+    """Build a select property definition.
+
+    Args:
+        options: Allowed option names
+        default: Default option, if any
+        required: Whether the property is required
+        description: Optional description
+
+    Returns:
+        Property definition dict
+    """
+    prop: dict[str, Any] = {"type": "select", "required": required, "options": options}
+    if default is not None:
+        prop["default"] = default
+    if description is not None:
+        prop["description"] = description
+    return prop
+
+
+def _relation(
+    target: str,
+    description: str,
+    required: bool = False,
+    dual_property: str | None = None,
+) -> dict[str, Any]:
+    """Build a relation property definition.
+
+    Args:
+        target: Title of the related database
+        description: Property description
+        required: Whether the property is required
+        dual_property: Name of the reverse property, for two-way relations
+
+    Returns:
+        Property definition dict
+    """
+    prop: dict[str, Any] = {"type": "relation", "required": required, "target": target}
+    if dual_property is not None:
+        prop["dual_property"] = dual_property
+    prop["description"] = description
+    return prop
+
+
+def _database_schema(
+    title: str,
+    property_types: dict[str, dict[str, Any]],
+    command: str,
+    example: dict[str, Any],
+) -> dict[str, Any]:
+    """Build a database schema entry.
+
+    The example payload is exposed read-only: docs/help output reads it but
+    never modifies it, so callers can share it without defensive copies.
+
+    Args:
+        title: Database title
+        property_types: Property definitions keyed by property name
+        command: Example CLI command creating an entry
+        example: Property values created by ``command``
+
+    Returns:
+        Database schema dict
+    """
+    return {
+        "title": title,
+        "property_types": property_types,
+        "example_creation": MappingProxyType(
+            {"command": command, "properties": MappingProxyType(example)}
+        ),
     }
-}
 
-TAGS_DB_SCHEMA = {
-    "title": "Tags",
-    "property_types": {
-        "Name": {
-            "type": "title",
-            "required": True,
-            "description": "Tag name"
-        },
-        "Color": {
-            "type": "select",
-            "required": False,
-            "options": ["Red", "Orange", "Yellow", "Green", "Blue", "Purple", "Gray"],
-            "default": "Gray"
-        },
-        "Category": {
-            "type": "select",
-            "required": False,
-            "options": ["Context", "Energy", "Location", "Time", "Custom"],
-            "default": "Custom"
-        },
-        "Description": {
-            "type": "text",
-            "required": False,
-            "description": "Tag description"
-        },
+
+# Shared by Projects and Tasks
+_PRIORITY_PROPERTY = _select(_PRIORITY_OPTIONS, default="Medium")
+
+DOMAINS_DB_SCHEMA = _database_schema(
+    "Domains",
+    {
+        "Name": _title("Domain name"),
+        "Description": _text("Domain description"),
+        "Color": _select(_COLOR_OPTIONS, default="Blue"),
     },
-    "example_creation": {
-        "command": "notion personal tags create '@computer' --category 'Context' --color 'Blue'",
-        "properties": {
-            "Name": "@computer",
-            "Category": "Context",
-            "Color": "Blue"
-        }
-    }
-}
+    "notion personal domains create --name 'Work' --description 'Professional activities' --color 'Blue'",
+    {"Name": "Work", "Description": "Professional activities", "Color": "Blue"},
+)
 
-PROJECTS_DB_SCHEMA = {
-    "title": "Projects",
-    "property_types": {
-        "Name": {
-            "type": "title",
-            "required": True,
-            "description": "Project name"
-        },
-        "Status": {
-            "type": "select",
-            "required": False,
-            "options": ["Active", "On Hold", "Completed", "Archived"],
-            "default": "Active"
-        },
-        "Domain": {
-            "type": "relation",
-            "required": True,
-            "target": "Domains",
-            "description": "Domain this project belongs to (resolved by name)"
-        },
-        "Deadline": {
-            "type": "date",
-            "required": False,
-            "description": "Project deadline"
-        },
-        "Priority": {
-            "type": "select",
-            "required": False,
-            "options": ["Critical", "High", "Medium", "Low"],
-            "default": "Medium"
-        },
-        "Progress": {
-            "type": "number",
-            "required": False,
-            "description": "Progress percentage (0-100)"
-        },
+TAGS_DB_SCHEMA = _database_schema(
+    "Tags",
+    {
+        "Name": _title("Tag name"),
+        "Color": _select(_COLOR_OPTIONS, default="Gray"),
+        "Category": _select(
+            ("Context", "Energy", "Location", "Time", "Custom"), default="Custom"
+        ),
+        "Description": _text("Tag description"),
     },
-    "example_creation": {
-        "command": "notion personal projects create --name 'Learn Python' --domain 'Learning' --priority 'High'",
-        "properties": {
-            "Name": "Learn Python",
-            "Domain": "Learning",
-            "Priority": "High"
-        }
-    }
-}
+    "notion personal tags create '@computer' --category 'Context' --color 'Blue'",
+    {"Name": "@computer", "Category": "Context", "Color": "Blue"},
+)
 
-TASKS_DB_SCHEMA = {
-    "title": "Tasks",
-    "property_types": {
-        "Title": {
-            "type": "title",
-            "required": True,
-            "description": "Task title"
-        },
-        "Status": {
-            "type": "select",
-            "required": True,
-            "options": ["Todo", "In Progress", "Done", "Cancelled", "Archived"],
-            "default": "Todo"
-        },
-        "Priority": {
-            "type": "select",
-            "required": False,
-            "options": ["Critical", "High", "Medium", "Low"],
-            "default": "Medium"
-        },
-        "Due Date": {
-            "type": "date",
-            "required": False,
-            "description": "Task due date"
-        },
-        "Domain": {
-            "type": "relation",
-            "required": False,
-            "target": "Domains",
-            "description": "Domain this task belongs to (resolved by name)"
-        },
-        "Project": {
-            "type": "relation",
-            "required": False,
-            "target": "Projects",
-            "description": "Project this task belongs to (resolved by name)"
-        },
-        "Parent Task": {
-            "type": "relation",
-            "required": False,
-            "target": "Tasks",
-            "dual_property": "Subtasks",
-            "description": "Parent task for hierarchical subtasks"
-        },
-        "Tags": {
-            "type": "relation",
-            "required": False,
-            "target": "Tags",
-            "dual_property": "Tasks",
-            "description": "Associated tags (many-to-many)"
-        },
-        "Energy Required": {
-            "type": "select",
-            "required": False,
-            "options": ["High", "Medium", "Low"],
-            "description": "Required energy level"
-        },
+PROJECTS_DB_SCHEMA = _database_schema(
+    "Projects",
+    {
+        "Name": _title("Project name"),
+        "Status": _select(
+            ("Active", "On Hold", "Completed", "Archived"), default="Active"
+        ),
+        "Domain": _relation(
+            "Domains",
+            "Domain this project belongs to (resolved by name)",
+            required=True,
+        ),
+        "Deadline": _date("Project deadline"),
+        "Priority": _PRIORITY_PROPERTY,
+        "Progress": _number("Progress percentage (0-100)"),
     },
-    "example_creation": {
-        "command": "notion personal tasks add 'Complete Python course' --domain 'Learning' --priority 'High' --due '2025-12-31'",
-        "properties": {
-            "Title": "Complete Python course",
-            "Status": "Todo",
-            "Priority": "High"
-        }
-    }
-}
+    "notion personal projects create --name 'Learn Python' --domain 'Learning' --priority 'High'",
+    {"Name": "Learn Python", "Domain": "Learning", "Priority": "High"},
+)
 
-ROUTINES_DB_SCHEMA = {
-    "title": "Routines",
-    "property_types": {
-        "Name": {
-            "type": "title",
-            "required": True,
-            "description": "Routine name"
-        },
-        "Frequency": {
-            "type": "select",
-            "required": False,
-            "options": ["Daily", "Weekly", "Weekdays", "Weekends"],
-            "default": "Daily"
-        },
-        "Domain": {
-            "type": "relation",
-            "required": False,
-            "target": "Domains",
-            "description": "Domain this routine belongs to (resolved by name)"
-        },
-        "Best Time": {
-            "type": "text",
-            "required": False,
-            "description": "Best time for routine"
-        },
-        "Estimated Duration": {
-            "type": "number",
-            "required": False,
-            "description": "Duration in minutes"
-        },
+TASKS_DB_SCHEMA = _database_schema(
+    "Tasks",
+    {
+        "Title": _title("Task title"),
+        "Status": _select(
+            ("Todo", "In Progress", "Done", "Cancelled", "Archived"),
+            default="Todo",
+            required=True,
+        ),
+        "Priority": _PRIORITY_PROPERTY,
+        "Due Date": _date("Task due date"),
+        "Domain": _relation("Domains", "Domain this task belongs to (resolved by name)"),
+        "Project": _relation("Projects", "Project this task belongs to (resolved by name)"),
+        "Parent Task": _relation(
+            "Tasks",
+            "Parent task for hierarchical subtasks",
+            dual_property="Subtasks",
+        ),
+        "Tags": _relation(
+            "Tags", "Associated tags (many-to-many)", dual_property="Tasks"
+        ),
+        "Energy Required": _select(
+            ("High", "Medium", "Low"), description="Required energy level"
+        ),
     },
-    "example_creation": {
-        "command": "notion personal routines create --name 'Morning meditation' --frequency 'Daily' --domain 'Health' --best-time '7:00 AM' --duration 15",
-        "properties": {
-            "Name": "Morning meditation",
-            "Frequency": "Daily",
-            "Best Time": "7:00 AM"
-        }
-    }
-}
+    "notion personal tasks add 'Complete Python course' --domain 'Learning' --priority 'High' --due '2025-12-31'",
+    {"Title": "Complete Python course", "Status": "Todo", "Priority": "High"},
+)
 
-AGENDA_DB_SCHEMA = {
-    "title": "Agenda",
-    "property_types": {
-        "Name": {
-            "type": "title",
-            "required": True,
-            "description": "Agenda item name"
-        },
-        "Date & Time": {
-            "type": "date",
-            "required": True,
-            "description": "Scheduled date and time"
-        },
-        "Duration": {
-            "type": "number",
-            "required": False,
-            "description": "Duration in minutes"
-        },
-        "Type": {
-            "type": "select",
-            "required": False,
-            "options": ["Event", "Time Block", "Reminder"],
-            "default": "Event"
-        },
-        "Linked Task": {
-            "type": "relation",
-            "required": False,
-            "target": "Tasks",
-            "description": "Linked task"
-        },
-        "Linked Project": {
-            "type": "relation",
-            "required": False,
-            "target": "Projects",
-            "description": "Linked project"
-        },
+ROUTINES_DB_SCHEMA = _database_schema(
+    "Routines",
+    {
+        "Name": _title("Routine name"),
+        "Frequency": _select(
+            ("Daily", "Weekly", "Weekdays", "Weekends"), default="Daily"
+        ),
+        "Domain": _relation(
+            "Domains", "Domain this routine belongs to (resolved by name)"
+        ),
+        "Best Time": _text("Best time for routine"),
+        "Estimated Duration": _number("Duration in minutes"),
     },
-    "example_creation": {
-        "command": "notion personal agenda add --name 'Team meeting' --when '2025-01-15T10:00:00' --duration 60 --location 'Conference Room A'",
-        "properties": {
-            "Name": "Team meeting",
-            "Type": "Event"
-        }
-    }
+    "notion personal routines create --name 'Morning meditation' --frequency 'Daily' --domain 'Health' --best-time '7:00 AM' --duration 15",
+    {"Name": "Morning meditation", "Frequency": "Daily", "Best Time": "7:00 AM"},
+)
+
+AGENDA_DB_SCHEMA = _database_schema(
+    "Agenda",
+    {
+        "Name": _title("Agenda item name"),
+        "Date & Time": _date("Scheduled date and time", required=True),
+        "Duration": _number("Duration in minutes"),
+        "Type": _select(("Event", "Time Block", "Reminder"), default="Event"),
+        "Linked Task": _relation("Tasks", "Linked task"),
+        "Linked Project": _relation("Projects", "Linked project"),
+    },
+    "notion personal agenda add --name 'Team meeting' --when '2025-01-15T10:00:00' --duration 60 --location 'Conference Room A'",
+    {"Name": "Team meeting", "Type": "Event"},
+)
+
+_DB_SCHEMAS = (
+    DOMAINS_DB_SCHEMA,
+    TAGS_DB_SCHEMA,
+    PROJECTS_DB_SCHEMA,
+    TASKS_DB_SCHEMA,
+    ROUTINES_DB_SCHEMA,
+    AGENDA_DB_SCHEMA,
+)
+
+# Database schemas keyed by title (e.g. "Tasks")
+SCHEMA_BY_TITLE = {schema["title"]: schema for schema in _DB_SCHEMAS}
+
+# Required property names per database, computed once since schemas are static
+REQUIRED_FIELDS: dict[str, tuple[str, ...]] = {
+    schema["title"]: tuple(
+        name for name, prop in schema["property_types"].items() if prop["required"]
+    )
+    for schema in _DB_SCHEMAS
+}
+
+
+# Allowed select values keyed by (database title, property name)
+SELECT_OPTIONS: dict[tuple[str, str], frozenset[str]] = {
+    (schema["title"], name): frozenset(prop["options"])
+    for schema in _DB_SCHEMAS
+    for name, prop in schema["property_types"].items()
+    if prop["type"] == "select"
 }
 
+
+def is_valid_select(title: str, prop: str, value: str) -> bool:
+    """Check whether a value is an allowed option of a select property.
+
+    Args:
+        title: Database title (e.g. "Tasks")
+        prop: Select property name (e.g. "Priority")
+        value: Option name to check
+
+    Returns:
+        True if ``value`` is one of the property's options
+    """
+    return value in SELECT_OPTIONS[(title, prop)]
+
+
+def missing_required_fields(title: str, properties: dict) -> list[str]:
+    """Return required properties absent from a create payload.
+
+    Args:
+        title: Database title (e.g. "Tasks")
+        properties: Property values keyed by property name
+
+    Returns:
+        Names of required properties not present in ``properties``
+    """
+    return [name for name in REQUIRED_FIELDS[title] if name not in properties]
+
+
+# Relations between databases as (target, cardinality) edges, mirroring
+# WORKSPACE_CONCEPT.relationships in a form that can be traversed directly
+WORKSPACE_RELATION_GRAPH: dict[str, tuple[tuple[str, str], ...]] = {
+    "Domains": (("Projects", "1:N"), ("Tasks", "1:N"), ("Routines", "1:N")),
+    "Projects": (("Tasks", "1:N"),),
+    "Tasks": (("Tasks", "parent-child"), ("Tags", "M:N"), ("Agenda", "1:N")),
+    "Tags": (("Tasks", "M:N"),),
+}
+
+# Inverse edges as (source, cardinality), e.g. which databases reference Tasks
+WORKSPACE_RELATION_GRAPH_IN: dict[str, tuple[tuple[str, str], ...]] = {}
+for _source, _edges in WORKSPACE_RELATION_GRAPH.items():
+    for _target, _cardinality in _edges:
+        WORKSPACE_RELATION_GRAPH_IN[_target] = (
+            WORKSPACE_RELATION_GRAPH_IN.get(_target, ()) + ((_source, _cardinality),)
+        )
+del _source, _edges, _target, _cardinality
+
+
 # =============================================================================
 # CONCEPTS
 # =============================================================================
 
-WORKSPACE_CONCEPT = Concept(
+
+def _concept(
+    name: str,
+    description: str,
+    properties: dict[str, Any],
+    relationships: dict[str, str],
+) -> Concept:
+    """Build a concept, omitting descriptive prose under ``-OO``.
+
+    Args:
+        name: Name of the concept
+        description: Human-readable description
+        properties: Dict of concept properties and their meanings
+        relationships: Relationships to other concepts
+
+    Returns:
+        Concept instance
+    """
+    if _NO_DOCS:
+        return Concept(name=name, description="", properties=properties)
+    return Concept(
+        name=name,
+        description=description,
+        properties=properties,
+        relationships=relationships,
+    )
+
+
+WORKSPACE_CONCEPT = _concept(
     name="workspace",
     description=(
         "A personal workspace is a collection of 6 interconnected databases that implement "
@@ -321,7 +395,7 @@ WORKSPACE_CONCEPT = Concept(
     },
 )
 
-DOMAIN_CONCEPT = Concept(
+DOMAIN_CONCEPT = _concept(
     name="domain",
     description=(
         "A domain represents a high-level life area for organizing different aspects "
@@ -352,7 +426,7 @@ DOMAIN_CONCEPT = Concept(
     },
 )
 
-TAG_CONCEPT = Concept(
+TAG_CONCEPT = _concept(
     name="tag",
     description=(
         "Tags provide flexible context labels for tasks. Unlike domains (which are "
@@ -381,7 +455,7 @@ TAG_CONCEPT = Concept(
     },
 )
 
-TASK_CONCEPT = Concept(
+TASK_CONCEPT = _concept(
     name="task",
     description=(
         "A task represents an actionable item. Tasks can be standalone or belong to "
@@ -415,7 +489,7 @@ TASK_CONCEPT = Concept(
     },
 )
 
-PROJECT_CONCEPT = Concept(
+PROJECT_CONCEPT = _concept(
     name="project",
     description=(
         "A project represents a medium-term goal with clear objectives and deadlines. "
@@ -441,7 +515,7 @@ PROJECT_CONCEPT = Concept(
     },
 )
 
-ROUTINE_CONCEPT = Concept(
+ROUTINE_CONCEPT = _concept(
     name="routine",
     description=(
         "A routine represents a recurring activity or habit. Routines have frequency "
@@ -469,7 +543,7 @@ ROUTINE_CONCEPT = Concept(
     },
 )
 
-AGENDA_CONCEPT = Concept(
+AGENDA_CONCEPT = _concept(
     name="agenda",
     description=(
         "Agenda items represent scheduled events, time blocks, and reminders for "
@@ -6,31 +6,262 @@ entities through the client.plugin_manager() interface.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+import builtins
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from better_notion.plugins.official.personal_sdk.models import (
+    Domain,
+    Project,
+    Routine,
+    Tag,
+    Task,
+)
 
 if TYPE_CHECKING:
     from better_notion._sdk.client import NotionClient
 
 
-class DomainManager:
+class _TTLCache:
+    """Small LRU cache whose entries expire after a fixed time."""
+
+    __slots__ = ("_entries", "_maxsize", "_ttl")
+
+    def __init__(self, maxsize: int = 256, ttl: float = 30.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid
+        """
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def get(self, key: str) -> Any | None:
+        """Get a fresh value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self._ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+@lru_cache(maxsize=256)
+def _filter_clause(prop: str, prop_type: str, operator: str, value: str) -> dict[str, Any]:
+    """Build a single property filter clause.
+
+    Clauses are cached and shared between queries, so repeated filters (such
+    as status="Todo") are not rebuilt. Callers must treat them as read-only.
+
+    Args:
+        prop: Property name
+        prop_type: Notion property type (e.g. "select")
+        operator: Filter operator (e.g. "equals")
+        value: Value to compare against
+
+    Returns:
+        Filter clause dict
+    """
+    return {"property": prop, prop_type: {operator: value}}
+
+
+@lru_cache(maxsize=64)
+def _active_filter_spec(
+    spec: tuple[tuple[str, str, str], ...],
+    mask: tuple[bool, ...],
+) -> tuple[tuple[int, str, str, str], ...]:
+    """Select the filter spec entries whose arguments are set.
+
+    Cached per combination of set arguments, so building filters only loops
+    over the active entries.
+
+    Args:
+        spec: (property, property type, operator) per filter argument
+        mask: Whether each filter argument is set
+
+    Returns:
+        (argument index, property, property type, operator) per active filter
+    """
+    return tuple(
+        (index, *entry) for index, (entry, active) in enumerate(zip(spec, mask, strict=True)) if active
+    )
+
+
+def _title_filter(name: str) -> dict[str, Any]:
+    """Build a query filter matching the Name title property exactly."""
+    return {"property": "Name", "title": {"equals": name}}
+
+
+async def _query_batches(
+    client: NotionClient,
+    database_id: str,
+    model: type,
+    **kwargs: Any,
+) -> AsyncIterator[list]:
+    """Yield entities from a database query, one response page at a time.
+
+    Follows pagination cursors until Notion reports no more results.
+
+    Args:
+        client: NotionClient instance
+        database_id: Database to query
+        model: Entity class wrapping each page
+        **kwargs: Query parameters (e.g. filter)
+
+    Yields:
+        Lists of entities, one list per response
+    """
+    build = partial(model, client)
+    while True:
+        response = await client._api.databases.query(database_id=database_id, **kwargs)
+        yield list(map(build, response.get("results", ())))
+        if not response.get("has_more"):
+            return
+        kwargs["start_cursor"] = response["next_cursor"]
+
+
+async def _coalesce(
+    inflight: dict[Hashable, asyncio.Future],
+    key: Hashable,
+    fetch: Callable[[], Awaitable[list]],
+) -> list:
+    """Share one in-flight fetch between concurrent callers with the same key.
+
+    The shared fetch is shielded, so cancelling one caller does not cancel
+    it for the others.
+
+    Args:
+        inflight: Map of keys to running fetches, owned by the manager
+        key: Identifies identical requests
+        fetch: Starts the fetch when none is running for ``key``
+
+    Returns:
+        A copy of the fetched list, so callers cannot affect each other
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    return list(await asyncio.shield(task))
+
+
+async def _collect(batches: AsyncIterator[list]) -> list:
+    """Concatenate batches of entities into a single list."""
+    entities: list = []
+    async for batch in batches:
+        entities.extend(batch)
+    return entities
+
+
+async def _none() -> None:
+    """Placeholder awaitable for a skipped lookup."""
+    return None
+
+
+async def _find_by_name(manager: Any, name: str | None) -> Any | None:
+    """Find an entity by name, skipping the lookup when no name is given."""
+    if not name:
+        return None
+    return await manager.find_by_name(name)
+
+
+class _BaseManager:
+    """Shared state and database ID lookup for personal managers."""
+
+    __slots__ = ("_client", "_database_id", "_config_ref", "_inflight", "_get_cache")
+
+    # Key of this manager's database in the workspace config's database_ids
+    _DB_NAME: ClassVar[str] = ""
+
+    def __init__(self, client: NotionClient) -> None:
+        """Initialize manager.
+
+        Args:
+            client: NotionClient instance
+        """
+        self._client = client
+        self._database_id: str | None = None
+        self._config_ref: dict[str, Any] | None = None
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._get_cache = _TTLCache()
+
+    @property
+    def _db_id(self) -> str | None:
+        """Database ID from workspace config.
+
+        The resolved ID is cached until the client's workspace config
+        object is replaced.
+        """
+        config = getattr(self._client, "_personal_workspace_config", None)
+        if config is None:
+            return None
+        if config is not self._config_ref:
+            self._database_id = config.get("database_ids", {}).get(self._DB_NAME)
+            self._config_ref = config
+        return self._database_id
+
+
+class DomainManager(_BaseManager):
     """
     Manager for Domain entities.
 
     Provides convenience methods for working with domains.
 
-    Example:
-        >>> manager = client.plugin_manager("domains")
-        >>> domains = await manager.list()
-        >>> domain = await manager.get("domain_id")
+    Usage:
+        manager = client.plugin_manager("domains")
+        domains = await manager.list()
+        domain = await manager.get("domain_id")
     """
 
-    def __init__(self, client: "NotionClient") -> None:
+    __slots__ = ("_name_index",)
+
+    _DB_NAME = "domains"
+
+    def __init__(self, client: NotionClient) -> None:
         """Initialize domain manager.
 
         Args:
             client: NotionClient instance
         """
-        self._client = client
+        super().__init__(client)
+        self._name_index: dict[str, str] | None = None
+
+    async def _iter_batches(self) -> AsyncIterator[list[Domain]]:
+        """Yield domains one response page at a time."""
+        database_id = self._db_id
+        if not database_id:
+            return
+
+        async for batch in _query_batches(self._client, database_id, Domain):
+            yield batch
+
+    async def iter_all(self) -> AsyncIterator[Domain]:
+        """
+        Iterate over all domains, fetching further pages as needed.
+
+        Yields:
+            Domain instances
+        """
+        async for batch in self._iter_batches():
+            for domain in batch:
+                yield domain
 
     async def list(self) -> list:
         """
@@ -39,32 +270,30 @@ class DomainManager:
         Returns:
             List of Domain instances
         """
-        from better_notion.plugins.official.personal_sdk.models import Domain
-
-        database_id = self._get_database_id("domains")
-        if not database_id:
-            return []
-
-        response = await self._client._api.databases.query(database_id=database_id)
-
-        return [
-            Domain(self._client, page_data)
-            for page_data in response.get("results", [])
-        ]
+        domains = await _coalesce(
+            self._inflight, (), lambda: _collect(self._iter_batches())
+        )
+        self._name_index = {domain.name: domain.id for domain in domains}
+        return domains
 
     async def get(self, domain_id: str) -> Any:
         """
         Get a domain by ID.
 
+        Recently fetched or created domains are served from a short-lived
+        cache.
+
         Args:
             domain_id: Domain page ID
 
         Returns:
             Domain instance
         """
-        from better_notion.plugins.official.personal_sdk.models import Domain
-
-        return await Domain.get(domain_id, client=self._client)
+        domain = self._get_cache.get(domain_id)
+        if domain is None:
+            domain = await Domain.get(domain_id, client=self._client)
+            self._get_cache.put(domain_id, domain)
+        return domain
 
     async def create(
         self,
@@ -83,54 +312,82 @@ class DomainManager:
         Returns:
             Created Domain instance
         """
-        from better_notion.plugins.official.personal_sdk.models import Domain
-
-        database_id = self._get_database_id("domains")
+        database_id = self._db_id
         if not database_id:
             raise ValueError("Domains database ID not found in workspace config")
 
-        return await Domain.create(
+        domain = await Domain.create(
             client=self._client,
             database_id=database_id,
             name=name,
             description=description,
             color=color,
         )
+        if self._name_index is not None:
+            self._name_index[domain.name] = domain.id
+        self._get_cache.put(domain.id, domain)
+        return domain
+
+    async def find_id_by_name(self, name: str) -> str | None:
+        """
+        Resolve a domain name to its page ID.
+
+        The name index is built by the first unfiltered list() call and kept
+        up to date by create(), so repeated lookups skip the network.
+
+        Args:
+            name: Domain name
+
+        Returns:
+            Domain page ID, or None if no domain has that name
+        """
+        if self._name_index is None:
+            await self.list()
+        return (self._name_index or {}).get(name)
+
+    async def find_by_name(self, name: str) -> Any | None:
+        """Find a domain by name.
+
+        The name is matched by Notion, so at most one page is transferred.
+        """
+        database_id = self._db_id
+        if not database_id:
+            return None
+
+        response = await self._client._api.databases.query(
+            database_id=database_id,
+            filter=_title_filter(name),
+            page_size=1,
+        )
 
-    def _get_database_id(self, name: str) -> str | None:
-        """Get database ID from workspace config."""
-        return getattr(self._client, "_personal_workspace_config", {}).get("database_ids", {}).get(name)
+        results = response.get("results", [])
+        return Domain(self._client, results[0]) if results else None
 
 
-class TagManager:
+class TagManager(_BaseManager):
     """
     Manager for Tag entities.
 
-    Example:
-        >>> manager = client.plugin_manager("tags")
-        >>> tags = await manager.list()
-        >>> tag = await manager.get("tag_id")
+    Usage:
+        manager = client.plugin_manager("tags")
+        tags = await manager.list()
+        tag = await manager.get("tag_id")
     """
 
-    def __init__(self, client: "NotionClient") -> None:
-        """Initialize tag manager."""
-        self._client = client
+    __slots__ = ("_name_index",)
 
-    async def list(self, category: str | None = None) -> list:
-        """
-        List all tags, optionally filtered by category.
+    _DB_NAME = "tags"
 
-        Args:
-            category: Filter by category (optional)
-
-        Returns:
-            List of Tag instances
-        """
-        from better_notion.plugins.official.personal_sdk.models import Tag
+    def __init__(self, client: NotionClient) -> None:
+        """Initialize tag manager."""
+        super().__init__(client)
+        self._name_index: dict[str, str] | None = None
 
-        database_id = self._get_database_id("tags")
+    async def _iter_batches(self, category: str | None = None) -> AsyncIterator[list[Tag]]:
+        """Yield tags one response page at a time."""
+        database_id = self._db_id
         if not database_id:
-            return []
+            return
 
         # Build filter if category provided
         filter_dict = None
@@ -140,21 +397,49 @@ class TagManager:
                 "select": {"equals": category},
             }
 
-        response = await self._client._api.databases.query(
-            database_id=database_id,
-            filter=filter_dict,
-        )
+        async for batch in _query_batches(
+            self._client, database_id, Tag, filter=filter_dict
+        ):
+            yield batch
 
-        return [
-            Tag(self._client, page_data)
-            for page_data in response.get("results", [])
-        ]
+    async def iter_all(self, category: str | None = None) -> AsyncIterator[Tag]:
+        """
+        Iterate over tags, fetching further pages as needed.
+
+        Args:
+            category: Filter by category (optional)
+
+        Yields:
+            Tag instances
+        """
+        async for batch in self._iter_batches(category):
+            for tag in batch:
+                yield tag
+
+    async def list(self, category: str | None = None) -> list:
+        """
+        List all tags, optionally filtered by category.
+
+        Args:
+            category: Filter by category (optional)
+
+        Returns:
+            List of Tag instances
+        """
+        tags = await _coalesce(
+            self._inflight, (category,), lambda: _collect(self._iter_batches(category))
+        )
+        if not category:
+            self._name_index = {tag.name: tag.id for tag in tags}
+        return tags
 
     async def get(self, tag_id: str) -> Any:
         """Get a tag by ID."""
-        from better_notion.plugins.official.personal_sdk.models import Tag
-
-        return await Tag.get(tag_id, client=self._client)
+        tag = self._get_cache.get(tag_id)
+        if tag is None:
+            tag = await Tag.get(tag_id, client=self._client)
+            self._get_cache.put(tag_id, tag)
+        return tag
 
     async def create(
         self,
@@ -164,13 +449,11 @@ class TagManager:
         description: str = "",
     ) -> Any:
         """Create a new tag."""
-        from better_notion.plugins.official.personal_sdk.models import Tag
-
-        database_id = self._get_database_id("tags")
+        database_id = self._db_id
         if not database_id:
             raise ValueError("Tags database ID not found in workspace config")
 
-        return await Tag.create(
+        tag = await Tag.create(
             client=self._client,
             database_id=database_id,
             name=name,
@@ -178,49 +461,71 @@ class TagManager:
             category=category,
             description=description,
         )
+        if self._name_index is not None:
+            self._name_index[tag.name] = tag.id
+        self._get_cache.put(tag.id, tag)
+        return tag
+
+    async def find_id_by_name(self, name: str) -> str | None:
+        """
+        Resolve a tag name to its page ID.
+
+        The name index is built by the first unfiltered list() call and kept
+        up to date by create(), so repeated lookups skip the network.
+
+        Args:
+            name: Tag name
+
+        Returns:
+            Tag page ID, or None if no tag has that name
+        """
+        if self._name_index is None:
+            await self.list()
+        return (self._name_index or {}).get(name)
 
     async def find_by_name(self, name: str) -> Any | None:
-        """Find a tag by name."""
-        tags = await self.list()
-        for tag in tags:
-            if tag.name == name:
-                return tag
-        return None
+        """Find a tag by name.
 
-    def _get_database_id(self, name: str) -> str | None:
-        """Get database ID from workspace config."""
-        return getattr(self._client, "_personal_workspace_config", {}).get("database_ids", {}).get(name)
+        The name is matched by Notion, so at most one page is transferred.
+        """
+        database_id = self._db_id
+        if not database_id:
+            return None
 
+        response = await self._client._api.databases.query(
+            database_id=database_id,
+            filter=_title_filter(name),
+            page_size=1,
+        )
 
-class ProjectManager:
+        results = response.get("results", [])
+        return Tag(self._client, results[0]) if results else None
+
+
+class ProjectManager(_BaseManager):
     """
     Manager for Project entities.
 
-    Example:
-        >>> manager = client.plugin_manager("projects")
-        >>> projects = await manager.list()
-        >>> project = await manager.get("project_id")
+    Usage:
+        manager = client.plugin_manager("projects")
+        projects = await manager.list()
+        project = await manager.get("project_id")
     """
 
-    def __init__(self, client: "NotionClient") -> None:
-        """Initialize project manager."""
-        self._client = client
+    __slots__ = ("_name_index",)
 
-    async def list(self, domain_id: str | None = None) -> list:
-        """
-        List all projects, optionally filtered by domain.
-
-        Args:
-            domain_id: Filter by domain ID (optional)
+    _DB_NAME = "projects"
 
-        Returns:
-            List of Project instances
-        """
-        from better_notion.plugins.official.personal_sdk.models import Project
+    def __init__(self, client: NotionClient) -> None:
+        """Initialize project manager."""
+        super().__init__(client)
+        self._name_index: dict[str, str] | None = None
 
-        database_id = self._get_database_id("projects")
+    async def _iter_batches(self, domain_id: str | None = None) -> AsyncIterator[list[Project]]:
+        """Yield projects one response page at a time."""
+        database_id = self._db_id
         if not database_id:
-            return []
+            return
 
         # Build filter if domain_id provided
         filter_dict = None
@@ -230,21 +535,49 @@ class ProjectManager:
                 "relation": {"contains": domain_id},
             }
 
-        response = await self._client._api.databases.query(
-            database_id=database_id,
-            filter=filter_dict,
-        )
+        async for batch in _query_batches(
+            self._client, database_id, Project, filter=filter_dict
+        ):
+            yield batch
 
-        return [
-            Project(self._client, page_data)
-            for page_data in response.get("results", [])
-        ]
+    async def iter_all(self, domain_id: str | None = None) -> AsyncIterator[Project]:
+        """
+        Iterate over projects, fetching further pages as needed.
+
+        Args:
+            domain_id: Filter by domain ID (optional)
+
+        Yields:
+            Project instances
+        """
+        async for batch in self._iter_batches(domain_id):
+            for project in batch:
+                yield project
+
+    async def list(self, domain_id: str | None = None) -> list:
+        """
+        List all projects, optionally filtered by domain.
+
+        Args:
+            domain_id: Filter by domain ID (optional)
+
+        Returns:
+            List of Project instances
+        """
+        projects = await _coalesce(
+            self._inflight, (domain_id,), lambda: _collect(self._iter_batches(domain_id))
+        )
+        if not domain_id:
+            self._name_index = {project.name: project.id for project in projects}
+        return projects
 
     async def get(self, project_id: str) -> Any:
         """Get a project by ID."""
-        from better_notion.plugins.official.personal_sdk.models import Project
-
-        return await Project.get(project_id, client=self._client)
+        project = self._get_cache.get(project_id)
+        if project is None:
+            project = await Project.get(project_id, client=self._client)
+            self._get_cache.put(project_id, project)
+        return project
 
     async def create(
         self,
@@ -258,13 +591,11 @@ class ProjectManager:
         notes: str = "",
     ) -> Any:
         """Create a new project."""
-        from better_notion.plugins.official.personal_sdk.models import Project
-
-        database_id = self._get_database_id("projects")
+        database_id = self._db_id
         if not database_id:
             raise ValueError("Projects database ID not found in workspace config")
 
-        return await Project.create(
+        project = await Project.create(
             client=self._client,
             database_id=database_id,
             name=name,
@@ -276,25 +607,130 @@ class ProjectManager:
             goal=goal,
             notes=notes,
         )
+        if self._name_index is not None:
+            self._name_index[project.name] = project.id
+        self._get_cache.put(project.id, project)
+        return project
+
+    async def find_id_by_name(self, name: str) -> str | None:
+        """
+        Resolve a project name to its page ID.
+
+        The name index is built by the first unfiltered list() call and kept
+        up to date by create(), so repeated lookups skip the network.
+
+        Args:
+            name: Project name
+
+        Returns:
+            Project page ID, or None if no project has that name
+        """
+        if self._name_index is None:
+            await self.list()
+        return (self._name_index or {}).get(name)
+
+    async def find_by_name(self, name: str) -> Any | None:
+        """Find a project by name.
+
+        The name is matched by Notion, so at most one page is transferred.
+        """
+        database_id = self._db_id
+        if not database_id:
+            return None
+
+        response = await self._client._api.databases.query(
+            database_id=database_id,
+            filter=_title_filter(name),
+            page_size=1,
+        )
 
-    def _get_database_id(self, name: str) -> str | None:
-        """Get database ID from workspace config."""
-        return getattr(self._client, "_personal_workspace_config", {}).get("database_ids", {}).get(name)
+        results = response.get("results", [])
+        return Project(self._client, results[0]) if results else None
 
 
-class TaskManager:
+class TaskManager(_BaseManager):
     """
     Manager for Task entities.
 
-    Example:
-        >>> manager = client.plugin_manager("tasks")
-        >>> tasks = await manager.list()
-        >>> task = await manager.get("task_id")
+    Usage:
+        manager = client.plugin_manager("tasks")
+        tasks = await manager.list()
+        task = await manager.get("task_id")
     """
 
-    def __init__(self, client: "NotionClient") -> None:
-        """Initialize task manager."""
-        self._client = client
+    __slots__ = ()
+
+    _DB_NAME = "tasks"
+
+    # (property, property type, operator) for each list() filter argument
+    _FILTER_SPEC = (
+        ("Status", "select", "equals"),
+        ("Domain", "relation", "contains"),
+        ("Project", "relation", "contains"),
+        ("Parent Task", "relation", "contains"),
+        ("Tags", "relation", "contains"),
+    )
+
+    async def _iter_batches(
+        self,
+        status: str | None = None,
+        domain_id: str | None = None,
+        project_id: str | None = None,
+        parent_task_id: str | None = None,
+        tag_ids: list[str] | None = None,
+    ) -> AsyncIterator[list[Task]]:
+        """Yield tasks one response page at a time."""
+        database_id = self._db_id
+        if not database_id:
+            return
+
+        # Build filters; Notion only supports one tag in a "contains" filter
+        values = (
+            status,
+            domain_id,
+            project_id,
+            parent_task_id,
+            tag_ids[0] if tag_ids else None,
+        )
+        active = _active_filter_spec(self._FILTER_SPEC, tuple(map(bool, values)))
+        filters = [
+            _filter_clause(prop, prop_type, operator, values[index])
+            for index, prop, prop_type, operator in active
+        ]
+
+        filter_dict = {"and": filters} if len(filters) > 1 else (filters[0] if filters else None)
+
+        async for batch in _query_batches(
+            self._client, database_id, Task, filter=filter_dict
+        ):
+            yield batch
+
+    async def iter_all(
+        self,
+        status: str | None = None,
+        domain_id: str | None = None,
+        project_id: str | None = None,
+        parent_task_id: str | None = None,
+        tag_ids: list[str] | None = None,
+    ) -> AsyncIterator[Task]:
+        """
+        Iterate over tasks with optional filters, fetching further pages as needed.
+
+        Args:
+            status: Filter by status (optional)
+            domain_id: Filter by domain ID (optional)
+            project_id: Filter by project ID (optional)
+            parent_task_id: Filter by parent task ID (optional)
+            tag_ids: Filter by tag IDs (optional)
+
+        Yields:
+            Task instances
+        """
+        async for batch in self._iter_batches(
+            status, domain_id, project_id, parent_task_id, tag_ids
+        ):
+            for task in batch:
+                yield task
 
     async def list(
         self,
@@ -317,57 +753,28 @@ class TaskManager:
         Returns:
             List of Task instances
         """
-        from better_notion.plugins.official.personal_sdk.models import Task
-
-        database_id = self._get_database_id("tasks")
-        if not database_id:
-            return []
-
-        # Build filters
-        filters = []
-        if status:
-            filters.append({
-                "property": "Status",
-                "select": {"equals": status},
-            })
-        if domain_id:
-            filters.append({
-                "property": "Domain",
-                "relation": {"contains": domain_id},
-            })
-        if project_id:
-            filters.append({
-                "property": "Project",
-                "relation": {"contains": project_id},
-            })
-        if parent_task_id:
-            filters.append({
-                "property": "Parent Task",
-                "relation": {"contains": parent_task_id},
-            })
-        if tag_ids:
-            filters.append({
-                "property": "Tags",
-                "relation": {"contains": tag_ids[0]},  # Notion API limitation
-            })
-
-        filter_dict = {"and": filters} if len(filters) > 1 else (filters[0] if filters else None)
-
-        response = await self._client._api.databases.query(
-            database_id=database_id,
-            filter=filter_dict,
+        key = (
+            status,
+            domain_id,
+            project_id,
+            parent_task_id,
+            tuple(tag_ids) if tag_ids else None,
+        )
+        return await _coalesce(
+            self._inflight,
+            key,
+            lambda: _collect(
+                self._iter_batches(status, domain_id, project_id, parent_task_id, tag_ids)
+            ),
         )
-
-        return [
-            Task(self._client, page_data)
-            for page_data in response.get("results", [])
-        ]
 
     async def get(self, task_id: str) -> Any:
         """Get a task by ID."""
-        from better_notion.plugins.official.personal_sdk.models import Task
-
-        return await Task.get(task_id, client=self._client)
+        task = self._get_cache.get(task_id)
+        if task is None:
+            task = await Task.get(task_id, client=self._client)
+            self._get_cache.put(task_id, task)
+        return task
 
     async def create(
         self,
@@ -378,19 +785,17 @@ class TaskManager:
         domain_id: str | None = None,
         project_id: str | None = None,
         parent_task_id: str | None = None,
-        tag_ids: list[str] | None = None,
+        tag_ids: builtins.list[str] | None = None,
         estimated_time: int | None = None,
         energy_required: str | None = None,
         context: str = "",
     ) -> Any:
         """Create a new task."""
-        from better_notion.plugins.official.personal_sdk.models import Task
-
-        database_id = self._get_database_id("tasks")
+        database_id = self._db_id
         if not database_id:
             raise ValueError("Tasks database ID not found in workspace config")
 
-        return await Task.create(
+        task = await Task.create(
             client=self._client,
             database_id=database_id,
             title=title,
@@ -405,41 +810,106 @@ class TaskManager:
             energy_required=energy_required,
             context=context,
         )
+        self._get_cache.put(task.id, task)
+        return task
 
-    def _get_database_id(self, name: str) -> str | None:
-        """Get database ID from workspace config."""
-        return getattr(self._client, "_personal_workspace_config", {}).get("database_ids", {}).get(name)
+    async def create_many(
+        self,
+        specs: builtins.list[dict[str, Any]],
+        max_concurrency: int = 5,
+    ) -> builtins.list[Any]:
+        """
+        Create several tasks concurrently.
 
+        Args:
+            specs: Keyword arguments for create(), one dict per task
+            max_concurrency: Maximum number of create requests in flight
 
-class RoutineManager:
-    """
-    Manager for Routine entities.
+        Returns:
+            Created Task instances, in the order of ``specs``
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-    Example:
-        >>> manager = client.plugin_manager("routines")
-        >>> routines = await manager.list()
-        >>> routine = await manager.get("routine_id")
-    """
+        async def create_one(spec: dict[str, Any]) -> Any:
+            async with semaphore:
+                return await self.create(**spec)
 
-    def __init__(self, client: "NotionClient") -> None:
-        """Initialize routine manager."""
-        self._client = client
+        return await asyncio.gather(*(create_one(spec) for spec in specs))
 
-    async def list(self, domain_id: str | None = None) -> list:
+    async def create_with_names(
+        self,
+        title: str,
+        domain_name: str | None = None,
+        project_name: str | None = None,
+        tag_names: builtins.list[str] | None = None,
+        **kwargs: Any,
+    ) -> Any:
         """
-        List all routines, optionally filtered by domain.
+        Create a new task, resolving related entities by name.
+
+        The domain, project, and tag lookups are independent, so they are
+        issued concurrently before the task is created.
 
         Args:
-            domain_id: Filter by domain ID (optional)
+            title: Task title
+            domain_name: Name of the domain to link (optional)
+            project_name: Name of the project to link (optional)
+            tag_names: Names of the tags to link (optional)
+            **kwargs: Additional arguments passed to create()
 
         Returns:
-            List of Routine instances
+            Created Task instance
+
+        Raises:
+            ValueError: If a named domain, project, or tag does not exist
         """
-        from better_notion.plugins.official.personal_sdk.models import Routine
+        domain, project, tags = await asyncio.gather(
+            _find_by_name(_manager(self._client, "domains"), domain_name),
+            _find_by_name(_manager(self._client, "projects"), project_name),
+            _manager(self._client, "tags").list() if tag_names else _none(),
+        )
 
-        database_id = self._get_database_id("routines")
+        if domain_name and domain is None:
+            raise ValueError(f"Domain '{domain_name}' not found")
+        if project_name and project is None:
+            raise ValueError(f"Project '{project_name}' not found")
+
+        tag_ids = None
+        if tag_names:
+            ids_by_name = {tag.name: tag.id for tag in tags}
+            missing = [name for name in tag_names if name not in ids_by_name]
+            if missing:
+                raise ValueError(f"Tags not found: {', '.join(missing)}")
+            tag_ids = [ids_by_name[name] for name in tag_names]
+
+        return await self.create(
+            title,
+            domain_id=domain.id if domain else None,
+            project_id=project.id if project else None,
+            tag_ids=tag_ids,
+            **kwargs,
+        )
+
+
+class RoutineManager(_BaseManager):
+    """
+    Manager for Routine entities.
+
+    Usage:
+        manager = client.plugin_manager("routines")
+        routines = await manager.list()
+        routine = await manager.get("routine_id")
+    """
+
+    __slots__ = ()
+
+    _DB_NAME = "routines"
+
+    async def _iter_batches(self, domain_id: str | None = None) -> AsyncIterator[list[Routine]]:
+        """Yield routines one response page at a time."""
+        database_id = self._db_id
         if not database_id:
-            return []
+            return
 
         filter_dict = None
         if domain_id:
@@ -448,21 +918,46 @@ class RoutineManager:
                 "relation": {"contains": domain_id},
             }
 
-        response = await self._client._api.databases.query(
-            database_id=database_id,
-            filter=filter_dict,
-        )
+        async for batch in _query_batches(
+            self._client, database_id, Routine, filter=filter_dict
+        ):
+            yield batch
 
-        return [
-            Routine(self._client, page_data)
-            for page_data in response.get("results", [])
-        ]
+    async def iter_all(self, domain_id: str | None = None) -> AsyncIterator[Routine]:
+        """
+        Iterate over routines, fetching further pages as needed.
+
+        Args:
+            domain_id: Filter by domain ID (optional)
+
+        Yields:
+            Routine instances
+        """
+        async for batch in self._iter_batches(domain_id):
+            for routine in batch:
+                yield routine
+
+    async def list(self, domain_id: str | None = None) -> list:
+        """
+        List all routines, optionally filtered by domain.
+
+        Args:
+            domain_id: Filter by domain ID (optional)
+
+        Returns:
+            List of Routine instances
+        """
+        return await _coalesce(
+            self._inflight, (domain_id,), lambda: _collect(self._iter_batches(domain_id))
+        )
 
     async def get(self, routine_id: str) -> Any:
         """Get a routine by ID."""
-        from better_notion.plugins.official.personal_sdk.models import Routine
-
-        return await Routine.get(routine_id, client=self._client)
+        routine = self._get_cache.get(routine_id)
+        if routine is None:
+            routine = await Routine.get(routine_id, client=self._client)
+            self._get_cache.put(routine_id, routine)
+        return routine
 
     async def create(
         self,
@@ -473,13 +968,11 @@ class RoutineManager:
         estimated_duration: int = 30,
     ) -> Any:
         """Create a new routine."""
-        from better_notion.plugins.official.personal_sdk.models import Routine
-
-        database_id = self._get_database_id("routines")
+        database_id = self._db_id
         if not database_id:
             raise ValueError("Routines database ID not found in workspace config")
 
-        return await Routine.create(
+        routine = await Routine.create(
             client=self._client,
             database_id=database_id,
             name=name,
@@ -488,7 +981,34 @@ class RoutineManager:
             best_time=best_time,
             estimated_duration=estimated_duration,
         )
+        self._get_cache.put(routine.id, routine)
+        return routine
+
+
+# Manager classes keyed by the name they are registered under on the client
+MANAGER_REGISTRY: dict[str, type[_BaseManager]] = {
+    "domains": DomainManager,
+    "tags": TagManager,
+    "projects": ProjectManager,
+    "tasks": TaskManager,
+    "routines": RoutineManager,
+}
+
 
-    def _get_database_id(self, name: str) -> str | None:
-        """Get database ID from workspace config."""
-        return getattr(self._client, "_personal_workspace_config", {}).get("database_ids", {}).get(name)
+def _manager(client: NotionClient, name: str) -> Any:
+    """Get the client's registered manager, or a new one if none is registered.
+
+    Reusing the registered instance shares its caches and name index.
+
+    Args:
+        client: NotionClient instance
+        name: Registry name (e.g. "domains")
+
+    Returns:
+        Manager instance
+    """
+    manager_cls = MANAGER_REGISTRY[name]
+    manager = client.plugin_manager(name)
+    if isinstance(manager, manager_cls):
+        return manager
+    return manager_cls(client)
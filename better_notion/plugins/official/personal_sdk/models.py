@@ -14,16 +14,221 @@ with caching support through the plugin system.
 
 from __future__ import annotations
 
+import asyncio
+import sys
+from collections.abc import AsyncIterator, Iterable
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, AsyncIterator
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict, cast
 
+from better_notion._api.properties import Date, Number, Relation, RichText, Select, Title
 from better_notion._sdk.base.entity import BaseEntity
+from better_notion._sdk.models.block import Block
+from better_notion._sdk.models.database import Database
+from better_notion._sdk.models.page import Page
 
 if TYPE_CHECKING:
+    from better_notion._api.properties.base import Property
     from better_notion._sdk.client import NotionClient
-    from better_notion._sdk.models.block import Block
-    from better_notion._sdk.models.database import Database
-    from better_notion._sdk.models.page import Page
+
+# datetime.fromisoformat is only fast (and handles Notion's "Z" suffix) on 3.11+
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.fromisoformat
+else:
+    try:
+        from ciso8601 import parse_datetime as _parse_iso  # type: ignore[import-not-found]
+    except ImportError:
+        _parse_iso = datetime.fromisoformat
+
+
+# Pages in one query often share dates; datetimes are immutable, so reuse them
+@lru_cache(maxsize=4096)
+def _parse_datetime(value: str) -> datetime:
+    """Parse a Notion date or datetime string.
+
+    Date-only values ("YYYY-MM-DD") are built directly from their digits
+    instead of going through the generic ISO 8601 parser.
+
+    Args:
+        value: ISO 8601 string from a date property's ``start`` or ``end``
+
+    Returns:
+        Parsed datetime (midnight for date-only values)
+    """
+    if len(value) == 10:
+        return datetime(int(value[:4]), int(value[5:7]), int(value[8:10]))
+    return _parse_iso(value)
+
+#: Property types read by _extract_rich_text
+_TEXT_TYPES = frozenset(("rich_text", "text"))
+
+#: Running page fetches keyed by (client id, entity class, page ID)
+_inflight_fetches: dict[tuple[int, type, str], asyncio.Future] = {}
+
+
+class NotionPageData(TypedDict, total=False):
+    """Page object returned by the Notion API for a personal database row."""
+
+    object: str
+    id: str
+    created_time: str
+    last_edited_time: str
+    archived: bool
+    url: str
+    parent: dict[str, Any]
+    properties: dict[str, dict[str, Any]]
+
+
+def _title_text(props: dict[str, Any], key: str) -> str:
+    """Return the first plain-text fragment of a title property.
+
+    Args:
+        props: Page properties from the API response
+        key: Property name to read
+
+    Returns:
+        Title text, or empty string if the property is missing or empty
+    """
+    try:
+        prop = props[key]
+        if prop["type"] == "title":
+            return prop["title"][0].get("plain_text", "")
+    except (KeyError, IndexError, TypeError):
+        pass
+    return ""
+
+
+def _extract_rich_text(props: dict[str, Any], key: str) -> str:
+    """Return the first plain-text fragment of a rich text property.
+
+    Args:
+        props: Page properties from the API response
+        key: Property name to read
+
+    Returns:
+        Plain text content, or empty string if the property is missing
+    """
+    prop = props.get(key)
+    if prop is None or prop.get("type") not in _TEXT_TYPES:
+        return ""
+    text_data = prop.get("rich_text") or prop.get("text") or []
+    if not text_data:
+        return ""
+    return text_data[0].get("plain_text", "") if isinstance(text_data, list) else str(text_data)
+
+
+def _select_name(props: dict[str, Any], key: str, default: str | None = None) -> str | None:
+    """Return the option name of a select property.
+
+    Args:
+        props: Page properties from the API response
+        key: Property name to read
+        default: Value returned when the property is missing or unset
+
+    Returns:
+        Selected option name, or ``default``
+    """
+    try:
+        prop = props[key]
+        if prop["type"] == "select":
+            return prop["select"]["name"]
+    except (KeyError, TypeError):
+        pass
+    return default
+
+
+def _date_start(props: dict[str, Any], key: str) -> datetime | None:
+    """Return the start of a date property as a datetime.
+
+    Args:
+        props: Page properties from the API response
+        key: Property name to read
+
+    Returns:
+        Parsed start date, or None if the property is missing or empty
+    """
+    try:
+        prop = props[key]
+        start = prop["date"]["start"] if prop["type"] == "date" else None
+    except (KeyError, TypeError):
+        return None
+    return _parse_datetime(start) if start else None
+
+
+def _relation_id(props: dict[str, Any], key: str) -> str | None:
+    """Return the first page ID of a relation property.
+
+    Args:
+        props: Page properties from the API response
+        key: Property name to read
+
+    Returns:
+        Related page ID, or None if the relation is missing or empty
+    """
+    try:
+        prop = props[key]
+        if prop["type"] == "relation":
+            return prop["relation"][0].get("id")
+    except (KeyError, IndexError, TypeError):
+        pass
+    return None
+
+
+def _relation_ids(props: dict[str, Any], key: str) -> tuple[str, ...]:
+    """Return every page ID of a relation property.
+
+    Args:
+        props: Page properties from the API response
+        key: Property name to read
+
+    Returns:
+        Related page IDs, empty if the relation is missing
+    """
+    prop = props.get(key)
+    if prop and prop.get("type") == "relation":
+        return tuple(r["id"] for r in prop.get("relation", []) if r.get("id"))
+    return ()
+
+
+def _number(props: dict[str, Any], key: str, default: int | None = None) -> int | None:
+    """Return the value of a number property.
+
+    Args:
+        props: Page properties from the API response
+        key: Property name to read
+        default: Value returned when the property is missing or empty
+
+    Returns:
+        Number value, or ``default``
+    """
+    prop = props.get(key)
+    if prop and prop.get("type") == "number":
+        value = prop.get("number")
+        if value is not None:
+            return value
+    return default
+
+
+def _rollup_count(props: dict[str, Any], key: str) -> int:
+    """Count the non-null numbers in an array rollup property.
+
+    Args:
+        props: Page properties from the API response
+        key: Property name to read
+
+    Returns:
+        Number of non-null numeric items, 0 if the rollup is missing
+    """
+    prop = props.get(key)
+    if prop and prop.get("type") == "rollup":
+        rollup_data = prop.get("rollup", {})
+        if rollup_data.get("type") == "array":
+            count = 0
+            for item in rollup_data.get("array", []):
+                if item.get("number") is not None and item.get("type") == "number":
+                    count += 1
+            return count
+    return 0
 
 
 class DatabasePageEntityMixin:
@@ -33,14 +238,177 @@ class DatabasePageEntityMixin:
     that are pages in databases (like Domain, Tag, Project, etc.).
     """
 
+    __slots__ = ()
+
+    _data: dict[str, Any]
+
+    #: Name of the plugin cache holding instances of the entity
+    _CACHE_NAME: ClassVar[str]
+
+    #: Parsed fields as (attribute, extractor, property name, *extra args)
+    _FIELDS: ClassVar[tuple[tuple[Any, ...], ...]] = ()
+
+    #: _FIELDS entries keyed by attribute name
+    _FIELD_INDEX: ClassVar[dict[str, tuple[Any, ...]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Intern the subclass's property names and index its _FIELDS."""
+        super().__init_subclass__(**kwargs)
+        cls._FIELDS = tuple(
+            (attr, extract, sys.intern(key), *args)
+            for attr, extract, key, *args in cls._FIELDS
+        )
+        cls._FIELD_INDEX = {field[0]: field for field in cls._FIELDS}
+
+    def _properties(self) -> dict[str, dict[str, Any]]:
+        """Return the property map of the raw page data."""
+        page = cast(NotionPageData, self._data)
+        return page.get("properties", {})
+
+    def _parse_properties(self, fields: frozenset[str] | None = None) -> None:
+        """Extract ``_FIELDS`` values from the raw API data once.
+
+        Called on construction and by _invalidate() after ``_data`` changes,
+        so property reads are plain attribute loads.
+
+        Args:
+            fields: Public field names to parse now; the others are parsed
+                on first access. None parses every field.
+        """
+        props = self._properties()
+        for attr, extract, *args in self._FIELDS:
+            if fields is None or attr[1:] in fields:
+                setattr(self, attr, extract(props, *args))
+
+    def __getattr__(self, name: str) -> Any:
+        """Parse a field skipped at construction the first time it is read."""
+        field = type(self)._FIELD_INDEX.get(name)
+        if field is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        attr, extract, *args = field
+        value = extract(self._properties(), *args)
+        setattr(self, attr, value)
+        return value
+
+    def _invalidate(self) -> None:
+        """Re-parse cached property values after ``_data`` has changed."""
+        self._parse_properties()
+
+    @classmethod
+    async def get_many(
+        cls,
+        ids: Iterable[str],
+        *,
+        client: "NotionClient",
+        concurrency: int = 5,
+    ) -> list[Any]:
+        """Get several entities by ID, fetching cache misses concurrently.
+
+        Args:
+            ids: Page IDs to fetch
+            client: NotionClient instance
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            Entities in the same order as ``ids``
+        """
+        ids = list(ids)
+        found: dict[str, Any] = {}
+        cache = client.plugin_cache(cls._CACHE_NAME)
+        if cache is not None:
+            for entity_id in ids:
+                cached = cache.get(entity_id)
+                if cached is not None:
+                    found[entity_id] = cached
+
+        misses = [entity_id for entity_id in dict.fromkeys(ids) if entity_id not in found]
+        if misses:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def _get_one(entity_id: str) -> Any:
+                async with semaphore:
+                    return await cls.get(entity_id, client=client)
+
+            found.update(zip(misses, await asyncio.gather(*map(_get_one, misses)), strict=True))
+
+        return [found[entity_id] for entity_id in ids]
+
+    @classmethod
+    async def query(
+        cls,
+        *,
+        client: "NotionClient",
+        database_id: str,
+        filter: dict[str, Any] | None = None,
+        page_size: int = 100,
+    ) -> list[Any]:
+        """Load every page of a database query as entities.
+
+        Uses one databases.query request per page of up to ``page_size``
+        results instead of one pages.get request per entity. Results are
+        added to the plugin cache.
+
+        Args:
+            client: NotionClient instance
+            database_id: Database to query
+            filter: Optional Notion filter object
+            page_size: Results per request (Notion allows at most 100)
+
+        Returns:
+            Entities in query order
+        """
+        params: dict[str, Any] = {"page_size": page_size}
+        if filter is not None:
+            params["filter"] = filter
+
+        cache = client.plugin_cache(cls._CACHE_NAME)
+        entities: list[Any] = []
+        while True:
+            response = await client._api.databases.query(database_id=database_id, **params)
+            batch = [cls(client, page) for page in response.get("results", ())]
+            if cache is not None:
+                for entity in batch:
+                    cache[entity.id] = entity
+            entities.extend(batch)
+            if not response.get("has_more"):
+                return entities
+            params["start_cursor"] = response["next_cursor"]
+
+    @classmethod
+    async def _fetch(cls, page_id: str, *, client: "NotionClient") -> Any:
+        """Fetch an entity from the API, sharing concurrent requests for it.
+
+        Callers that ask for the same page while a request is already
+        running await that request instead of issuing another one. The
+        shared request is shielded, so cancelling one caller does not cancel
+        it for the others.
+
+        Args:
+            page_id: Page ID to fetch
+            client: NotionClient instance
+
+        Returns:
+            Entity built from the API response
+        """
+        key = (id(client), cls, page_id)
+        task = _inflight_fetches.get(key)
+        if task is None:
+            task = asyncio.ensure_future(cls._build(page_id, client))
+            _inflight_fetches[key] = task
+            task.add_done_callback(lambda _: _inflight_fetches.pop(key, None))
+        return await asyncio.shield(task)
+
+    @classmethod
+    async def _build(cls, page_id: str, client: "NotionClient") -> Any:
+        """Retrieve a page and wrap it in the entity class."""
+        return cls(client, await client._api.pages.get(page_id=page_id))
+
     async def parent(self) -> "Database | Page | None":
         """Get parent object (database for entity pages).
 
         Returns:
             Parent Database or Page or None
         """
-        from better_notion._sdk.models.database import Database
-
         # Get parent from data
         parent_data = self._data.get("parent")
         if not parent_data:
@@ -60,7 +428,6 @@ class DatabasePageEntityMixin:
 
         # Page parent
         if parent_data.get("type") == "page_id":
-            from better_notion._sdk.models.page import Page
             page_id = parent_data.get("page_id")
             parent = await Page.get(page_id, client=self._client)
             self._cache_set("parent", parent)
@@ -68,26 +435,67 @@ class DatabasePageEntityMixin:
 
         return None
 
-    async def children(self) -> AsyncIterator["Block"]:
-        """Iterate over child blocks.
+    async def _children_page(self, offset: str | None = None) -> dict[str, Any]:
+        """Fetch one page of child blocks.
 
-        Yields:
-            Block objects that are direct children
+        Args:
+            offset: Pagination cursor from the previous page
+
+        Returns:
+            Raw API response for the page
         """
-        from better_notion._api.utils.pagination import AsyncPaginatedIterator
-        from better_notion._sdk.models.block import Block
+        return await self._client._api._request(
+            "GET",
+            f"/blocks/{self.id}/children",
+            params={"start_cursor": offset} if offset else None
+        )
 
-        async def _get_blocks(offset: str | None = None) -> dict[str, Any]:
-            return await self._client._api._request(
-                "GET",
-                f"/blocks/{self.id}/children",
-                params={"start_cursor": offset} if offset else None
-            )
+    async def _pump_children(self, queue: asyncio.Queue) -> None:
+        """Fetch child block pages into ``queue`` ahead of the consumer.
 
-        iterator = AsyncPaginatedIterator(_get_blocks, lambda data: data.get("results", []))
+        Puts each page's results, then None when done, or the exception
+        that stopped the fetch.
 
-        async for block_data in iterator:
-            yield Block(self._client, block_data)
+        Args:
+            queue: Bounded queue shared with children()
+        """
+        cursor = None
+        try:
+            while True:
+                data = await self._children_page(cursor)
+                await queue.put(data.get("results", []))
+                if not data.get("has_more"):
+                    break
+                cursor = data.get("next_cursor")
+        except Exception as exc:
+            await queue.put(exc)
+        else:
+            await queue.put(None)
+
+    async def children(self) -> AsyncIterator[Block]:
+        """Iterate over child blocks.
+
+        The next page of blocks is requested while the current one is being
+        consumed. Closing the iterator early cancels and waits for that
+        request.
+
+        Yields:
+            Block objects that are direct children
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        pump = asyncio.ensure_future(self._pump_children(queue))
+        try:
+            while True:
+                page = await queue.get()
+                if page is None:
+                    return
+                if isinstance(page, Exception):
+                    raise page
+                for block_data in page:
+                    yield Block(self._client, block_data)
+        finally:
+            pump.cancel()
+            await asyncio.wait((pump,))
 
 
 class Domain(DatabasePageEntityMixin, BaseEntity):
@@ -108,6 +516,15 @@ class Domain(DatabasePageEntityMixin, BaseEntity):
         >>> print(domain.name)
     """
 
+    __slots__ = ("_name", "_color", "_description")
+
+    _CACHE_NAME: ClassVar[str] = "domains"
+    _FIELDS = (
+        ("_name", _title_text, "Name"),
+        ("_color", _select_name, "Color", "Gray"),
+        ("_description", _extract_rich_text, "Description"),
+    )
+
     def __init__(self, client: "NotionClient", data: dict[str, Any]) -> None:
         """Initialize domain with client and API data.
 
@@ -116,7 +533,7 @@ class Domain(DatabasePageEntityMixin, BaseEntity):
             data: Raw API response data
         """
         super().__init__(client, data)
-        self._domain_cache = client.plugin_cache("domains")
+        self._parse_properties()
 
     # ===== PROPERTIES =====
 
@@ -127,12 +544,7 @@ class Domain(DatabasePageEntityMixin, BaseEntity):
         Returns:
             Domain name as string
         """
-        title_prop = self._data["properties"].get("Name")
-        if title_prop and title_prop.get("type") == "title":
-            title_data = title_prop.get("title", [])
-            if title_data:
-                return title_data[0].get("plain_text", "")
-        return ""
+        return self._name
 
     @property
     def description(self) -> str:
@@ -141,12 +553,7 @@ class Domain(DatabasePageEntityMixin, BaseEntity):
         Returns:
             Description string
         """
-        desc_prop = self._data["properties"].get("Description")
-        if desc_prop and desc_prop.get("type") == "rich_text" or desc_prop.get("type") == "text":
-            text_data = desc_prop.get("rich_text") or desc_prop.get("text", [])
-            if text_data:
-                return text_data[0].get("plain_text", "") if isinstance(text_data, list) else str(text_data)
-        return ""
+        return self._description
 
     @property
     def color(self) -> str:
@@ -155,12 +562,7 @@ class Domain(DatabasePageEntityMixin, BaseEntity):
         Returns:
             Color string (Red, Orange, Yellow, Green, Blue, Purple, Gray)
         """
-        color_prop = self._data["properties"].get("Color")
-        if color_prop and color_prop.get("type") == "select":
-            select_data = color_prop.get("select")
-            if select_data:
-                return select_data.get("name", "Gray")
-        return "Gray"
+        return self._color
 
     # ===== AUTONOMOUS METHODS =====
 
@@ -183,16 +585,17 @@ class Domain(DatabasePageEntityMixin, BaseEntity):
             >>> domain = await Domain.get("domain_123", client=client)
         """
         # Check plugin cache
-        cache = client.plugin_cache("domains")
-        if cache and domain_id in cache:
-            return cache[domain_id]
+        cache = client.plugin_cache(cls._CACHE_NAME)
+        if cache is not None:
+            cached = cache.get(domain_id)
+            if cached is not None:
+                return cached
 
         # Fetch from API
-        data = await client._api.pages.get(page_id=domain_id)
-        domain = cls(client, data)
+        domain = await cls._fetch(domain_id, client=client)
 
         # Cache it
-        if cache:
+        if cache is not None:
             cache[domain_id] = domain
 
         return domain
@@ -232,10 +635,8 @@ class Domain(DatabasePageEntityMixin, BaseEntity):
             ...     color="Blue"
             ... )
         """
-        from better_notion._api.properties import Title, RichText, Select
-
         # Build properties
-        properties: dict[str, Any] = {
+        properties: dict[str, Property] = {
             "Name": Title(content=name),
         }
 
@@ -245,10 +646,7 @@ class Domain(DatabasePageEntityMixin, BaseEntity):
         properties["Color"] = Select(name="Color", value=color)
 
         # Convert Property objects to dicts for API
-        serialized_properties = {
-            key: prop.to_dict() if hasattr(prop, 'to_dict') else prop
-            for key, prop in properties.items()
-        }
+        serialized_properties = {key: prop.to_dict() for key, prop in properties.items()}
 
         # Create page
         data = await client._api.pages.create(
@@ -259,8 +657,8 @@ class Domain(DatabasePageEntityMixin, BaseEntity):
         domain = cls(client, data)
 
         # Cache it
-        cache = client.plugin_cache("domains")
-        if cache:
+        cache = client.plugin_cache(cls._CACHE_NAME)
+        if cache is not None:
             cache[domain.id] = domain
 
         return domain
@@ -285,6 +683,16 @@ class Tag(DatabasePageEntityMixin, BaseEntity):
         >>> print(tag.name)
     """
 
+    __slots__ = ("_name", "_color", "_category", "_description")
+
+    _CACHE_NAME: ClassVar[str] = "tags"
+    _FIELDS = (
+        ("_name", _title_text, "Name"),
+        ("_color", _select_name, "Color", "Gray"),
+        ("_category", _select_name, "Category", "Custom"),
+        ("_description", _extract_rich_text, "Description"),
+    )
+
     def __init__(self, client: "NotionClient", data: dict[str, Any]) -> None:
         """Initialize tag with client and API data.
 
@@ -293,7 +701,7 @@ class Tag(DatabasePageEntityMixin, BaseEntity):
             data: Raw API response data
         """
         super().__init__(client, data)
-        self._tag_cache = client.plugin_cache("tags")
+        self._parse_properties()
 
     # ===== PROPERTIES =====
 
@@ -304,12 +712,7 @@ class Tag(DatabasePageEntityMixin, BaseEntity):
         Returns:
             Tag name as string
         """
-        title_prop = self._data["properties"].get("Name")
-        if title_prop and title_prop.get("type") == "title":
-            title_data = title_prop.get("title", [])
-            if title_data:
-                return title_data[0].get("plain_text", "")
-        return ""
+        return self._name
 
     @property
     def color(self) -> str:
@@ -318,12 +721,7 @@ class Tag(DatabasePageEntityMixin, BaseEntity):
         Returns:
             Color string
         """
-        color_prop = self._data["properties"].get("Color")
-        if color_prop and color_prop.get("type") == "select":
-            select_data = color_prop.get("select")
-            if select_data:
-                return select_data.get("name", "Gray")
-        return "Gray"
+        return self._color
 
     @property
     def category(self) -> str:
@@ -332,12 +730,7 @@ class Tag(DatabasePageEntityMixin, BaseEntity):
         Returns:
             Category string (Context, Energy, Location, Time, Custom)
         """
-        category_prop = self._data["properties"].get("Category")
-        if category_prop and category_prop.get("type") == "select":
-            select_data = category_prop.get("select")
-            if select_data:
-                return select_data.get("name", "Custom")
-        return "Custom"
+        return self._category
 
     @property
     def description(self) -> str:
@@ -346,26 +739,22 @@ class Tag(DatabasePageEntityMixin, BaseEntity):
         Returns:
             Description string
         """
-        desc_prop = self._data["properties"].get("Description")
-        if desc_prop and desc_prop.get("type") == "rich_text" or desc_prop.get("type") == "text":
-            text_data = desc_prop.get("rich_text") or desc_prop.get("text", [])
-            if text_data:
-                return text_data[0].get("plain_text", "") if isinstance(text_data, list) else str(text_data)
-        return ""
+        return self._description
 
     # ===== AUTONOMOUS METHODS =====
 
     @classmethod
     async def get(cls, tag_id: str, *, client: "NotionClient") -> "Tag":
         """Get a tag by ID."""
-        cache = client.plugin_cache("tags")
-        if cache and tag_id in cache:
-            return cache[tag_id]
+        cache = client.plugin_cache(cls._CACHE_NAME)
+        if cache is not None:
+            cached = cache.get(tag_id)
+            if cached is not None:
+                return cached
 
-        data = await client._api.pages.get(page_id=tag_id)
-        tag = cls(client, data)
+        tag = await cls._fetch(tag_id, client=client)
 
-        if cache:
+        if cache is not None:
             cache[tag_id] = tag
 
         return tag
@@ -382,9 +771,7 @@ class Tag(DatabasePageEntityMixin, BaseEntity):
         description: str = "",
     ) -> "Tag":
         """Create a new tag."""
-        from better_notion._api.properties import Title, RichText, Select
-
-        properties: dict[str, Any] = {
+        properties: dict[str, Property] = {
             "Name": Title(content=name),
             "Color": Select(name="Color", value=color),
             "Category": Select(name="Category", value=category),
@@ -393,10 +780,7 @@ class Tag(DatabasePageEntityMixin, BaseEntity):
         if description:
             properties["Description"] = RichText(name="Description", content=description)
 
-        serialized_properties = {
-            key: prop.to_dict() if hasattr(prop, 'to_dict') else prop
-            for key, prop in properties.items()
-        }
+        serialized_properties = {key: prop.to_dict() for key, prop in properties.items()}
 
         data = await client._api.pages.create(
             parent={"database_id": database_id},
@@ -405,8 +789,8 @@ class Tag(DatabasePageEntityMixin, BaseEntity):
 
         tag = cls(client, data)
 
-        cache = client.plugin_cache("tags")
-        if cache:
+        cache = client.plugin_cache(cls._CACHE_NAME)
+        if cache is not None:
             cache[tag.id] = tag
 
         return tag
@@ -435,105 +819,90 @@ class Project(DatabasePageEntityMixin, BaseEntity):
         >>> print(project.name, project.status)
     """
 
+    __slots__ = (
+        "_name",
+        "_status",
+        "_domain_id",
+        "_deadline",
+        "_priority",
+        "_progress",
+        "_goal",
+        "_notes",
+    )
+
+    _CACHE_NAME: ClassVar[str] = "projects"
+    _FIELDS = (
+        ("_name", _title_text, "Name"),
+        ("_status", _select_name, "Status", "Active"),
+        ("_domain_id", _relation_id, "Domain"),
+        ("_deadline", _date_start, "Deadline"),
+        ("_priority", _select_name, "Priority", "Medium"),
+        ("_progress", _number, "Progress", 0),
+        ("_goal", _extract_rich_text, "Goal"),
+        ("_notes", _extract_rich_text, "Notes"),
+    )
+
     def __init__(self, client: "NotionClient", data: dict[str, Any]) -> None:
         """Initialize project with client and API data."""
         super().__init__(client, data)
-        self._project_cache = client.plugin_cache("projects")
+        self._parse_properties()
 
     # ===== PROPERTIES =====
 
     @property
     def name(self) -> str:
         """Get project name from title property."""
-        title_prop = self._data["properties"].get("Name")
-        if title_prop and title_prop.get("type") == "title":
-            title_data = title_prop.get("title", [])
-            if title_data:
-                return title_data[0].get("plain_text", "")
-        return ""
+        return self._name
 
     @property
     def status(self) -> str:
         """Get project status."""
-        status_prop = self._data["properties"].get("Status")
-        if status_prop and status_prop.get("type") == "select":
-            select_data = status_prop.get("select")
-            if select_data:
-                return select_data.get("name", "Active")
-        return "Active"
+        return self._status
 
     @property
     def domain_id(self) -> str | None:
         """Get related domain ID."""
-        domain_prop = self._data["properties"].get("Domain")
-        if domain_prop and domain_prop.get("type") == "relation":
-            relation_data = domain_prop.get("relation", [])
-            if relation_data:
-                return relation_data[0].get("id")
-        return None
+        return self._domain_id
 
     @property
     def deadline(self) -> datetime | None:
         """Get project deadline."""
-        deadline_prop = self._data["properties"].get("Deadline")
-        if deadline_prop and deadline_prop.get("type") == "date":
-            date_data = deadline_prop.get("date")
-            if date_data and date_data.get("start"):
-                from datetime import datetime
-                return datetime.fromisoformat(date_data["start"])
-        return None
+        return self._deadline
 
     @property
     def priority(self) -> str:
         """Get project priority."""
-        priority_prop = self._data["properties"].get("Priority")
-        if priority_prop and priority_prop.get("type") == "select":
-            select_data = priority_prop.get("select")
-            if select_data:
-                return select_data.get("name", "Medium")
-        return "Medium"
+        return self._priority
 
     @property
     def progress(self) -> int:
         """Get project progress percentage."""
-        progress_prop = self._data["properties"].get("Progress")
-        if progress_prop and progress_prop.get("type") == "number":
-            return progress_prop.get("number", 0) or 0
-        return 0
+        return self._progress
 
     @property
     def goal(self) -> str:
         """Get project goal."""
-        goal_prop = self._data["properties"].get("Goal")
-        if goal_prop and goal_prop.get("type") == "rich_text" or goal_prop.get("type") == "text":
-            text_data = goal_prop.get("rich_text") or goal_prop.get("text", [])
-            if text_data:
-                return text_data[0].get("plain_text", "") if isinstance(text_data, list) else str(text_data)
-        return ""
+        return self._goal
 
     @property
     def notes(self) -> str:
         """Get project notes."""
-        notes_prop = self._data["properties"].get("Notes")
-        if notes_prop and notes_prop.get("type") == "rich_text" or notes_prop.get("type") == "text":
-            text_data = notes_prop.get("rich_text") or notes_prop.get("text", [])
-            if text_data:
-                return text_data[0].get("plain_text", "") if isinstance(text_data, list) else str(text_data)
-        return ""
+        return self._notes
 
     # ===== AUTONOMOUS METHODS =====
 
     @classmethod
     async def get(cls, project_id: str, *, client: "NotionClient") -> "Project":
         """Get a project by ID."""
-        cache = client.plugin_cache("projects")
-        if cache and project_id in cache:
-            return cache[project_id]
+        cache = client.plugin_cache(cls._CACHE_NAME)
+        if cache is not None:
+            cached = cache.get(project_id)
+            if cached is not None:
+                return cached
 
-        data = await client._api.pages.get(page_id=project_id)
-        project = cls(client, data)
+        project = await cls._fetch(project_id, client=client)
 
-        if cache:
+        if cache is not None:
             cache[project_id] = project
 
         return project
@@ -554,9 +923,7 @@ class Project(DatabasePageEntityMixin, BaseEntity):
         notes: str = "",
     ) -> "Project":
         """Create a new project."""
-        from better_notion._api.properties import Title, RichText, Select, Number, Date, Relation
-
-        properties: dict[str, Any] = {
+        properties: dict[str, Property] = {
             "Name": Title(content=name),
             "Status": Select(name="Status", value=status),
             "Priority": Select(name="Priority", value=priority),
@@ -575,10 +942,7 @@ class Project(DatabasePageEntityMixin, BaseEntity):
         if notes:
             properties["Notes"] = RichText(name="Notes", content=notes)
 
-        serialized_properties = {
-            key: prop.to_dict() if hasattr(prop, 'to_dict') else prop
-            for key, prop in properties.items()
-        }
+        serialized_properties = {key: prop.to_dict() for key, prop in properties.items()}
 
         data = await client._api.pages.create(
             parent={"database_id": database_id},
@@ -587,8 +951,8 @@ class Project(DatabasePageEntityMixin, BaseEntity):
 
         project = cls(client, data)
 
-        cache = client.plugin_cache("projects")
-        if cache:
+        cache = client.plugin_cache(cls._CACHE_NAME)
+        if cache is not None:
             cache[project.id] = project
 
         return project
@@ -628,175 +992,171 @@ class Task(DatabasePageEntityMixin, BaseEntity):
         >>> print(task.title, task.status)
     """
 
-    def __init__(self, client: "NotionClient", data: dict[str, Any]) -> None:
-        """Initialize task with client and API data."""
+    __slots__ = (
+        "_title",
+        "_status",
+        "_priority",
+        "_due_date",
+        "_domain_id",
+        "_project_id",
+        "_parent_task_id",
+        "_subtasks_count",
+        "_tag_ids",
+        "_estimated_time",
+        "_energy_required",
+        "_created_date",
+        "_completed_date",
+        "_archived_date",
+        "_context",
+    )
+
+    _CACHE_NAME: ClassVar[str] = "tasks"
+    _FIELDS = (
+        ("_title", _title_text, "Title"),
+        ("_status", _select_name, "Status", "Todo"),
+        ("_priority", _select_name, "Priority", "Medium"),
+        ("_due_date", _date_start, "Due Date"),
+        ("_domain_id", _relation_id, "Domain"),
+        ("_project_id", _relation_id, "Project"),
+        ("_parent_task_id", _relation_id, "Parent Task"),
+        ("_subtasks_count", _rollup_count, "Subtasks"),
+        ("_tag_ids", _relation_ids, "Tags"),
+        ("_estimated_time", _number, "Estimated Time"),
+        ("_energy_required", _select_name, "Energy Required"),
+        ("_created_date", _date_start, "Created Date"),
+        ("_completed_date", _date_start, "Completed Date"),
+        ("_archived_date", _date_start, "Archived Date"),
+        ("_context", _extract_rich_text, "Context"),
+    )
+
+    def __init__(
+        self,
+        client: "NotionClient",
+        data: dict[str, Any],
+        *,
+        fields: frozenset[str] | None = None,
+    ) -> None:
+        """Initialize task with client and API data.
+
+        Args:
+            client: NotionClient instance
+            data: Raw API response data
+            fields: Field names to parse up front (e.g. ``{"title", "status"}``);
+                the rest are parsed when first read. None parses all fields.
+        """
         super().__init__(client, data)
-        self._task_cache = client.plugin_cache("tasks")
+        self._parse_properties(fields)
 
     # ===== PROPERTIES =====
 
     @property
     def title(self) -> str:
         """Get task title from title property."""
-        title_prop = self._data["properties"].get("Title")
-        if title_prop and title_prop.get("type") == "title":
-            title_data = title_prop.get("title", [])
-            if title_data:
-                return title_data[0].get("plain_text", "")
-        return ""
+        return self._title
 
     @property
     def status(self) -> str:
         """Get task status."""
-        status_prop = self._data["properties"].get("Status")
-        if status_prop and status_prop.get("type") == "select":
-            select_data = status_prop.get("select")
-            if select_data:
-                return select_data.get("name", "Todo")
-        return "Todo"
+        return self._status
 
     @property
     def priority(self) -> str:
         """Get task priority."""
-        priority_prop = self._data["properties"].get("Priority")
-        if priority_prop and priority_prop.get("type") == "select":
-            select_data = priority_prop.get("select")
-            if select_data:
-                return select_data.get("name", "Medium")
-        return "Medium"
+        return self._priority
 
     @property
     def due_date(self) -> datetime | None:
         """Get task due date."""
-        due_date_prop = self._data["properties"].get("Due Date")
-        if due_date_prop and due_date_prop.get("type") == "date":
-            date_data = due_date_prop.get("date")
-            if date_data and date_data.get("start"):
-                return datetime.fromisoformat(date_data["start"])
-        return None
+        return self._due_date
 
     @property
     def domain_id(self) -> str | None:
         """Get related domain ID."""
-        domain_prop = self._data["properties"].get("Domain")
-        if domain_prop and domain_prop.get("type") == "relation":
-            relation_data = domain_prop.get("relation", [])
-            if relation_data:
-                return relation_data[0].get("id")
-        return None
+        return self._domain_id
 
     @property
     def project_id(self) -> str | None:
         """Get related project ID."""
-        project_prop = self._data["properties"].get("Project")
-        if project_prop and project_prop.get("type") == "relation":
-            relation_data = project_prop.get("relation", [])
-            if relation_data:
-                return relation_data[0].get("id")
-        return None
+        return self._project_id
 
     @property
     def parent_task_id(self) -> str | None:
         """Get parent task ID."""
-        parent_prop = self._data["properties"].get("Parent Task")
-        if parent_prop and parent_prop.get("type") == "relation":
-            relation_data = parent_prop.get("relation", [])
-            if relation_data:
-                return relation_data[0].get("id")
-        return None
+        return self._parent_task_id
 
     @property
     def subtasks_count(self) -> int:
         """Get number of subtasks."""
-        subtasks_prop = self._data["properties"].get("Subtasks")
-        if subtasks_prop and subtasks_prop.get("type") == "rollup":
-            rollup_data = subtasks_prop.get("rollup", {})
-            if rollup_data.get("type") == "array":
-                array_data = rollup_data.get("array", [])
-                # Count non-null numbers
-                return sum(1 for item in array_data if item.get("type") == "number" and item.get("number") is not None)
-        return 0
+        return self._subtasks_count
 
     @property
-    def tag_ids(self) -> list[str]:
+    def tag_ids(self) -> tuple[str, ...]:
         """Get associated tag IDs."""
-        tags_prop = self._data["properties"].get("Tags")
-        if tags_prop and tags_prop.get("type") == "relation":
-            relation_data = tags_prop.get("relation", [])
-            return [r.get("id") for r in relation_data if r.get("id")]
-        return []
+        return self._tag_ids
 
     @property
     def estimated_time(self) -> int | None:
         """Get estimated time in minutes."""
-        time_prop = self._data["properties"].get("Estimated Time")
-        if time_prop and time_prop.get("type") == "number":
-            return time_prop.get("number")
-        return None
+        return self._estimated_time
 
     @property
     def energy_required(self) -> str | None:
         """Get required energy level."""
-        energy_prop = self._data["properties"].get("Energy Required")
-        if energy_prop and energy_prop.get("type") == "select":
-            select_data = energy_prop.get("select")
-            if select_data:
-                return select_data.get("name")
-        return None
+        return self._energy_required
 
     @property
     def context(self) -> str:
         """Get additional context."""
-        context_prop = self._data["properties"].get("Context")
-        if context_prop and context_prop.get("type") == "rich_text" or context_prop.get("type") == "text":
-            text_data = context_prop.get("rich_text") or context_prop.get("text", [])
-            if text_data:
-                return text_data[0].get("plain_text", "") if isinstance(text_data, list) else str(text_data)
-        return ""
+        return self._context
 
     @property
     def created_date(self) -> datetime | None:
         """Get task creation date."""
-        created_prop = self._data["properties"].get("Created Date")
-        if created_prop and created_prop.get("type") == "date":
-            date_data = created_prop.get("date")
-            if date_data and date_data.get("start"):
-                return datetime.fromisoformat(date_data["start"])
-        return None
+        return self._created_date
 
     @property
     def completed_date(self) -> datetime | None:
         """Get task completion date."""
-        completed_prop = self._data["properties"].get("Completed Date")
-        if completed_prop and completed_prop.get("type") == "date":
-            date_data = completed_prop.get("date")
-            if date_data and date_data.get("start"):
-                return datetime.fromisoformat(date_data["start"])
-        return None
+        return self._completed_date
 
     @property
     def archived_date(self) -> datetime | None:
         """Get task archival date."""
-        archived_prop = self._data["properties"].get("Archived Date")
-        if archived_prop and archived_prop.get("type") == "date":
-            date_data = archived_prop.get("date")
-            if date_data and date_data.get("start"):
-                return datetime.fromisoformat(date_data["start"])
-        return None
+        return self._archived_date
 
     # ===== AUTONOMOUS METHODS =====
 
     @classmethod
-    async def get(cls, task_id: str, *, client: "NotionClient") -> "Task":
-        """Get a task by ID."""
-        cache = client.plugin_cache("tasks")
-        if cache and task_id in cache:
-            return cache[task_id]
+    async def get(
+        cls,
+        task_id: str,
+        *,
+        client: "NotionClient",
+        fields: frozenset[str] | None = None,
+    ) -> "Task":
+        """Get a task by ID.
 
-        data = await client._api.pages.get(page_id=task_id)
-        task = cls(client, data)
+        Args:
+            task_id: Task page ID
+            client: NotionClient instance
+            fields: Field names to parse up front; others are parsed lazily
 
-        if cache:
+        Returns:
+            Task instance
+        """
+        cache = client.plugin_cache(cls._CACHE_NAME)
+        if cache is not None:
+            cached = cache.get(task_id)
+            if cached is not None:
+                return cached
+
+        if fields is None:
+            task = await cls._fetch(task_id, client=client)
+        else:
+            data = await client._api.pages.get(page_id=task_id)
+            task = cls(client, data, fields=fields)
+
+        if cache is not None:
             cache[task_id] = task
 
         return task
@@ -820,9 +1180,7 @@ class Task(DatabasePageEntityMixin, BaseEntity):
         context: str = "",
     ) -> "Task":
         """Create a new task."""
-        from better_notion._api.properties import Title, Select, Date, Relation, Number, RichText
-
-        properties: dict[str, Any] = {
+        properties: dict[str, Property] = {
             "Title": Title(content=title),
             "Status": Select(name="Status", value=status),
             "Priority": Select(name="Priority", value=priority),
@@ -857,10 +1215,7 @@ class Task(DatabasePageEntityMixin, BaseEntity):
         if context:
             properties["Context"] = RichText(name="Context", content=context)
 
-        serialized_properties = {
-            key: prop.to_dict() if hasattr(prop, 'to_dict') else prop
-            for key, prop in properties.items()
-        }
+        serialized_properties = {key: prop.to_dict() for key, prop in properties.items()}
 
         data = await client._api.pages.create(
             parent={"database_id": database_id},
@@ -869,8 +1224,8 @@ class Task(DatabasePageEntityMixin, BaseEntity):
 
         task = cls(client, data)
 
-        cache = client.plugin_cache("tasks")
-        if cache:
+        cache = client.plugin_cache(cls._CACHE_NAME)
+        if cache is not None:
             cache[task.id] = task
 
         return task
@@ -899,100 +1254,90 @@ class Routine(DatabasePageEntityMixin, BaseEntity):
         >>> print(routine.name, routine.streak)
     """
 
+    __slots__ = (
+        "_name",
+        "_frequency",
+        "_domain_id",
+        "_best_time",
+        "_estimated_duration",
+        "_streak",
+        "_last_completed",
+        "_total_completions",
+    )
+
+    _CACHE_NAME: ClassVar[str] = "routines"
+    _FIELDS = (
+        ("_name", _title_text, "Name"),
+        ("_frequency", _select_name, "Frequency", "Daily"),
+        ("_domain_id", _relation_id, "Domain"),
+        ("_best_time", _extract_rich_text, "Best Time"),
+        ("_estimated_duration", _number, "Estimated Duration"),
+        ("_streak", _number, "Streak", 0),
+        ("_last_completed", _date_start, "Last Completed"),
+        ("_total_completions", _number, "Total Completions", 0),
+    )
+
     def __init__(self, client: "NotionClient", data: dict[str, Any]) -> None:
         """Initialize routine with client and API data."""
         super().__init__(client, data)
-        self._routine_cache = client.plugin_cache("routines")
+        self._parse_properties()
 
     # ===== PROPERTIES =====
 
     @property
     def name(self) -> str:
         """Get routine name from title property."""
-        title_prop = self._data["properties"].get("Name")
-        if title_prop and title_prop.get("type") == "title":
-            title_data = title_prop.get("title", [])
-            if title_data:
-                return title_data[0].get("plain_text", "")
-        return ""
+        return self._name
 
     @property
     def frequency(self) -> str:
         """Get routine frequency."""
-        frequency_prop = self._data["properties"].get("Frequency")
-        if frequency_prop and frequency_prop.get("type") == "select":
-            select_data = frequency_prop.get("select")
-            if select_data:
-                return select_data.get("name", "Daily")
-        return "Daily"
+        return self._frequency
 
     @property
     def domain_id(self) -> str | None:
         """Get related domain ID."""
-        domain_prop = self._data["properties"].get("Domain")
-        if domain_prop and domain_prop.get("type") == "relation":
-            relation_data = domain_prop.get("relation", [])
-            if relation_data:
-                return relation_data[0].get("id")
-        return None
+        return self._domain_id
 
     @property
     def best_time(self) -> str:
         """Get best time for routine."""
-        time_prop = self._data["properties"].get("Best Time")
-        if time_prop and time_prop.get("type") == "rich_text" or time_prop.get("type") == "text":
-            text_data = time_prop.get("rich_text") or time_prop.get("text", [])
-            if text_data:
-                return text_data[0].get("plain_text", "") if isinstance(text_data, list) else str(text_data)
-        return ""
+        return self._best_time
 
     @property
     def estimated_duration(self) -> int | None:
         """Get estimated duration in minutes."""
-        duration_prop = self._data["properties"].get("Estimated Duration")
-        if duration_prop and duration_prop.get("type") == "number":
-            return duration_prop.get("number")
-        return None
+        return self._estimated_duration
 
     @property
     def streak(self) -> int:
         """Get current streak count."""
-        streak_prop = self._data["properties"].get("Streak")
-        if streak_prop and streak_prop.get("type") == "number":
-            return streak_prop.get("number", 0) or 0
-        return 0
+        return self._streak
 
     @property
     def last_completed(self) -> datetime | None:
         """Get last completion date."""
-        last_prop = self._data["properties"].get("Last Completed")
-        if last_prop and last_prop.get("type") == "date":
-            date_data = last_prop.get("date")
-            if date_data and date_data.get("start"):
-                return datetime.fromisoformat(date_data["start"])
-        return None
+        return self._last_completed
 
     @property
     def total_completions(self) -> int:
         """Get total completion count."""
-        total_prop = self._data["properties"].get("Total Completions")
-        if total_prop and total_prop.get("type") == "number":
-            return total_prop.get("number", 0) or 0
-        return 0
+        return self._total_completions
 
     # ===== AUTONOMOUS METHODS =====
 
     @classmethod
     async def get(cls, routine_id: str, *, client: "NotionClient") -> "Routine":
         """Get a routine by ID."""
-        cache = client.plugin_cache("routines")
-        if cache and routine_id in cache:
-            return cache[routine_id]
+        cache = client.plugin_cache(cls._CACHE_NAME)
+        if cache is not None:
+            cached = cache.get(routine_id)
+            if cached is not None:
+                return cached
 
-        data = await client._api.pages.get(page_id=routine_id)
-        routine = cls(client, data)
+        routine = await cls._fetch(routine_id, client=client)
 
-        if cache:
+        if cache is not None:
             cache[routine_id] = routine
 
         return routine
@@ -1010,38 +1355,31 @@ class Routine(DatabasePageEntityMixin, BaseEntity):
         estimated_duration: int = 30,
     ) -> "Routine":
         """Create a new routine."""
-        from better_notion._api.properties import Title, Select, Relation, Number, RichText
-
-        properties: dict[str, Any] = {
-            "Name": Title(content=name),
-            "Frequency": Select(name="Frequency", value=frequency),
-            "Streak": Number(name="Streak", value=0),
-            "Total Completions": Number(name="Total Completions", value=0),
+        properties: dict[str, dict[str, Any]] = {
+            "Name": Title(content=name).to_dict(),
+            "Frequency": Select(name="Frequency", value=frequency).to_dict(),
+            "Streak": Number(name="Streak", value=0).to_dict(),
+            "Total Completions": Number(name="Total Completions", value=0).to_dict(),
         }
 
         if domain_id:
-            properties["Domain"] = Relation("Domain", [domain_id])
+            properties["Domain"] = Relation("Domain", [domain_id]).to_dict()
 
         if best_time:
-            properties["Best Time"] = RichText(name="Best Time", content=best_time)
+            properties["Best Time"] = RichText(name="Best Time", content=best_time).to_dict()
 
         if estimated_duration:
-            properties["Estimated Duration"] = Number(name="Estimated Duration", value=estimated_duration)
-
-        serialized_properties = {
-            key: prop.to_dict() if hasattr(prop, 'to_dict') else prop
-            for key, prop in properties.items()
-        }
+            properties["Estimated Duration"] = Number(name="Estimated Duration", value=estimated_duration).to_dict()
 
         data = await client._api.pages.create(
             parent={"database_id": database_id},
-            properties=serialized_properties,
+            properties=properties,
         )
 
         routine = cls(client, data)
 
-        cache = client.plugin_cache("routines")
-        if cache:
+        cache = client.plugin_cache(cls._CACHE_NAME)
+        if cache is not None:
             cache[routine.id] = routine
 
         return routine
@@ -1070,106 +1408,90 @@ class Agenda(DatabasePageEntityMixin, BaseEntity):
         >>> print(agenda.name, agenda.date_time)
     """
 
+    __slots__ = (
+        "_name",
+        "_start",
+        "_end",
+        "_type",
+        "_linked_task_id",
+        "_linked_project_id",
+        "_location",
+        "_notes",
+    )
+
+    _CACHE_NAME: ClassVar[str] = "agenda"
+    _FIELDS = (
+        ("_name", _title_text, "Name"),
+        ("_start", _date_start, "Start"),
+        ("_end", _date_start, "End"),
+        ("_type", _select_name, "Type", "Event"),
+        ("_linked_task_id", _relation_id, "Linked Task"),
+        ("_linked_project_id", _relation_id, "Linked Project"),
+        ("_location", _extract_rich_text, "Location"),
+        ("_notes", _extract_rich_text, "Notes"),
+    )
+
     def __init__(self, client: "NotionClient", data: dict[str, Any]) -> None:
         """Initialize agenda with client and API data."""
         super().__init__(client, data)
-        self._agenda_cache = client.plugin_cache("agenda")
+        self._parse_properties()
 
     # ===== PROPERTIES =====
 
     @property
     def name(self) -> str:
         """Get agenda name from title property."""
-        title_prop = self._data["properties"].get("Name")
-        if title_prop and title_prop.get("type") == "title":
-            title_data = title_prop.get("title", [])
-            if title_data:
-                return title_data[0].get("plain_text", "")
-        return ""
+        return self._name
 
     @property
     def start(self) -> datetime | None:
         """Get start date and time."""
-        start_prop = self._data["properties"].get("Start")
-        if start_prop and start_prop.get("type") == "date":
-            date_data = start_prop.get("date")
-            if date_data and date_data.get("start"):
-                return datetime.fromisoformat(date_data["start"])
-        return None
+        return self._start
 
     @property
     def end(self) -> datetime | None:
         """Get end date and time."""
-        end_prop = self._data["properties"].get("End")
-        if end_prop and end_prop.get("type") == "date":
-            date_data = end_prop.get("date")
-            if date_data and date_data.get("start"):
-                return datetime.fromisoformat(date_data["start"])
-        return None
+        return self._end
 
     @property
     def type(self) -> str:
         """Get agenda item type."""
-        type_prop = self._data["properties"].get("Type")
-        if type_prop and type_prop.get("type") == "select":
-            select_data = type_prop.get("select")
-            if select_data:
-                return select_data.get("name", "Event")
-        return "Event"
+        return self._type
 
     @property
     def linked_task_id(self) -> str | None:
         """Get linked task ID."""
-        task_prop = self._data["properties"].get("Linked Task")
-        if task_prop and task_prop.get("type") == "relation":
-            relation_data = task_prop.get("relation", [])
-            if relation_data:
-                return relation_data[0].get("id")
-        return None
+        return self._linked_task_id
 
     @property
     def linked_project_id(self) -> str | None:
         """Get linked project ID."""
-        project_prop = self._data["properties"].get("Linked Project")
-        if project_prop and project_prop.get("type") == "relation":
-            relation_data = project_prop.get("relation", [])
-            if relation_data:
-                return relation_data[0].get("id")
-        return None
+        return self._linked_project_id
 
     @property
     def location(self) -> str:
         """Get location."""
-        location_prop = self._data["properties"].get("Location")
-        if location_prop and location_prop.get("type") == "rich_text" or location_prop.get("type") == "text":
-            text_data = location_prop.get("rich_text") or location_prop.get("text", [])
-            if text_data:
-                return text_data[0].get("plain_text", "") if isinstance(text_data, list) else str(text_data)
-        return ""
+        return self._location
 
     @property
     def notes(self) -> str:
         """Get additional notes."""
-        notes_prop = self._data["properties"].get("Notes")
-        if notes_prop and notes_prop.get("type") == "rich_text" or notes_prop.get("type") == "text":
-            text_data = notes_prop.get("rich_text") or notes_prop.get("text", [])
-            if text_data:
-                return text_data[0].get("plain_text", "") if isinstance(text_data, list) else str(text_data)
-        return ""
+        return self._notes
 
     # ===== AUTONOMOUS METHODS =====
 
     @classmethod
     async def get(cls, agenda_id: str, *, client: "NotionClient") -> "Agenda":
         """Get an agenda item by ID."""
-        cache = client.plugin_cache("agenda")
-        if cache and agenda_id in cache:
-            return cache[agenda_id]
+        cache = client.plugin_cache(cls._CACHE_NAME)
+        if cache is not None:
+            cached = cache.get(agenda_id)
+            if cached is not None:
+                return cached
 
-        data = await client._api.pages.get(page_id=agenda_id)
-        agenda = cls(client, data)
+        agenda = await cls._fetch(agenda_id, client=client)
 
-        if cache:
+        if cache is not None:
             cache[agenda.id] = agenda
 
         return agenda
@@ -1190,41 +1512,34 @@ class Agenda(DatabasePageEntityMixin, BaseEntity):
         notes: str = "",
     ) -> "Agenda":
         """Create a new agenda item."""
-        from better_notion._api.properties import Title, Date, Select, Relation, RichText
-
-        properties: dict[str, Any] = {
-            "Name": Title(content=name),
-            "Start": Date(name="Start", value=start),
-            "End": Date(name="End", value=end),
-            "Type": Select(name="Type", value=type_),
+        properties: dict[str, dict[str, Any]] = {
+            "Name": Title(content=name).to_dict(),
+            "Start": Date(name="Start", value=start).to_dict(),
+            "End": Date(name="End", value=end).to_dict(),
+            "Type": Select(name="Type", value=type_).to_dict(),
         }
 
         if linked_task_id:
-            properties["Linked Task"] = Relation("Linked Task", [linked_task_id])
+            properties["Linked Task"] = Relation("Linked Task", [linked_task_id]).to_dict()
 
         if linked_project_id:
-            properties["Linked Project"] = Relation("Linked Project", [linked_project_id])
+            properties["Linked Project"] = Relation("Linked Project", [linked_project_id]).to_dict()
 
         if location:
-            properties["Location"] = RichText(name="Location", content=location)
+            properties["Location"] = RichText(name="Location", content=location).to_dict()
 
         if notes:
-            properties["Notes"] = RichText(name="Notes", content=notes)
-
-        serialized_properties = {
-            key: prop.to_dict() if hasattr(prop, 'to_dict') else prop
-            for key, prop in properties.items()
-        }
+            properties["Notes"] = RichText(name="Notes", content=notes).to_dict()
 
         data = await client._api.pages.create(
             parent={"database_id": database_id},
-            properties=serialized_properties,
+            properties=properties,
         )
 
         agenda = cls(client, data)
 
-        cache = client.plugin_cache("agenda")
-        if cache:
+        cache = client.plugin_cache(cls._CACHE_NAME)
+        if cache is not None:
             cache[agenda.id] = agenda
 
         return agenda
@@ -3,15 +3,65 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 from better_notion._sdk.models.page import Page
 from better_notion._sdk.client import NotionClient
 
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # Optional: faster config reads and writes
+    orjson = None
+
 
 CONFIG_PATH = Path.home() / ".notion" / "personal.json"
 
+# Last parsed config, keyed by (path, mtime_ns, size) of the file it came from
+_config_cache: tuple[tuple[Path, int, int], dict[str, Any]] | None = None
+
+# Config directories already created by save_config in this process
+_config_dirs: set[Path] = set()
+
+# Databases created by the personal workspace initializer
+_EXPECTED_DB_NAMES = frozenset({
+    "Domains",
+    "Tags",
+    "Projects",
+    "Tasks",
+    "Routines",
+    "Agenda",
+})
+
+# Seconds a page's child list is reused between detect_workspace calls
+_CHILDREN_TTL = 30.0
+
+# Child lists keyed by page ID, with the monotonic time they were fetched
+_children_cache: dict[str, tuple[float, list[Any]]] = {}
+
+
+async def _page_children(page: Page) -> list[Any]:
+    """Return a page's children, reusing a recent result for the same page.
+
+    Args:
+        page: Page whose children to list
+
+    Returns:
+        Child objects of the page
+    """
+    now = time.monotonic()
+    cached = _children_cache.get(page.id)
+    if cached is not None and now - cached[0] < _CHILDREN_TTL:
+        return cached[1]
+
+    children = [child async for child in page.children()]
+    _children_cache[page.id] = (now, children)
+    return children
+
 
 class PersonalWorkspaceMetadata:
     """Manages personal workspace metadata."""
@@ -20,24 +70,60 @@ class PersonalWorkspaceMetadata:
     def load_config() -> dict[str, Any]:
         """Load workspace configuration from disk.
 
+        The parsed file is reused until its modification time or size
+        changes, so the returned dictionary is shared and must not be
+        modified.
+
         Returns:
             Configuration dictionary with workspace_id, database_ids, etc.
         """
-        if CONFIG_PATH.exists():
+        global _config_cache
+
+        try:
+            stat = CONFIG_PATH.stat()
+        except FileNotFoundError:
+            return {}
+
+        key = (CONFIG_PATH, stat.st_mtime_ns, stat.st_size)
+        if _config_cache is not None and _config_cache[0] == key:
+            return _config_cache[1]
+
+        if orjson is not None:
+            config = orjson.loads(CONFIG_PATH.read_bytes())
+        else:
             with open(CONFIG_PATH, encoding="utf-8") as f:
-                return json.load(f)
-        return {}
+                config = json.load(f)
+        _config_cache = (key, config)
+        return config
 
     @staticmethod
     def save_config(config: dict[str, Any]) -> None:
         """Save workspace configuration to disk.
 
+        The file is written to a temporary sibling and moved into place, so
+        readers and crashes never see a partially written config.
+
         Args:
             config: Configuration dictionary to save
         """
-        CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        global _config_cache
+
+        _config_cache = None
+        if CONFIG_PATH.parent not in _config_dirs:
+            CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _config_dirs.add(CONFIG_PATH.parent)
+        if orjson is not None:
+            payload = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(config, indent=2).encode("utf-8")
+
+        tmp_path = CONFIG_PATH.with_suffix(".json.tmp")
+        try:
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, CONFIG_PATH)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     @staticmethod
     async def detect_workspace(page: Page, client: NotionClient) -> dict[str, Any] | None:
@@ -58,32 +144,20 @@ class PersonalWorkspaceMetadata:
         if not workspace_id:
             return None
 
-        # Check if databases exist in this page
-        expected_db_names = {
-            "Domains",
-            "Tags",
-            "Projects",
-            "Tasks",
-            "Routines",
-            "Agenda",
-        }
-
         # Get all children databases from the page
         try:
-            children = await page.children()
-            databases = [c for c in children if c.object == "database"]
+            children = await _page_children(page)
+            found_db_names = {c.title for c in children if c.object == "database"}
 
-            if len(databases) < 5:  # Need at least 5 databases to consider it a workspace
+            if len(found_db_names) < 5:  # Need at least 5 databases to consider it a workspace
                 return None
 
-            found_db_names = {db.title for db in databases}
-
             # Check if we have most expected databases
-            matches = sum(1 for name in expected_db_names if name in found_db_names)
+            matches = len(_EXPECTED_DB_NAMES & found_db_names)
 
             if matches >= 5:
                 # Load database IDs from config
-                database_ids = config.get("database_ids", {})
+                database_ids = dict(config.get("database_ids", {}))
 
                 return {
                     "workspace_id": workspace_id,
@@ -2,12 +2,232 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
+import time
 import uuid
+from collections.abc import AsyncGenerator, Sequence
+from contextlib import aclosing
 from datetime import datetime
-from pathlib import Path
+from typing import Any
 
+from better_notion._api.collections import DatabaseCollection
 from better_notion._sdk.client import NotionClient
+from better_notion._sdk.models.database import Database
+from better_notion.utils.personal.metadata import PersonalWorkspaceMetadata
+
+logger = logging.getLogger(__name__)
+
+
+# Select options of the personal database schemas, built once and never mutated
+_COLOR_OPTIONS = (
+    {"name": "Red", "color": "red"},
+    {"name": "Orange", "color": "orange"},
+    {"name": "Yellow", "color": "yellow"},
+    {"name": "Green", "color": "green"},
+    {"name": "Blue", "color": "blue"},
+    {"name": "Purple", "color": "purple"},
+    {"name": "Gray", "color": "gray"},
+)
+
+_PRIORITY_OPTIONS = (
+    {"name": "Critical", "color": "red"},
+    {"name": "High", "color": "orange"},
+    {"name": "Medium", "color": "yellow"},
+    {"name": "Low", "color": "blue"},
+)
+
+_PROJECT_STATUS_OPTIONS = (
+    {"name": "Active", "color": "green"},
+    {"name": "On Hold", "color": "orange"},
+    {"name": "Completed", "color": "blue"},
+    {"name": "Archived", "color": "gray"},
+)
+
+_FREQUENCY_OPTIONS = (
+    {"name": "Daily", "color": "blue"},
+    {"name": "Weekly", "color": "green"},
+    {"name": "Weekdays", "color": "yellow"},
+    {"name": "Weekends", "color": "purple"},
+)
+
+_TASK_STATUS_OPTIONS = (
+    {"name": "Todo", "color": "gray"},
+    {"name": "In Progress", "color": "blue"},
+    {"name": "Done", "color": "green"},
+    {"name": "Cancelled", "color": "red"},
+    {"name": "Archived", "color": "gray"},
+)
+
+_ENERGY_OPTIONS = (
+    {"name": "High", "color": "red"},
+    {"name": "Medium", "color": "yellow"},
+    {"name": "Low", "color": "blue"},
+)
+
+_AGENDA_TYPE_OPTIONS = (
+    {"name": "Event", "color": "blue"},
+    {"name": "Time Block", "color": "green"},
+    {"name": "Reminder", "color": "yellow"},
+)
+
+# Schemas of the databases without relations; treated as read-only
+_DOMAINS_SCHEMA = (
+    {"name": "Name", "type": "title"},
+    {"name": "Description", "type": "rich_text"},
+    {"name": "Color", "type": "select", "select": {"options": _COLOR_OPTIONS}},
+)
+
+_TAGS_SCHEMA = (
+    {"name": "Name", "type": "title"},
+    {"name": "Color", "type": "select", "select": {"options": _COLOR_OPTIONS}},
+    {"name": "Category", "type": "select", "select": {"options": (
+        {"name": "Context"},
+        {"name": "Energy"},
+        {"name": "Location"},
+        {"name": "Time"},
+        {"name": "Custom"},
+    )}},
+    {"name": "Description", "type": "rich_text"},
+)
+
+
+def _projects_schema(ids: dict[str, str]) -> tuple[dict[str, Any], ...]:
+    """Build the Projects schema, which relates to Domains."""
+    return (
+        {"name": "Name", "type": "title"},
+        {"name": "Status", "type": "select", "select": {"options": _PROJECT_STATUS_OPTIONS}},
+        {"name": "Domain", "type": "relation", "relation": {
+            "data_source_id": ids["domains"],
+            "single_property": {},
+        }},
+        {"name": "Deadline", "type": "date"},
+        {"name": "Priority", "type": "select", "select": {"options": _PRIORITY_OPTIONS}},
+        {"name": "Progress", "type": "number", "number": {"format": "percent"}},
+        {"name": "Goal", "type": "rich_text"},
+        {"name": "Notes", "type": "rich_text"},
+    )
+
+
+def _routines_schema(ids: dict[str, str]) -> tuple[dict[str, Any], ...]:
+    """Build the Routines schema, which relates to Domains."""
+    return (
+        {"name": "Name", "type": "title"},
+        {"name": "Frequency", "type": "select", "select": {"options": _FREQUENCY_OPTIONS}},
+        {"name": "Domain", "type": "relation", "relation": {
+            "data_source_id": ids["domains"],
+            "single_property": {},
+        }},
+        {"name": "Best Time", "type": "rich_text"},
+        {"name": "Estimated Duration", "type": "number"},
+        {"name": "Streak", "type": "number"},
+        {"name": "Last Completed", "type": "date"},
+        {"name": "Total Completions", "type": "number"},
+    )
+
+
+def _tasks_schema(ids: dict[str, str]) -> tuple[dict[str, Any], ...]:
+    """Build the Tasks schema, which relates to Domains, Projects and Tags."""
+    return (
+        {"name": "Title", "type": "title"},
+        {"name": "Status", "type": "select", "select": {"options": _TASK_STATUS_OPTIONS}},
+        {"name": "Priority", "type": "select", "select": {"options": _PRIORITY_OPTIONS}},
+        {"name": "Due Date", "type": "date"},
+        {"name": "Domain", "type": "relation", "relation": {
+            "data_source_id": ids["domains"],
+            "single_property": {},
+        }},
+        {"name": "Project", "type": "relation", "relation": {
+            "data_source_id": ids["projects"],
+            "single_property": {},
+        }},
+        # Note: Parent Task (self-referential) and Subtasks (rollup) properties
+        # need to be added after database creation via a separate API update
+        # because the Tasks database ID doesn't exist yet at this point
+        # TODO: Implement update operation to add these properties
+        {"name": "Tags", "type": "relation", "relation": {
+            "data_source_id": ids["tags"],
+            "dual_property": {
+                "synced_property_name": "Tasks"
+            },
+        }},
+        {"name": "Estimated Time", "type": "number"},
+        {"name": "Energy Required", "type": "select", "select": {"options": _ENERGY_OPTIONS}},
+        {"name": "Context", "type": "rich_text"},
+        {"name": "Created Date", "type": "date"},
+        {"name": "Completed Date", "type": "date"},
+        {"name": "Archived Date", "type": "date"},
+    )
+
+
+def _agenda_schema(ids: dict[str, str]) -> tuple[dict[str, Any], ...]:
+    """Build the Agenda schema, which relates to Tasks and Projects."""
+    return (
+        {"name": "Name", "type": "title"},
+        {"name": "Start", "type": "date"},
+        {"name": "End", "type": "date"},
+        {"name": "Type", "type": "select", "select": {"options": _AGENDA_TYPE_OPTIONS}},
+        {"name": "Linked Task", "type": "relation", "relation": {
+            "data_source_id": ids["tasks"],
+            "single_property": {},
+        }},
+        {"name": "Linked Project", "type": "relation", "relation": {
+            "data_source_id": ids["projects"],
+            "single_property": {},
+        }},
+        {"name": "Location", "type": "rich_text"},
+        {"name": "Notes", "type": "rich_text"},
+    )
+
+
+# (config key, title, schema) per database, grouped into waves that only
+# relate to databases from earlier waves. A schema is either a fixed tuple
+# or a function of the database IDs created so far.
+_DATABASE_WAVES = (
+    (("domains", "Domains", _DOMAINS_SCHEMA), ("tags", "Tags", _TAGS_SCHEMA)),
+    (("projects", "Projects", _projects_schema), ("routines", "Routines", _routines_schema)),
+    (("tasks", "Tasks", _tasks_schema),),
+    (("agenda", "Agenda", _agenda_schema),),
+)
+
+# Seconds a page's database listing is reused between initializations
+_CHILD_DATABASES_TTL = 60.0
+
+# Database listings keyed by parent page ID, with the monotonic time they were fetched
+_child_databases_cache: dict[str, tuple[float, dict[str, str]]] = {}
+
+# Config keys of the personal databases, in their saved order
+_DATABASE_KEYS = ("domains", "tags", "projects", "tasks", "routines", "agenda")
+
+
+def _build_relation(prop: dict[str, Any]) -> dict[str, Any]:
+    """Build a relation property schema for the /databases endpoint."""
+    # Convert data_source_id to database_id for /databases endpoint,
+    # building a new dict since the definition may be a shared constant
+    relation = prop["relation"]
+    relation_config = {k: v for k, v in relation.items() if k != "data_source_id"}
+    if "data_source_id" in relation:
+        relation_config["database_id"] = relation["data_source_id"]
+    return {"type": "relation", "relation": relation_config}
+
+
+def _build_bare(prop: dict[str, Any]) -> dict[str, Any]:
+    """Build a property schema that needs no configuration (checkbox, etc.)."""
+    return {"type": prop["type"]}
+
+
+# Property schema builders keyed by property type; each takes a property
+# definition and returns its API schema without the "name" field
+_PROP_BUILDERS = {
+    "title": lambda prop: {"type": "title", "title": {}},
+    "rich_text": lambda prop: {"type": "rich_text", "rich_text": {}},
+    "date": lambda prop: {"type": "date", "date": {}},
+    "number": lambda prop: {"type": "number", "number": prop.get("number", {"format": "number"})},
+    "select": lambda prop: {"type": "select", "select": prop["select"]},
+    "relation": _build_relation,
+    "rollup": lambda prop: {"type": "rollup", "rollup": prop["rollup"]},
+}
 
 
 class PersonalWorkspaceInitializer:
@@ -22,13 +242,15 @@ class PersonalWorkspaceInitializer:
         "Agenda",
     ]
 
-    def __init__(self, client: NotionClient):
+    def __init__(self, client: NotionClient, max_concurrency: int = 5):
         """Initialize workspace initializer.
 
         Args:
             client: Notion client instance
+            max_concurrency: Maximum number of database creates in flight at once
         """
         self.client = client
+        self._create_semaphore = asyncio.Semaphore(max_concurrency)
         self._database_ids: dict[str, str] = {}
         self._parent_page_id: str = ""
         self._workspace_id: str = ""
@@ -45,305 +267,166 @@ class PersonalWorkspaceInitializer:
         Args:
             parent_page_id: Parent page ID where databases will be created
             workspace_name: Name for the workspace
-            skip_detection: If True, skip workspace detection
+            skip_detection: If True, ignore a saved configuration for this
+                page and look up or create the databases in Notion
 
         Returns:
             Dictionary mapping database names to their IDs
         """
-        from better_notion._sdk.models.database import Database
-
         self._parent_page_id = parent_page_id
         self._workspace_name = workspace_name
+
+        # Reuse the saved configuration for this page while its databases still exist
+        if not skip_detection:
+            config = PersonalWorkspaceMetadata.load_config()
+            saved_ids = config.get("database_ids") or {}
+            if (
+                config.get("parent_page_id") == parent_page_id
+                and config.get("workspace_id")
+                and all(saved_ids.get(key) for key in _DATABASE_KEYS)
+                and await self._databases_exist([saved_ids[key] for key in _DATABASE_KEYS])
+            ):
+                logger.debug("Reusing saved workspace configuration for page %s", parent_page_id)
+                self._workspace_id = config["workspace_id"]
+                self._workspace_name = config.get("workspace_name", workspace_name)
+                self._database_ids = {key: saved_ids[key] for key in _DATABASE_KEYS}
+                return self._database_ids
+
         self._workspace_id = f"personal-{uuid.uuid4().hex[:8]}"
 
-        # Helper function to find existing database
-        async def find_existing_database(title: str) -> str | None:
-            """Check if a database with given title already exists in the parent page."""
-            from better_notion._api.collections import DatabaseCollection
-
-            # Query for child databases in the parent page
-            # We need to search through children to find databases
-            try:
-                # Get all children blocks
-                response = await self.client._api._request(
-                    "GET",
-                    f"/blocks/{parent_page_id}/children"
-                )
+        # List the parent page's databases once instead of per title
+        existing_databases = await self._list_child_databases(parent_page_id)
+
+        async def ensure_database(title: str, properties: Sequence[dict]) -> str:
+            """Return the ID of the database with given title, creating it if missing."""
+            existing_id = existing_databases.get(title)
+            if existing_id:
+                logger.debug("Reusing existing %s database: %s", title, existing_id)
+                return existing_id
+
+            logger.debug("Creating new %s database", title)
+            database = await self._create_database(parent_page_id, title, properties)
+            logger.debug("%s database created: %s", title, database.id)
+            return database.id
+
+        # Databases are created in dependency waves: each wave only relates to
+        # databases from earlier waves, so the databases within a wave are
+        # created concurrently.
+        database_ids: dict[str, str] = {}
+        for wave in _DATABASE_WAVES:
+            wave_ids = await asyncio.gather(*(
+                ensure_database(title, schema(database_ids) if callable(schema) else schema)
+                for _, title, schema in wave
+            ))
+            database_ids.update(zip((key for key, _, _ in wave), wave_ids, strict=True))
 
-                for child in response.get("results", []):
-                    if child.get("type") == "database":
-                        # Get database details to check title
-                        db_response = await self.client._api._request(
-                            "GET",
-                            f"/databases/{child['id']}"
-                        )
-                        db_title = db_response.get("title", [])
-                        if db_title and len(db_title) > 0:
-                            title_text = db_title[0].get("plain_text", "")
-                            if title_text == title:
-                                return child["id"]
-            except Exception:
-                # If search fails, proceed with creation
-                pass
-
-            return None
-
-        # Step 1: Create Domains database (or reuse existing)
-        existing_domains_id = await find_existing_database("Domains")
-        if existing_domains_id:
-            print(f"[DEBUG] Reusing existing Domains database: {existing_domains_id}")
-            domain_id = existing_domains_id
-        else:
-            print(f"[DEBUG] Creating new Domains database")
-            domain_db = await self._create_database(
-                parent_page_id,
-                "Domains",
-                [
-                    {"name": "Name", "type": "title"},
-                    {"name": "Description", "type": "rich_text"},
-                    {"name": "Color", "type": "select", "select": {"options": [
-                        {"name": "Red", "color": "red"},
-                        {"name": "Orange", "color": "orange"},
-                        {"name": "Yellow", "color": "yellow"},
-                        {"name": "Green", "color": "green"},
-                        {"name": "Blue", "color": "blue"},
-                        {"name": "Purple", "color": "purple"},
-                        {"name": "Gray", "color": "gray"},
-                    ]}},
-                ]
-            )
-            domain_id = domain_db.id
-            print(f"[DEBUG] Domains database created: {domain_id}")
-        domain_db = type('obj', (object,), {'id': domain_id})  # Mock object with id attribute
-
-        # Step 2: Create Tags database (or reuse existing)
-        existing_tags_id = await find_existing_database("Tags")
-        if existing_tags_id:
-            print(f"[DEBUG] Reusing existing Tags database: {existing_tags_id}")
-            tag_id = existing_tags_id
-        else:
-            print(f"[DEBUG] Creating new Tags database")
-            tag_db = await self._create_database(
-                parent_page_id,
-                "Tags",
-                [
-                    {"name": "Name", "type": "title"},
-                    {"name": "Color", "type": "select", "select": {"options": [
-                        {"name": "Red", "color": "red"},
-                        {"name": "Orange", "color": "orange"},
-                        {"name": "Yellow", "color": "yellow"},
-                        {"name": "Green", "color": "green"},
-                        {"name": "Blue", "color": "blue"},
-                        {"name": "Purple", "color": "purple"},
-                        {"name": "Gray", "color": "gray"},
-                    ]}},
-                    {"name": "Category", "type": "select", "select": {"options": [
-                        {"name": "Context"},
-                        {"name": "Energy"},
-                        {"name": "Location"},
-                        {"name": "Time"},
-                        {"name": "Custom"},
-                    ]}},
-                    {"name": "Description", "type": "rich_text"},
-                ]
-            )
-            tag_id = tag_db.id
-            print(f"[DEBUG] Tags database created: {tag_id}")
-        tag_db = type('obj', (object,), {'id': tag_id})  # Mock object with id attribute
-
-        # Step 3: Create Projects database (or reuse existing)
-        existing_projects_id = await find_existing_database("Projects")
-        if existing_projects_id:
-            print(f"[DEBUG] Reusing existing Projects database: {existing_projects_id}")
-            project_id = existing_projects_id
-        else:
-            print(f"[DEBUG] Creating new Projects database")
-            project_db = await self._create_database(
-                parent_page_id,
-                "Projects",
-                [
-                    {"name": "Name", "type": "title"},
-                    {"name": "Status", "type": "select", "select": {"options": [
-                        {"name": "Active", "color": "green"},
-                        {"name": "On Hold", "color": "orange"},
-                        {"name": "Completed", "color": "blue"},
-                        {"name": "Archived", "color": "gray"},
-                    ]}},
-                    {"name": "Domain", "type": "relation", "relation": {
-                        "data_source_id": domain_db.id,
-                        "single_property": {},
-                    }},
-                    {"name": "Deadline", "type": "date"},
-                    {"name": "Priority", "type": "select", "select": {"options": [
-                        {"name": "Critical", "color": "red"},
-                        {"name": "High", "color": "orange"},
-                        {"name": "Medium", "color": "yellow"},
-                        {"name": "Low", "color": "blue"},
-                    ]}},
-                    {"name": "Progress", "type": "number", "number": {"format": "percent"}},
-                    {"name": "Goal", "type": "rich_text"},
-                    {"name": "Notes", "type": "rich_text"},
-                ]
-            )
-            project_id = project_db.id
-            print(f"[DEBUG] Projects database created: {project_id}")
-        project_db = type('obj', (object,), {'id': project_id})  # Mock object with id attribute
-
-        # Step 4: Create Tasks database (or reuse existing)
-        existing_tasks_id = await find_existing_database("Tasks")
-        if existing_tasks_id:
-            print(f"[DEBUG] Reusing existing Tasks database: {existing_tasks_id}")
-            task_id = existing_tasks_id
-        else:
-            print(f"[DEBUG] Creating new Tasks database")
-            task_db = await self._create_database(
-                parent_page_id,
-                "Tasks",
-                [
-                    {"name": "Title", "type": "title"},
-                    {"name": "Status", "type": "select", "select": {"options": [
-                        {"name": "Todo", "color": "gray"},
-                        {"name": "In Progress", "color": "blue"},
-                        {"name": "Done", "color": "green"},
-                        {"name": "Cancelled", "color": "red"},
-                        {"name": "Archived", "color": "gray"},
-                    ]}},
-                    {"name": "Priority", "type": "select", "select": {"options": [
-                        {"name": "Critical", "color": "red"},
-                        {"name": "High", "color": "orange"},
-                        {"name": "Medium", "color": "yellow"},
-                        {"name": "Low", "color": "blue"},
-                    ]}},
-                    {"name": "Due Date", "type": "date"},
-                    {"name": "Domain", "type": "relation", "relation": {
-                        "data_source_id": domain_db.id,
-                        "single_property": {},
-                    }},
-                    {"name": "Project", "type": "relation", "relation": {
-                        "data_source_id": project_db.id,
-                        "single_property": {},
-                    }},
-                    # Note: Parent Task (self-referential) and Subtasks (rollup) properties
-                    # need to be added after database creation via a separate API update
-                    # because task_db.id doesn't exist yet at this point
-                    # TODO: Implement update operation to add these properties
-                    {"name": "Tags", "type": "relation", "relation": {
-                        "data_source_id": tag_db.id,
-                        "dual_property": {
-                            "synced_property_name": "Tasks"
-                        },
-                    }},
-                    {"name": "Estimated Time", "type": "number"},
-                    {"name": "Energy Required", "type": "select", "select": {"options": [
-                        {"name": "High", "color": "red"},
-                        {"name": "Medium", "color": "yellow"},
-                        {"name": "Low", "color": "blue"},
-                    ]}},
-                    {"name": "Context", "type": "rich_text"},
-                    {"name": "Created Date", "type": "date"},
-                    {"name": "Completed Date", "type": "date"},
-                    {"name": "Archived Date", "type": "date"},
-                ]
-            )
-            task_id = task_db.id
-            print(f"[DEBUG] Tasks database created: {task_id}")
-        task_db = type('obj', (object,), {'id': task_id})  # Mock object with id attribute
-
-        # Step 5: Create Routines database (or reuse existing)
-        existing_routines_id = await find_existing_database("Routines")
-        if existing_routines_id:
-            print(f"[DEBUG] Reusing existing Routines database: {existing_routines_id}")
-            routine_id = existing_routines_id
-        else:
-            print(f"[DEBUG] Creating new Routines database")
-            routine_db = await self._create_database(
-                parent_page_id,
-                "Routines",
-                [
-                    {"name": "Name", "type": "title"},
-                    {"name": "Frequency", "type": "select", "select": {"options": [
-                        {"name": "Daily", "color": "blue"},
-                        {"name": "Weekly", "color": "green"},
-                        {"name": "Weekdays", "color": "yellow"},
-                        {"name": "Weekends", "color": "purple"},
-                    ]}},
-                    {"name": "Domain", "type": "relation", "relation": {
-                        "data_source_id": domain_db.id,
-                        "single_property": {},
-                    }},
-                    {"name": "Best Time", "type": "rich_text"},
-                    {"name": "Estimated Duration", "type": "number"},
-                    {"name": "Streak", "type": "number"},
-                    {"name": "Last Completed", "type": "date"},
-                    {"name": "Total Completions", "type": "number"},
-                ]
+        # Store database IDs
+        self._database_ids = {key: database_ids[key] for key in _DATABASE_KEYS}
+
+        # Save configuration without blocking the event loop on file I/O
+        await asyncio.to_thread(self.save_database_ids)
+
+        return self._database_ids
+
+    async def _databases_exist(self, database_ids: Sequence[str]) -> bool:
+        """Check that saved databases are still live in Notion.
+
+        Args:
+            database_ids: IDs of the databases to check
+
+        Returns:
+            False if any database was deleted, moved to the trash, or could
+            not be fetched
+        """
+        try:
+            databases = await asyncio.gather(*(
+                self.client._api._request("GET", f"/databases/{database_id}")
+                for database_id in database_ids
+            ))
+        except Exception as e:
+            logger.warning(
+                "Could not verify saved workspace databases (%s: %s); detecting them again",
+                type(e).__name__,
+                e,
             )
-            routine_id = routine_db.id
-            print(f"[DEBUG] Routines database created: {routine_id}")
-        routine_db = type('obj', (object,), {'id': routine_id})  # Mock object with id attribute
-
-        # Step 6: Create Agenda database (or reuse existing)
-        existing_agenda_id = await find_existing_database("Agenda")
-        if existing_agenda_id:
-            print(f"[DEBUG] Reusing existing Agenda database: {existing_agenda_id}")
-            agenda_id = existing_agenda_id
-        else:
-            print(f"[DEBUG] Creating new Agenda database")
-            agenda_db = await self._create_database(
-                parent_page_id,
-                "Agenda",
-                [
-                    {"name": "Name", "type": "title"},
-                    {"name": "Start", "type": "date"},
-                    {"name": "End", "type": "date"},
-                    {"name": "Type", "type": "select", "select": {"options": [
-                        {"name": "Event", "color": "blue"},
-                        {"name": "Time Block", "color": "green"},
-                        {"name": "Reminder", "color": "yellow"},
-                    ]}},
-                    {"name": "Linked Task", "type": "relation", "relation": {
-                        "data_source_id": task_db.id,
-                        "single_property": {},
-                    }},
-                    {"name": "Linked Project", "type": "relation", "relation": {
-                        "data_source_id": project_db.id,
-                        "single_property": {},
-                    }},
-                    {"name": "Location", "type": "rich_text"},
-                    {"name": "Notes", "type": "rich_text"},
-                ]
+            return False
+        return not any(db.get("archived") or db.get("in_trash") for db in databases)
+
+    async def _iter_children(self, block_id: str) -> AsyncGenerator[dict[str, Any], None]:
+        """Yield the child blocks of a block, fetching one page at a time.
+
+        Args:
+            block_id: Block or page whose children to list
+
+        Yields:
+            Child block objects in order
+        """
+        params: dict[str, Any] = {"page_size": 100}
+        while True:
+            response = await self.client._api._request(
+                "GET",
+                f"/blocks/{block_id}/children",
+                params=params,
             )
-            agenda_id = agenda_db.id
-            print(f"[DEBUG] Agenda database created: {agenda_id}")
-        agenda_db = type('obj', (object,), {'id': agenda_id})  # Mock object with id attribute
+            for child in response.get("results", []):
+                yield child
 
-        # Store database IDs
-        self._database_ids = {
-            "domains": domain_db.id,
-            "tags": tag_db.id,
-            "projects": project_db.id,
-            "tasks": task_db.id,
-            "routines": routine_db.id,
-            "agenda": agenda_db.id,
-        }
+            if not response.get("has_more"):
+                return
+            params = {"page_size": 100, "start_cursor": response["next_cursor"]}
 
-        # Save configuration
-        self.save_database_ids()
+    async def _list_child_databases(self, parent_page_id: str) -> dict[str, str]:
+        """List the databases directly inside a page.
 
-        return self._database_ids
+        Titles are read from the inline ``child_database`` block data, so
+        listing costs one request per page of children rather than one per
+        database. Paging stops once every expected database has been seen,
+        and a successful listing is reused for the same page for
+        ``_CHILD_DATABASES_TTL`` seconds or until a database is created in it.
+
+        Args:
+            parent_page_id: Page whose child databases to list
+
+        Returns:
+            Dictionary mapping database titles to their IDs, empty if the
+            children could not be listed
+        """
+        now = time.monotonic()
+        cached = _child_databases_cache.get(parent_page_id)
+        if cached is not None and now - cached[0] < _CHILD_DATABASES_TTL:
+            return cached[1]
+
+        databases: dict[str, str] = {}
+        missing = set(self.EXPECTED_DATABASES)
+        try:
+            async with aclosing(self._iter_children(parent_page_id)) as children:
+                async for child in children:
+                    if child.get("type") != "child_database":
+                        continue
+                    title = child.get("child_database", {}).get("title", "")
+                    databases.setdefault(title, child["id"])
+                    missing.discard(title)
+                    if not missing:
+                        break
+        except Exception:
+            # If listing fails, proceed with creation
+            return databases
+
+        _child_databases_cache[parent_page_id] = (now, databases)
+        return databases
 
     async def _create_database(
         self,
         parent_page_id: str,
         title: str,
-        properties: list[dict],
+        properties: Sequence[dict],
     ):
         """Create a Notion database with given properties.
 
         Args:
             parent_page_id: Parent page ID
             title: Database title
-            properties: List of property definitions
+            properties: Property definitions; not modified
 
         Returns:
             Created Database object
@@ -352,90 +435,69 @@ class PersonalWorkspaceInitializer:
         # Format properties for API
         # Notion API expects properties as a dict (not a list)
         # with property names as keys
-        schema_properties = {}
-        for prop in properties:
-            prop_name = prop["name"]
-            prop_type = prop["type"]
-
-            # Build property schema without "name" field
-            prop_schema = {"type": prop_type}
-
-            if prop_type == "title":
-                prop_schema["title"] = {}
-            elif prop_type == "rich_text":
-                prop_schema["rich_text"] = {}
-            elif prop_type == "number":
-                # Get number config from prop["number"] or default to {"format": "number"}
-                number_config = prop.get("number", {"format": "number"})
-                prop_schema["number"] = number_config
-            elif prop_type == "select":
-                prop_schema["select"] = prop["select"]
-            elif prop_type == "date":
-                prop_schema["date"] = {}
-            elif prop_type == "relation":
-                # Fix relation format for Notion API
-                relation_config = prop["relation"].copy()
-                # Convert data_source_id to database_id for /databases endpoint
-                if "data_source_id" in relation_config:
-                    relation_config["database_id"] = relation_config.pop("data_source_id")
-                prop_schema["relation"] = relation_config
-            elif prop_type == "rollup":
-                prop_schema["rollup"] = prop["rollup"]
-            # For date, checkbox, etc.: no additional fields needed
-
-            schema_properties[prop_name] = prop_schema
+        schema_properties = {
+            prop["name"]: _PROP_BUILDERS.get(prop["type"], _build_bare)(prop)
+            for prop in properties
+        }
 
         # Create database via API using the DatabaseCollection
-        from better_notion._api.collections import DatabaseCollection
-
         # Create a DatabaseCollection instance
         db_collection = DatabaseCollection(self.client._api)
 
         # Log the request payload for debugging
-        import json
         request_payload = {
             "parent": {"type": "page_id", "page_id": parent_page_id},
             "title": title,
             "properties": schema_properties,
         }
-        print(f"[DEBUG] Creating database '{title}' with schema:", file=__import__('sys').stderr)
-        print(json.dumps(request_payload, indent=2), file=__import__('sys').stderr)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Creating database '%s' with schema:\n%s",
+                title,
+                json.dumps(request_payload, indent=2),
+            )
 
         try:
-            response = await db_collection.create(
-                parent=request_payload["parent"],
-                title=title,
-                properties=schema_properties,
-            )
-            print(f"[DEBUG] Database '{title}' created successfully: {response.get('id')}", file=__import__('sys').stderr)
+            # Rate-limited creates are already retried by the API client
+            async with self._create_semaphore:
+                response = await db_collection.create(
+                    parent=request_payload["parent"],
+                    title=title,
+                    properties=schema_properties,
+                )
+            logger.debug("Database '%s' created successfully: %s", title, response.get("id"))
+            _child_databases_cache.pop(parent_page_id, None)
         except Exception as e:
-            print(f"[ERROR] Failed to create database '{title}': {type(e).__name__}: {e}", file=__import__('sys').stderr)
-            # Try to get more error details
-            import traceback
-            print(f"[ERROR] Traceback: {traceback.format_exc()}", file=__import__('sys').stderr)
-            if hasattr(e, 'args') and e.args:
-                print(f"[ERROR] Exception args: {e.args}", file=__import__('sys').stderr)
+            logger.exception("Failed to create database '%s': %s: %s", title, type(e).__name__, e)
             raise
 
-        from better_notion._sdk.models.database import Database
         return Database(data=response, client=self.client)
 
     def save_database_ids(self) -> None:
-        """Save database IDs and workspace configuration to disk."""
+        """Save database IDs and workspace configuration to disk.
+
+        The file is left untouched when it already holds the same
+        configuration, so re-running an initialized workspace does not
+        rewrite it.
+        """
         config = {
             "workspace_id": self._workspace_id,
             "workspace_name": self._workspace_name,
             "parent_page_id": self._parent_page_id,
             "database_ids": self._database_ids,
-            "initialized_at": datetime.now().isoformat(),
             "version": "1.0.0",
         }
 
-        config_path = Path.home() / ".notion" / "personal.json"
-        config_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            saved = dict(PersonalWorkspaceMetadata.load_config())
+        except ValueError:
+            saved = {}
+        saved.pop("initialized_at", None)
+        if saved == config:
+            return
 
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        config["initialized_at"] = datetime.now().isoformat()
+        PersonalWorkspaceMetadata.save_config(config)
 
     @staticmethod
     def load_parent_page() -> str | None:
@@ -444,10 +506,4 @@ class PersonalWorkspaceInitializer:
         Returns:
             Parent page ID if found, None otherwise
         """
-        from better_notion.utils.personal.metadata import PersonalWorkspaceMetadata, CONFIG_PATH
-
-        if CONFIG_PATH.exists():
-            with open(CONFIG_PATH, encoding="utf-8") as f:
-                config = json.load(f)
-                return config.get("parent_page_id")
-        return None
+        return PersonalWorkspaceMetadata.load_config().get("parent_page_id")
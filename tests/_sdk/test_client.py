@@ -37,6 +37,13 @@ class TestNotionClientInit:
         assert isinstance(client._database_cache, Cache)
         assert isinstance(client._page_cache, Cache)
 
+    def test_init_passes_max_connections(self, mock_api):
+        """Test the connection limit is forwarded to the API client."""
+        with patch('better_notion._sdk.client.NotionAPI', return_value=mock_api) as api_cls:
+            NotionClient(auth="test_token", max_connections=5)
+
+        assert api_cls.call_args.kwargs["max_connections"] == 5
+
     def test_init_creates_managers(self, mock_api):
         """Test initialization creates all managers."""
         with patch('better_notion._sdk.client.NotionAPI', return_value=mock_api):
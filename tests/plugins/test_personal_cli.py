@@ -295,6 +295,42 @@ class TestTasksCLI:
             assert "task-123" in result
             assert "Buy groceries" in result
 
+    def test_tasks_add_creates_extra_titles_in_one_batch(self, mock_client, monkeypatch):
+        """Test repeated --task titles are created together with the same options."""
+        from better_notion.plugins.official.personal_sdk.models import Task
+
+        monkeypatch.setattr(
+            "better_notion.plugins.official.personal_cli.get_client",
+            lambda: mock_client,
+        )
+        monkeypatch.setattr(
+            "better_notion.plugins.official.personal_cli.get_workspace_config",
+            lambda: {
+                "database_ids": {"tasks": "db-123"},
+                "workspace_id": "test-workspace",
+            },
+        )
+
+        async def create(**kwargs):
+            return MagicMock(
+                id=f"{kwargs['title']}-id",
+                title=kwargs["title"],
+                status="Todo",
+                priority=kwargs["priority"],
+            )
+
+        with patch.object(Task, "create", new_callable=AsyncMock, side_effect=create) as mock_create:
+            result = tasks_add(
+                "Plan trip", "High", None, None, None, None, None, None,
+                extra_titles=["Book flights", "Book hotel"],
+            )
+
+        assert "3 tasks created" in result
+        assert "Book hotel-id" in result
+        assert mock_create.await_count == 3
+        assert {call.kwargs["database_id"] for call in mock_create.await_args_list} == {"db-123"}
+        assert {call.kwargs["priority"] for call in mock_create.await_args_list} == {"High"}
+
     def test_tasks_list(self, mock_client, monkeypatch):
         """Test listing tasks."""
         from better_notion.plugins.official.personal_cli import get_client
@@ -374,6 +410,36 @@ class TestTasksCLI:
             assert "Done" in result
             mock_task.mark_done.assert_called_once()
 
+    def test_tasks_update_reports_new_values(self, mock_client, monkeypatch):
+        """Test the updated task is printed with its new status and priority."""
+        from better_notion.plugins.official.personal_sdk.models import Task
+
+        monkeypatch.setattr(
+            "better_notion.plugins.official.personal_cli.get_client",
+            lambda: mock_client,
+        )
+
+        def page(status, priority):
+            return {
+                "id": "task-123",
+                "object": "page",
+                "properties": {
+                    "Title": {"type": "title", "title": [{"plain_text": "Write report"}]},
+                    "Status": {"type": "select", "select": {"name": status}},
+                    "Priority": {"type": "select", "select": {"name": priority}},
+                },
+            }
+
+        task = Task(mock_client, page("Todo", "Low"))
+        mock_client._api.pages.update = AsyncMock(return_value=page("Done", "High"))
+
+        with patch.object(Task, "get", new_callable=AsyncMock, return_value=task):
+            result = tasks_update("task-123", status="Done", priority="High")
+
+        assert '"status": "Done"' in result
+        assert '"priority": "High"' in result
+        assert task.status == "Done"
+
 
 @pytest.mark.integration
 class TestProjectsCLI:
@@ -0,0 +1,69 @@
+"""Tests for the Personal plugin schema documentation.
+
+Tests the precomputed lookup tables derived from the database schemas.
+"""
+
+import pytest
+
+from better_notion.plugins.official.personal_schema import (
+    REQUIRED_FIELDS,
+    SCHEMA_BY_TITLE,
+    SELECT_OPTIONS,
+    TASKS_DB_SCHEMA,
+    WORKSPACE_RELATION_GRAPH,
+    WORKSPACE_RELATION_GRAPH_IN,
+    is_valid_select,
+    missing_required_fields,
+)
+
+
+@pytest.mark.unit
+class TestRequiredFields:
+    """Test required field lookup."""
+
+    def test_required_fields_match_schema(self):
+        """Test required fields mirror the property definitions."""
+        for title, schema in SCHEMA_BY_TITLE.items():
+            expected = [
+                name
+                for name, prop in schema["property_types"].items()
+                if prop["required"]
+            ]
+            assert list(REQUIRED_FIELDS[title]) == expected
+
+    def test_missing_required_fields(self):
+        """Test missing required fields are reported."""
+        assert missing_required_fields("Tasks", {"Title": "Write docs"}) == ["Status"]
+        assert missing_required_fields("Tasks", TASKS_DB_SCHEMA["example_creation"]["properties"]) == []
+
+
+@pytest.mark.unit
+class TestSelectOptions:
+    """Test select option lookup."""
+
+    def test_select_options_indexed_by_database_and_property(self):
+        """Test only select properties are indexed."""
+        assert SELECT_OPTIONS[("Tasks", "Priority")] == {"Critical", "High", "Medium", "Low"}
+        assert ("Tasks", "Title") not in SELECT_OPTIONS
+
+    def test_is_valid_select(self):
+        """Test option membership checks."""
+        assert is_valid_select("Tags", "Color", "Blue")
+        assert not is_valid_select("Tags", "Color", "Teal")
+
+
+@pytest.mark.unit
+class TestRelationGraph:
+    """Test the precomputed workspace relation graph."""
+
+    def test_inverse_graph(self):
+        """Test inverse edges list every database referencing a target."""
+        sources = [source for source, _ in WORKSPACE_RELATION_GRAPH_IN["Tasks"]]
+        assert sources == ["Domains", "Projects", "Tasks", "Tags"]
+        assert WORKSPACE_RELATION_GRAPH_IN["Agenda"] == (("Tasks", "1:N"),)
+
+    def test_inverse_graph_covers_all_edges(self):
+        """Test every outgoing edge appears in the inverse graph."""
+        for source, edges in WORKSPACE_RELATION_GRAPH.items():
+            for target, cardinality in edges:
+                assert (source, cardinality) in WORKSPACE_RELATION_GRAPH_IN[target]
@@ -0,0 +1,462 @@
+"""Tests for Personal SDK Plugin managers.
+
+Tests DomainManager, TagManager, ProjectManager, TaskManager, and
+RoutineManager.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from better_notion.plugins.official.personal_sdk.managers import (
+    MANAGER_REGISTRY,
+    DomainManager,
+    TagManager,
+    TaskManager,
+    _TTLCache,
+)
+
+
+@pytest.mark.unit
+class TestDatabaseIdLookup:
+    """Test database ID resolution from the workspace config."""
+
+    def test_database_id_from_config(self, mock_client):
+        """Test database ID is read from the workspace config."""
+        manager = TaskManager(mock_client)
+
+        assert manager._db_id == "tasks-db"
+
+    def test_database_id_missing_config(self, mock_client):
+        """Test missing workspace config resolves to None."""
+        mock_client._personal_workspace_config = None
+        manager = DomainManager(mock_client)
+
+        assert manager._db_id is None
+
+    def test_database_id_refreshed_on_new_config(self, mock_client):
+        """Test replacing the workspace config invalidates the cached ID."""
+        manager = TaskManager(mock_client)
+        assert manager._db_id == "tasks-db"
+
+        mock_client._personal_workspace_config = {"database_ids": {"tasks": "new-db"}}
+
+        assert manager._db_id == "new-db"
+
+
+@pytest.mark.unit
+class TestFindByName:
+    """Test name lookups."""
+
+    @pytest.mark.asyncio
+    async def test_find_by_name_filters_server_side(self, mock_client):
+        """Test the name is sent as a title filter."""
+        mock_client._api.databases.query.side_effect = _query_by_database
+        manager = TagManager(mock_client)
+
+        tag = await manager.find_by_name("@computer")
+
+        assert tag.id == "tag-1"
+        mock_client._api.databases.query.assert_awaited_once_with(
+            database_id="tags-db",
+            filter={"property": "Name", "title": {"equals": "@computer"}},
+            page_size=1,
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_by_name_not_found(self, mock_client):
+        """Test a missing name returns None."""
+        manager = DomainManager(mock_client)
+
+        assert await manager.find_by_name("Home") is None
+
+
+@pytest.mark.unit
+class TestNameIndex:
+    """Test the in-memory name to ID index."""
+
+    @pytest.mark.asyncio
+    async def test_find_id_by_name_queries_once(self, mock_client):
+        """Test the index is built once and reused."""
+        mock_client._api.databases.query.side_effect = _query_by_database
+        manager = DomainManager(mock_client)
+
+        assert await manager.find_id_by_name("Work") == "domain-1"
+        assert await manager.find_id_by_name("Home") is None
+        assert mock_client._api.databases.query.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_filtered_list_does_not_build_index(self, mock_client):
+        """Test a filtered list leaves the index unset."""
+        manager = TagManager(mock_client)
+
+        await manager.list(category="Context")
+
+        assert manager._name_index is None
+
+    @pytest.mark.asyncio
+    async def test_create_updates_index(self, mock_client):
+        """Test created entities are added to an existing index."""
+        from better_notion.plugins.official.personal_sdk.models import Domain
+
+        manager = DomainManager(mock_client)
+        manager._name_index = {}
+        created = Domain(mock_client, _page("domain-2", "Name", "Home"))
+
+        with patch.object(Domain, "create", new=AsyncMock(return_value=created)):
+            await manager.create("Home")
+
+        assert await manager.find_id_by_name("Home") == "domain-2"
+        mock_client._api.databases.query.assert_not_called()
+
+
+@pytest.mark.unit
+class TestTaskManagerList:
+    """Test TaskManager.list filters."""
+
+    @pytest.mark.asyncio
+    async def test_list_single_filter(self, mock_client):
+        """Test a single filter is sent without an "and" wrapper."""
+        await TaskManager(mock_client).list(status="Todo")
+
+        mock_client._api.databases.query.assert_awaited_once_with(
+            database_id="tasks-db",
+            filter={"property": "Status", "select": {"equals": "Todo"}},
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_combined_filters(self, mock_client):
+        """Test multiple filters are combined and only the first tag is used."""
+        await TaskManager(mock_client).list(
+            domain_id="domain-1", tag_ids=["tag-1", "tag-2"]
+        )
+
+        mock_client._api.databases.query.assert_awaited_once_with(
+            database_id="tasks-db",
+            filter={
+                "and": [
+                    {"property": "Domain", "relation": {"contains": "domain-1"}},
+                    {"property": "Tags", "relation": {"contains": "tag-1"}},
+                ]
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_reuses_filter_clauses(self, mock_client):
+        """Test repeated filters reuse the same clause objects."""
+        manager = TaskManager(mock_client)
+
+        await manager.list(status="Todo", project_id="project-1")
+        await manager.list(status="Todo")
+
+        first, second = mock_client._api.databases.query.await_args_list
+        assert second.kwargs["filter"] is first.kwargs["filter"]["and"][0]
+
+    @pytest.mark.asyncio
+    async def test_list_without_filters(self, mock_client):
+        """Test no filter is sent when no arguments are given."""
+        await TaskManager(mock_client).list()
+
+        mock_client._api.databases.query.assert_awaited_once_with(
+            database_id="tasks-db", filter=None
+        )
+
+
+@pytest.mark.unit
+class TestIterAll:
+    """Test streaming iteration over paginated query results."""
+
+    @pytest.mark.asyncio
+    async def test_iter_all_follows_cursor(self, mock_client):
+        """Test further pages are requested with the returned cursor."""
+        mock_client._api.databases.query.side_effect = [
+            {
+                "results": [_page("tag-1", "Name", "@computer")],
+                "has_more": True,
+                "next_cursor": "cursor-2",
+            },
+            {"results": [_page("tag-2", "Name", "@home")], "has_more": False},
+        ]
+        manager = TagManager(mock_client)
+
+        tags = [tag async for tag in manager.iter_all()]
+
+        assert [tag.id for tag in tags] == ["tag-1", "tag-2"]
+        second_call = mock_client._api.databases.query.await_args_list[1]
+        assert second_call.kwargs["start_cursor"] == "cursor-2"
+
+    @pytest.mark.asyncio
+    async def test_list_collects_all_pages(self, mock_client):
+        """Test list() returns results from every page."""
+        mock_client._api.databases.query.side_effect = [
+            {"results": [_page("domain-1", "Name", "Work")], "has_more": True, "next_cursor": "c"},
+            {"results": [_page("domain-2", "Name", "Home")]},
+        ]
+        manager = DomainManager(mock_client)
+
+        domains = await manager.list()
+
+        assert [domain.name for domain in domains] == ["Work", "Home"]
+        assert manager._name_index == {"Work": "domain-1", "Home": "domain-2"}
+
+
+@pytest.mark.unit
+class TestConcurrentList:
+    """Test coalescing of identical concurrent list() calls."""
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_share_one_query(self, mock_client):
+        """Test concurrent identical calls issue a single query."""
+        release = asyncio.Event()
+
+        async def slow_query(database_id, **kwargs):
+            await release.wait()
+            return {"results": [_page("task-1", "Title", "Write report")]}
+
+        mock_client._api.databases.query.side_effect = slow_query
+        manager = TaskManager(mock_client)
+
+        first = asyncio.ensure_future(manager.list(status="Todo"))
+        second = asyncio.ensure_future(manager.list(status="Todo"))
+        await asyncio.sleep(0)
+        release.set()
+        first_tasks, second_tasks = await asyncio.gather(first, second)
+
+        assert mock_client._api.databases.query.await_count == 1
+        assert first_tasks is not second_tasks
+        assert [t.id for t in first_tasks] == [t.id for t in second_tasks] == ["task-1"]
+        assert manager._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_caller_keeps_shared_query(self, mock_client):
+        """Test cancelling one caller does not cancel the query for the others."""
+        release = asyncio.Event()
+
+        async def slow_query(database_id, **kwargs):
+            await release.wait()
+            return {"results": [_page("task-1", "Title", "Write report")]}
+
+        mock_client._api.databases.query.side_effect = slow_query
+        manager = TaskManager(mock_client)
+
+        first = asyncio.ensure_future(manager.list(status="Todo"))
+        second = asyncio.ensure_future(manager.list(status="Todo"))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        tasks = await second
+
+        assert first.cancelled()
+        assert [t.id for t in tasks] == ["task-1"]
+        assert mock_client._api.databases.query.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_different_filters_query_separately(self, mock_client):
+        """Test calls with different filters are not coalesced."""
+        manager = TaskManager(mock_client)
+
+        await asyncio.gather(manager.list(status="Todo"), manager.list(status="Done"))
+
+        assert mock_client._api.databases.query.await_count == 2
+
+
+@pytest.mark.unit
+class TestGetCache:
+    """Test caching of get() lookups."""
+
+    @pytest.mark.asyncio
+    async def test_get_is_cached(self, mock_client):
+        """Test repeated gets for the same ID fetch once."""
+        from better_notion.plugins.official.personal_sdk.models import Tag
+
+        tag = Tag(mock_client, _page("tag-1", "Name", "@computer"))
+        manager = TagManager(mock_client)
+
+        with patch.object(Tag, "get", new=AsyncMock(return_value=tag)) as get:
+            assert await manager.get("tag-1") is tag
+            assert await manager.get("tag-1") is tag
+
+        get.assert_awaited_once()
+
+    def test_expired_entries_are_dropped(self):
+        """Test entries older than the TTL are not returned."""
+        cache = _TTLCache(ttl=30.0)
+
+        with patch("time.monotonic", return_value=100.0):
+            cache.put("a", 1)
+        with patch("time.monotonic", return_value=129.0):
+            assert cache.get("a") == 1
+        with patch("time.monotonic", return_value=130.0):
+            assert cache.get("a") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the cache keeps at most maxsize entries."""
+        cache = _TTLCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+
+@pytest.mark.unit
+class TestManagerRegistry:
+    """Test manager registration and reuse."""
+
+    def test_register_sdk_managers(self, mock_client):
+        """Test the plugin registers one manager per registry entry."""
+        from better_notion.plugins.official.personal import PersonalPlugin
+
+        managers = PersonalPlugin().register_sdk_managers(mock_client)
+
+        assert set(managers) == set(MANAGER_REGISTRY)
+        assert isinstance(managers["tasks"], TaskManager)
+
+    @pytest.mark.asyncio
+    async def test_create_with_names_uses_registered_manager(self, mock_client):
+        """Test name lookups go through the client's registered managers."""
+        domains = MagicMock(spec=DomainManager)
+        domains.find_by_name = AsyncMock(return_value=None)
+        mock_client.plugin_manager.side_effect = {"domains": domains}.get
+
+        with pytest.raises(ValueError):
+            await TaskManager(mock_client).create_with_names("Write", domain_name="Work")
+
+        domains.find_by_name.assert_awaited_once_with("Work")
+
+
+@pytest.mark.unit
+class TestTaskManagerCreateMany:
+    """Test TaskManager.create_many."""
+
+    @pytest.mark.asyncio
+    async def test_create_many_limits_concurrency(self, mock_client):
+        """Test tasks are created concurrently up to the limit, in order."""
+        running = 0
+        peak = 0
+
+        async def fake_create(self, title, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return title
+
+        manager = TaskManager(mock_client)
+        specs = [{"title": f"Task {i}"} for i in range(6)]
+
+        with patch.object(TaskManager, "create", new=fake_create):
+            created = await manager.create_many(specs, max_concurrency=2)
+
+        assert created == [f"Task {i}" for i in range(6)]
+        assert peak == 2
+
+
+@pytest.mark.unit
+class TestTaskManagerCreateWithNames:
+    """Test TaskManager.create_with_names."""
+
+    @pytest.mark.asyncio
+    async def test_create_with_names_resolves_ids(self, mock_client):
+        """Test names are resolved to IDs before creating the task."""
+        mock_client._api.databases.query.side_effect = _query_by_database
+        manager = TaskManager(mock_client)
+
+        with patch.object(TaskManager, "create", new=AsyncMock()) as create:
+            await manager.create_with_names(
+                "Write report",
+                domain_name="Work",
+                project_name="Launch",
+                tag_names=["@computer"],
+                priority="High",
+            )
+
+        create.assert_awaited_once_with(
+            "Write report",
+            domain_id="domain-1",
+            project_id="project-1",
+            tag_ids=["tag-1"],
+            priority="High",
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_with_names_skips_unused_lookups(self, mock_client):
+        """Test no queries are issued when no names are given."""
+        manager = TaskManager(mock_client)
+
+        with patch.object(TaskManager, "create", new=AsyncMock()) as create:
+            await manager.create_with_names("Write report")
+
+        mock_client._api.databases.query.assert_not_called()
+        create.assert_awaited_once_with(
+            "Write report", domain_id=None, project_id=None, tag_ids=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_with_names_unknown_domain(self, mock_client):
+        """Test an unknown domain name raises ValueError."""
+        mock_client._api.databases.query.side_effect = _query_by_database
+        manager = TaskManager(mock_client)
+
+        with pytest.raises(ValueError, match="Domain 'Home' not found"):
+            await manager.create_with_names("Write report", domain_name="Home")
+
+
+def _page(page_id: str, prop: str, name: str) -> dict:
+    """Build minimal page data with a title property."""
+    return {
+        "id": page_id,
+        "object": "page",
+        "properties": {prop: {"type": "title", "title": [{"plain_text": name}]}},
+    }
+
+
+async def _query_by_database(database_id: str, **kwargs) -> dict:
+    """Return canned query results for each personal database."""
+    results = {
+        "domains-db": [_page("domain-1", "Name", "Work")],
+        "projects-db": [_page("project-1", "Name", "Launch")],
+        "tags-db": [_page("tag-1", "Name", "@computer")],
+    }
+    pages = results.get(database_id, [])
+    title_filter = kwargs.get("filter")
+    if title_filter:
+        name = title_filter["title"]["equals"]
+        pages = [
+            page for page in pages
+            if page["properties"]["Name"]["title"][0]["plain_text"] == name
+        ]
+    return {"results": pages}
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock NotionClient."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from better_notion._sdk.client import NotionClient
+
+    client = MagicMock(spec=NotionClient)
+    client._api = MagicMock()
+    client._api.databases = MagicMock()
+    client._api.databases.query = AsyncMock(return_value={"results": []})
+    client._api._request = AsyncMock(return_value={"results": []})
+    client._personal_workspace_config = {
+        "database_ids": {
+            "domains": "domains-db",
+            "tags": "tags-db",
+            "projects": "projects-db",
+            "tasks": "tasks-db",
+            "routines": "routines-db",
+        }
+    }
+    client._plugin_caches = {}
+
+    return client
@@ -0,0 +1,539 @@
+"""Tests for Personal SDK Plugin models.
+
+Tests Domain, Tag, Project, Task, and Routine property parsing.
+"""
+
+import asyncio
+from contextlib import aclosing
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from better_notion._sdk.cache.cache import Cache
+from better_notion.plugins.official.personal_sdk.models import (
+    Agenda,
+    Domain,
+    Project,
+    Routine,
+    Tag,
+    Task,
+    _extract_rich_text,
+    _parse_datetime,
+    _select_name,
+)
+
+
+@pytest.mark.unit
+class TestExtractRichText:
+    """Test the shared rich text helper."""
+
+    def test_rich_text(self):
+        """Test reading a rich_text property."""
+        props = {"Notes": {"type": "rich_text", "rich_text": [{"plain_text": "hi"}]}}
+
+        assert _extract_rich_text(props, "Notes") == "hi"
+
+    def test_missing_property(self):
+        """Test a missing property returns empty string instead of raising."""
+        assert _extract_rich_text({}, "Notes") == ""
+
+    def test_other_type(self):
+        """Test a non-text property returns empty string."""
+        props = {"Notes": {"type": "number", "number": 3}}
+
+        assert _extract_rich_text(props, "Notes") == ""
+
+    def test_empty_rich_text(self):
+        """Test an empty rich_text list returns empty string."""
+        props = {"Notes": {"type": "rich_text", "rich_text": []}}
+
+        assert _extract_rich_text(props, "Notes") == ""
+
+
+@pytest.mark.unit
+class TestParseDatetime:
+    """Test the shared date parser."""
+
+    def test_date_only(self):
+        """Test a bare date parses to midnight."""
+        assert _parse_datetime("2024-01-15") == datetime(2024, 1, 15)
+
+    def test_datetime(self):
+        """Test a full datetime keeps its time and offset."""
+        assert _parse_datetime("2024-01-15T10:00:00.000+00:00") == datetime(
+            2024, 1, 15, 10, tzinfo=timezone.utc
+        )
+
+
+@pytest.mark.unit
+class TestSelectName:
+    """Test the shared select helper."""
+
+    def test_selected_option(self):
+        """Test reading the selected option name."""
+        props = {"Status": {"type": "select", "select": {"name": "Done"}}}
+
+        assert _select_name(props, "Status", "Todo") == "Done"
+
+    def test_unset_select(self):
+        """Test an unset select returns the default."""
+        props = {"Status": {"type": "select", "select": None}}
+
+        assert _select_name(props, "Status", "Todo") == "Todo"
+
+    def test_missing_property(self):
+        """Test a missing property returns the default."""
+        assert _select_name({}, "Status") is None
+
+
+@pytest.mark.unit
+class TestDomain:
+    """Test Domain model."""
+
+    def test_init(self, mock_client):
+        """Test domain initialization."""
+        data = {
+            "id": "domain-123",
+            "object": "page",
+            "properties": {
+                "Name": {"type": "title", "title": [{"plain_text": "Work"}]},
+                "Color": {"type": "select", "select": {"name": "Blue"}},
+            },
+        }
+
+        domain = Domain(mock_client, data)
+
+        assert domain.id == "domain-123"
+        assert domain.name == "Work"
+        assert domain.color == "Blue"
+
+    def test_properties_empty(self, mock_client):
+        """Test domain with empty properties."""
+        domain = Domain(mock_client, {"id": "domain-123", "properties": {}})
+
+        assert domain.name == ""
+        assert domain.color == "Gray"
+        assert domain.description == ""
+
+    def test_invalidate_reparses_data(self, mock_client):
+        """Test _invalidate picks up changes to the raw data."""
+        data = {
+            "id": "domain-123",
+            "properties": {
+                "Name": {"type": "title", "title": [{"plain_text": "Work"}]},
+            },
+        }
+        domain = Domain(mock_client, data)
+
+        data["properties"]["Name"]["title"][0]["plain_text"] = "Home"
+        assert domain.name == "Work"
+
+        domain._invalidate()
+        assert domain.name == "Home"
+
+
+@pytest.mark.unit
+class TestTag:
+    """Test Tag model."""
+
+    def test_init(self, mock_client):
+        """Test tag initialization."""
+        data = {
+            "id": "tag-123",
+            "properties": {
+                "Name": {"type": "title", "title": [{"plain_text": "urgent"}]},
+                "Category": {"type": "select", "select": {"name": "Context"}},
+            },
+        }
+
+        tag = Tag(mock_client, data)
+
+        assert tag.name == "urgent"
+        assert tag.color == "Gray"
+        assert tag.category == "Context"
+
+
+@pytest.mark.unit
+class TestProject:
+    """Test Project model."""
+
+    def test_init(self, mock_client):
+        """Test project initialization."""
+        data = {
+            "id": "project-123",
+            "properties": {
+                "Name": {"type": "title", "title": [{"plain_text": "Launch"}]},
+                "Status": {"type": "select", "select": {"name": "On Hold"}},
+                "Domain": {"type": "relation", "relation": [{"id": "domain-1"}]},
+                "Deadline": {"type": "date", "date": {"start": "2025-03-01"}},
+                "Progress": {"type": "number", "number": None},
+            },
+        }
+
+        project = Project(mock_client, data)
+
+        assert project.name == "Launch"
+        assert project.status == "On Hold"
+        assert project.domain_id == "domain-1"
+        assert project.deadline.year == 2025
+        assert project.priority == "Medium"
+        assert project.progress == 0
+
+
+@pytest.mark.unit
+class TestTask:
+    """Test Task model."""
+
+    def test_init(self, mock_client):
+        """Test task initialization."""
+        data = {
+            "id": "task-123",
+            "properties": {
+                "Title": {"type": "title", "title": [{"plain_text": "Write report"}]},
+                "Status": {"type": "select", "select": {"name": "In Progress"}},
+                "Due Date": {"type": "date", "date": {"start": "2025-01-15"}},
+                "Project": {"type": "relation", "relation": [{"id": "project-1"}]},
+                "Tags": {
+                    "type": "relation",
+                    "relation": [{"id": "tag-1"}, {"id": "tag-2"}],
+                },
+                "Subtasks": {
+                    "type": "rollup",
+                    "rollup": {
+                        "type": "array",
+                        "array": [
+                            {"type": "number", "number": 1},
+                            {"type": "number", "number": None},
+                        ],
+                    },
+                },
+                "Estimated Time": {"type": "number", "number": 30},
+            },
+        }
+
+        task = Task(mock_client, data)
+
+        assert task.title == "Write report"
+        assert task.status == "In Progress"
+        assert task.priority == "Medium"
+        assert task.due_date.day == 15
+        assert task.project_id == "project-1"
+        assert task.domain_id is None
+        assert task.tag_ids == ("tag-1", "tag-2")
+        assert task.subtasks_count == 1
+        assert task.estimated_time == 30
+        assert task.energy_required is None
+        assert task.completed_date is None
+
+    def test_lazy_fields(self, mock_client):
+        """Test fields left out of ``fields`` are parsed on first access."""
+        data = {
+            "id": "task-123",
+            "properties": {
+                "Title": {"type": "title", "title": [{"plain_text": "Write report"}]},
+                "Tags": {"type": "relation", "relation": [{"id": "tag-1"}]},
+            },
+        }
+
+        task = Task(mock_client, data, fields=frozenset({"title"}))
+
+        assert task.title == "Write report"
+        with pytest.raises(AttributeError):
+            object.__getattribute__(task, "_tag_ids")
+        assert task.tag_ids == ("tag-1",)
+        assert object.__getattribute__(task, "_tag_ids") == ("tag-1",)
+
+    def test_unknown_attribute(self, mock_client):
+        """Test unknown attributes still raise AttributeError."""
+        task = Task(mock_client, {"id": "task-123", "properties": {}})
+
+        with pytest.raises(AttributeError):
+            _ = task.missing
+
+    def test_slots(self, mock_client):
+        """Test tasks carry no per-instance __dict__."""
+        task = Task(mock_client, {"id": "task-123", "properties": {}})
+
+        assert not hasattr(task, "__dict__")
+
+
+@pytest.mark.unit
+class TestRoutine:
+    """Test Routine model."""
+
+    def test_best_time_missing(self, mock_client):
+        """Test best_time without the property returns empty string."""
+        routine = Routine(mock_client, {"id": "routine-123", "properties": {}})
+
+        assert routine.best_time == ""
+
+    def test_init(self, mock_client):
+        """Test routine initialization."""
+        data = {
+            "id": "routine-123",
+            "properties": {
+                "Name": {"type": "title", "title": [{"plain_text": "Run"}]},
+                "Frequency": {"type": "select", "select": {"name": "Weekly"}},
+                "Streak": {"type": "number", "number": None},
+                "Total Completions": {"type": "number", "number": 12},
+                "Last Completed": {"type": "date", "date": {"start": "2025-01-10"}},
+            },
+        }
+
+        routine = Routine(mock_client, data)
+
+        assert routine.name == "Run"
+        assert routine.frequency == "Weekly"
+        assert routine.streak == 0
+        assert routine.total_completions == 12
+        assert routine.estimated_duration is None
+        assert routine.last_completed.day == 10
+        assert not hasattr(routine, "__dict__")
+
+    @pytest.mark.asyncio
+    async def test_create_serializes_properties(self, mock_client):
+        """Test create sends API-ready property dicts."""
+        mock_client._api.pages.create = AsyncMock(
+            return_value={"id": "routine-123", "properties": {}}
+        )
+
+        await Routine.create(
+            client=mock_client,
+            database_id="routines-db",
+            name="Run",
+            domain_id="domain-1",
+        )
+
+        properties = mock_client._api.pages.create.await_args.kwargs["properties"]
+        assert properties["Name"] == {"type": "title", "title": [{"type": "text", "text": {"content": "Run"}}]}
+        assert properties["Domain"] == {"type": "relation", "relation": [{"id": "domain-1"}]}
+        assert properties["Streak"] == {"type": "number", "number": 0}
+
+    def test_shared_dates_reuse_parsed_value(self, mock_client):
+        """Test identical date strings parse to the same datetime object."""
+        data = {
+            "id": "routine-123",
+            "properties": {
+                "Last Completed": {"type": "date", "date": {"start": "2025-02-03"}},
+            },
+        }
+
+        first = Routine(mock_client, data)
+        second = Routine(mock_client, {**data, "id": "routine-456"})
+
+        assert first.last_completed is second.last_completed
+
+
+@pytest.mark.unit
+class TestGet:
+    """Test the get classmethod cache lookup."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_api(self, mock_client):
+        """Test a cached entity is returned without an API call."""
+        cache = Cache()
+        cached = Domain(mock_client, {"id": "domain-1", "properties": {}})
+        cache["domain-1"] = cached
+        mock_client.plugin_cache = MagicMock(return_value=cache)
+        mock_client._api.pages.get = AsyncMock()
+
+        assert await Domain.get("domain-1", client=mock_client) is cached
+        mock_client._api.pages.get.assert_not_awaited()
+        assert cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_miss_populates_empty_cache(self, mock_client):
+        """Test a fetched entity is stored even when the cache starts empty."""
+        cache = Cache()
+        mock_client.plugin_cache = MagicMock(return_value=cache)
+        mock_client._api.pages.get = AsyncMock(
+            return_value={"id": "tag-1", "properties": {}}
+        )
+
+        tag = await Tag.get("tag-1", client=mock_client)
+
+        assert cache.get("tag-1") is tag
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_share_request(self, mock_client):
+        """Test concurrent gets for the same ID issue one API call."""
+        async def fetch(page_id):
+            await asyncio.sleep(0)
+            return {"id": page_id, "properties": {}}
+
+        mock_client._api.pages.get = AsyncMock(side_effect=fetch)
+
+        first, second = await asyncio.gather(
+            Project.get("project-1", client=mock_client),
+            Project.get("project-1", client=mock_client),
+        )
+
+        assert first is second
+        assert mock_client._api.pages.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_get_keeps_shared_request(self, mock_client):
+        """Test cancelling one concurrent get does not fail the others."""
+        release = asyncio.Event()
+
+        async def fetch(page_id):
+            await release.wait()
+            return {"id": page_id, "properties": {}}
+
+        mock_client._api.pages.get = AsyncMock(side_effect=fetch)
+
+        first = asyncio.ensure_future(Project.get("project-1", client=mock_client))
+        second = asyncio.ensure_future(Project.get("project-1", client=mock_client))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+        project = await second
+
+        assert first.cancelled()
+        assert project.id == "project-1"
+        assert mock_client._api.pages.get.await_count == 1
+
+
+@pytest.mark.unit
+class TestGetMany:
+    """Test the concurrent multi-get classmethod."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_misses_in_order(self, mock_client):
+        """Test cache hits are reused and misses fetched once each."""
+        cache = Cache()
+        cached = Tag(mock_client, {"id": "tag-1", "properties": {}})
+        cache["tag-1"] = cached
+        mock_client.plugin_cache = lambda name: cache if name == "tags" else None
+        mock_client._api.pages.get = AsyncMock(
+            side_effect=lambda page_id: {"id": page_id, "properties": {}}
+        )
+
+        tags = await Tag.get_many(["tag-2", "tag-1", "tag-3", "tag-2"], client=mock_client)
+
+        assert [tag.id for tag in tags] == ["tag-2", "tag-1", "tag-3", "tag-2"]
+        assert tags[1] is cached
+        assert mock_client._api.pages.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_without_cache(self, mock_client):
+        """Test get_many works when the plugin cache is unavailable."""
+        mock_client._api.pages.get = AsyncMock(
+            side_effect=lambda page_id: {"id": page_id, "properties": {}}
+        )
+
+        tasks = await Task.get_many(["task-1", "task-2"], client=mock_client, concurrency=1)
+
+        assert [task.id for task in tasks] == ["task-1", "task-2"]
+
+    @pytest.mark.asyncio
+    async def test_populates_cache(self, mock_client):
+        """Test fetched entities are added to the plugin cache."""
+        cache = Cache()
+        mock_client.plugin_cache = MagicMock(return_value=cache)
+        mock_client._api.pages.get = AsyncMock(
+            side_effect=lambda page_id: {"id": page_id, "properties": {}}
+        )
+
+        items = await Agenda.get_many(["agenda-1", "agenda-2"], client=mock_client)
+
+        mock_client.plugin_cache.assert_called_with("agenda")
+        assert [cache.get(item.id) for item in items] == items
+
+
+@pytest.mark.unit
+class TestChildren:
+    """Test child block iteration."""
+
+    @pytest.mark.asyncio
+    async def test_follows_cursor(self, mock_client):
+        """Test children pages through the block list using the cursor."""
+        mock_client._api._request = AsyncMock(side_effect=[
+            {"results": [{"id": "block-1", "type": "paragraph"}], "has_more": True, "next_cursor": "c1"},
+            {"results": [{"id": "block-2", "type": "paragraph"}], "has_more": False},
+        ])
+        domain = Domain(mock_client, {"id": "domain-123", "properties": {}})
+
+        blocks = [block async for block in domain.children()]
+
+        assert [block.id for block in blocks] == ["block-1", "block-2"]
+        assert mock_client._api._request.await_args_list[1].kwargs["params"] == {"start_cursor": "c1"}
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_propagates(self, mock_client):
+        """Test an API error while prefetching is raised to the consumer."""
+        mock_client._api._request = AsyncMock(side_effect=[
+            {"results": [{"id": "block-1", "type": "paragraph"}], "has_more": True, "next_cursor": "c1"},
+            RuntimeError("boom"),
+        ])
+        domain = Domain(mock_client, {"id": "domain-123", "properties": {}})
+
+        blocks = []
+        with pytest.raises(RuntimeError, match="boom"):
+            async for block in domain.children():
+                blocks.append(block)
+
+        assert [block.id for block in blocks] == ["block-1"]
+
+    @pytest.mark.asyncio
+    async def test_early_exit_stops_prefetch(self, mock_client):
+        """Test leaving the loop early leaves no prefetch task pending."""
+        mock_client._api._request = AsyncMock(return_value={
+            "results": [{"id": "block-1", "type": "paragraph"}],
+            "has_more": True,
+            "next_cursor": "c1",
+        })
+        domain = Domain(mock_client, {"id": "domain-123", "properties": {}})
+
+        async with aclosing(domain.children()) as children:
+            async for _ in children:
+                break
+
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.mark.unit
+class TestQuery:
+    """Test the database query classmethod."""
+
+    @pytest.mark.asyncio
+    async def test_follows_cursor_and_caches(self, mock_client):
+        """Test query pages through results and caches each entity."""
+        cache = Cache()
+        mock_client.plugin_cache = MagicMock(return_value=cache)
+        mock_client._api.databases.query = AsyncMock(side_effect=[
+            {"results": [{"id": "routine-1", "properties": {}}], "has_more": True, "next_cursor": "c1"},
+            {"results": [{"id": "routine-2", "properties": {}}], "has_more": False},
+        ])
+        status_filter = {"property": "Frequency", "select": {"equals": "Daily"}}
+
+        routines = await Routine.query(
+            client=mock_client, database_id="routines-db", filter=status_filter
+        )
+
+        assert [routine.id for routine in routines] == ["routine-1", "routine-2"]
+        assert cache.get("routine-2") is routines[1]
+        second_call = mock_client._api.databases.query.await_args_list[1].kwargs
+        assert second_call == {
+            "database_id": "routines-db",
+            "page_size": 100,
+            "filter": status_filter,
+            "start_cursor": "c1",
+        }
+
+
+# Fixtures
+@pytest.fixture
+def mock_client():
+    """Create a mock NotionClient."""
+    from unittest.mock import MagicMock
+
+    from better_notion._sdk.client import NotionClient
+
+    client = MagicMock(spec=NotionClient)
+    client._api = MagicMock()
+    client.plugin_cache = MagicMock(return_value=None)
+
+    return client
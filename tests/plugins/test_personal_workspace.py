@@ -3,16 +3,35 @@
 Tests the workspace creation, detection, and metadata handling.
 """
 
+import asyncio
 import json
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock, patch
-from datetime import datetime
 
-from better_notion.utils.personal.workspace import PersonalWorkspaceInitializer
+from better_notion.utils.personal.workspace import (
+    PersonalWorkspaceInitializer,
+    _child_databases_cache,
+)
 from better_notion.utils.personal.metadata import PersonalWorkspaceMetadata
 
 
+@pytest.fixture(autouse=True)
+def config_path(tmp_path, monkeypatch):
+    """Keep the personal config file inside the test's temporary directory."""
+    path = tmp_path / ".notion" / "personal.json"
+    monkeypatch.setattr("better_notion.utils.personal.metadata.CONFIG_PATH", path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def clear_child_databases_cache():
+    """Start every test without cached parent page listings."""
+    _child_databases_cache.clear()
+    yield
+    _child_databases_cache.clear()
+
+
 @pytest.fixture
 def mock_client():
     """Create a mock NotionClient."""
@@ -115,6 +134,25 @@ class TestPersonalWorkspaceInitializer:
             assert saved_data["workspace_id"] == "workspace-abc"
             assert saved_data["workspace_name"] == "Test Workspace"
 
+    def test_save_database_ids_skips_unchanged_config(self, initializer, tmp_path, monkeypatch):
+        """Test saving an unchanged configuration leaves the file alone."""
+        initializer._database_ids = {"tasks": "db-123"}
+        initializer._parent_page_id = "page-123"
+        initializer._workspace_id = "workspace-abc"
+        initializer._workspace_name = "Test Workspace"
+        config_file = tmp_path / ".notion" / "personal.json"
+        monkeypatch.setattr("better_notion.utils.personal.metadata.CONFIG_PATH", config_file)
+
+        initializer.save_database_ids()
+        first = json.loads(config_file.read_text())
+
+        initializer.save_database_ids()
+        assert json.loads(config_file.read_text()) == first
+
+        initializer._database_ids = {"tasks": "db-456"}
+        initializer.save_database_ids()
+        assert json.loads(config_file.read_text())["database_ids"] == {"tasks": "db-456"}
+
 
 @pytest.mark.integration
 class TestPersonalWorkspaceMetadata:
@@ -135,6 +173,41 @@ class TestPersonalWorkspaceMetadata:
         client.databases = MagicMock()
         return client
 
+    def test_config_round_trip(self, tmp_path, monkeypatch):
+        """Test saved configuration loads back unchanged."""
+        config_path = tmp_path / ".notion" / "personal.json"
+        monkeypatch.setattr("better_notion.utils.personal.metadata.CONFIG_PATH", config_path)
+        config = {"workspace_id": "personal-abc123", "database_ids": {"tasks": "tasks-db"}}
+
+        PersonalWorkspaceMetadata.save_config(config)
+
+        assert json.loads(config_path.read_text(encoding="utf-8")) == config
+        assert PersonalWorkspaceMetadata.load_config() == config
+
+    def test_save_config_keeps_old_file_on_failure(self, tmp_path, monkeypatch):
+        """Test a failed write leaves the previous config intact."""
+        config_path = tmp_path / "personal.json"
+        monkeypatch.setattr("better_notion.utils.personal.metadata.CONFIG_PATH", config_path)
+        PersonalWorkspaceMetadata.save_config({"workspace_id": "personal-1"})
+
+        with pytest.raises(TypeError):
+            PersonalWorkspaceMetadata.save_config({"workspace_id": object()})
+
+        assert PersonalWorkspaceMetadata.load_config() == {"workspace_id": "personal-1"}
+        assert list(tmp_path.iterdir()) == [config_path]
+
+    def test_load_config_reuses_unchanged_file(self, tmp_path, monkeypatch):
+        """Test an unchanged config file is parsed only once."""
+        config_path = tmp_path / "personal.json"
+        monkeypatch.setattr("better_notion.utils.personal.metadata.CONFIG_PATH", config_path)
+        PersonalWorkspaceMetadata.save_config({"workspace_id": "personal-1"})
+
+        first = PersonalWorkspaceMetadata.load_config()
+        assert PersonalWorkspaceMetadata.load_config() is first
+
+        PersonalWorkspaceMetadata.save_config({"workspace_id": "personal-22"})
+        assert PersonalWorkspaceMetadata.load_config() == {"workspace_id": "personal-22"}
+
     @pytest.mark.asyncio
     async def test_detect_workspace_in_page_properties(self, mock_page, mock_client):
         """Test detecting workspace from page properties."""
@@ -192,6 +265,38 @@ class TestPersonalWorkspaceMetadata:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_detect_workspace_reuses_recent_children(self, mock_page, mock_client):
+        """Test repeated detection lists the page children only once."""
+        mock_page.id = "page-children-cache"
+        databases = []
+        for name in ("Domains", "Tags", "Projects", "Tasks", "Routines", "Agenda"):
+            db = MagicMock()
+            db.object = "database"
+            db.title = name
+            databases.append(db)
+        listings = 0
+
+        async def children():
+            nonlocal listings
+            listings += 1
+            for db in databases:
+                yield db
+
+        mock_page.children = children
+
+        with patch.object(
+            PersonalWorkspaceMetadata,
+            "load_config",
+            return_value={"workspace_id": "personal-abc123", "database_ids": {}},
+        ):
+            first = await PersonalWorkspaceMetadata.detect_workspace(mock_page, mock_client)
+            second = await PersonalWorkspaceMetadata.detect_workspace(mock_page, mock_client)
+
+        assert first == second
+        assert first["workspace_id"] == "personal-abc123"
+        assert listings == 1
+
 
 @pytest.mark.integration
 class TestPersonalWorkspaceInit:
@@ -237,6 +342,299 @@ class TestPersonalWorkspaceInit:
         # Verify return value contains database IDs
         assert len(result) == 6
 
+    @pytest.mark.asyncio
+    async def test_initialize_workspace_reuses_listed_databases(
+        self, initializer, mock_client
+    ):
+        """Test existing databases are found from one paginated children listing."""
+        mock_client._api._request = AsyncMock(side_effect=[
+            {
+                "results": [
+                    {"id": "block-1", "type": "paragraph"},
+                    {"id": "domains-db", "type": "child_database", "child_database": {"title": "Domains"}},
+                ],
+                "has_more": True,
+                "next_cursor": "cursor-2",
+            },
+            {
+                "results": [
+                    {"id": "tags-db", "type": "child_database", "child_database": {"title": "Tags"}},
+                ],
+                "has_more": False,
+            },
+        ])
+        initializer._create_database = AsyncMock(return_value=MagicMock(id="db-new"))
+        initializer.save_database_ids = MagicMock()
+
+        result = await initializer.initialize_workspace(parent_page_id="page-123")
+
+        assert result["domains"] == "domains-db"
+        assert result["tags"] == "tags-db"
+        assert initializer._create_database.call_count == 4
+        assert mock_client._api._request.call_count == 2
+        assert mock_client._api._request.call_args.kwargs["params"]["start_cursor"] == "cursor-2"
+
+    @pytest.mark.asyncio
+    async def test_list_child_databases_stops_when_all_found(self, initializer, mock_client):
+        """Test paging stops once every expected database has been seen."""
+        mock_client._api._request = AsyncMock(return_value={
+            "results": [
+                {"id": f"{title.lower()}-db", "type": "child_database", "child_database": {"title": title}}
+                for title in PersonalWorkspaceInitializer.EXPECTED_DATABASES
+            ],
+            "has_more": True,
+            "next_cursor": "cursor-2",
+        })
+
+        databases = await initializer._list_child_databases("page-123")
+
+        assert databases["Agenda"] == "agenda-db"
+        assert len(databases) == 6
+        mock_client._api._request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_list_child_databases_reuses_recent_listing(self, initializer, mock_client):
+        """Test a recent listing is reused until a database is created."""
+        mock_client._api._request = AsyncMock(return_value={
+            "results": [
+                {"id": "tags-db", "type": "child_database", "child_database": {"title": "Tags"}},
+            ],
+            "has_more": False,
+        })
+
+        first = await initializer._list_child_databases("page-123")
+        second = await initializer._list_child_databases("page-123")
+
+        assert first == second == {"Tags": "tags-db"}
+        mock_client._api._request.assert_awaited_once()
+
+        with patch("better_notion.utils.personal.workspace.DatabaseCollection") as collection:
+            collection.return_value.create = AsyncMock(
+                return_value={"id": "db-1", "object": "database", "title": [], "properties": {}}
+            )
+            await initializer._create_database("page-123", "Domains", [])
+
+        await initializer._list_child_databases("page-123")
+
+        assert mock_client._api._request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_initialize_workspace_reuses_saved_config(
+        self, initializer, mock_client, tmp_path, monkeypatch
+    ):
+        """Test a saved configuration for the same page skips detection and creation."""
+        monkeypatch.setattr(
+            "better_notion.utils.personal.metadata.CONFIG_PATH", tmp_path / "personal.json"
+        )
+        database_ids = {
+            key: f"{key}-db"
+            for key in ("domains", "tags", "projects", "tasks", "routines", "agenda")
+        }
+        PersonalWorkspaceMetadata.save_config({
+            "workspace_id": "personal-abc123",
+            "workspace_name": "Saved Workspace",
+            "parent_page_id": "page-123",
+            "database_ids": database_ids,
+        })
+        initializer._create_database = AsyncMock()
+        initializer.save_database_ids = MagicMock()
+
+        result = await initializer.initialize_workspace(parent_page_id="page-123")
+
+        assert result == database_ids
+        assert initializer._workspace_id == "personal-abc123"
+        assert initializer._workspace_name == "Saved Workspace"
+        assert mock_client._api._request.await_count == 6
+        mock_client._api._request.assert_any_await("GET", "/databases/tasks-db")
+        initializer._create_database.assert_not_called()
+
+        await initializer.initialize_workspace(parent_page_id="page-123", skip_detection=True)
+
+        assert initializer._create_database.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_initialize_workspace_recreates_deleted_saved_databases(
+        self, initializer, mock_client
+    ):
+        """Test a saved configuration is not reused once its databases are gone."""
+        from better_notion._api.errors import NotFoundError
+
+        PersonalWorkspaceMetadata.save_config({
+            "workspace_id": "personal-abc123",
+            "parent_page_id": "page-123",
+            "database_ids": {
+                key: f"{key}-db"
+                for key in ("domains", "tags", "projects", "tasks", "routines", "agenda")
+            },
+        })
+
+        async def request(method, path, **kwargs):
+            if path == "/databases/tasks-db":
+                raise NotFoundError()
+            return {"results": []}
+
+        mock_client._api._request = AsyncMock(side_effect=request)
+        initializer._create_database = AsyncMock(
+            side_effect=lambda parent_page_id, title, properties: MagicMock(id=f"{title.lower()}-new")
+        )
+        initializer.save_database_ids = MagicMock()
+
+        result = await initializer.initialize_workspace(parent_page_id="page-123")
+
+        assert result["tasks"] == "tasks-new"
+        assert initializer._create_database.call_count == 6
+        assert initializer._workspace_id != "personal-abc123"
+
+    @pytest.mark.asyncio
+    async def test_databases_exist_treats_failed_checks_as_stale(self, initializer, mock_client):
+        """Test any failed verification request makes the saved IDs unusable."""
+        from better_notion._api.errors import ForbiddenError, NetworkError
+
+        mock_client._api._request = AsyncMock(side_effect=ForbiddenError())
+        assert await initializer._databases_exist(["tasks-db"]) is False
+
+        mock_client._api._request = AsyncMock(side_effect=NetworkError("Connection reset"))
+        assert await initializer._databases_exist(["tasks-db"]) is False
+
+        mock_client._api._request = AsyncMock(return_value={"id": "tasks-db", "in_trash": True})
+        assert await initializer._databases_exist(["tasks-db"]) is False
+
+    @pytest.mark.asyncio
+    async def test_create_database_builds_property_schemas(self, initializer):
+        """Test property definitions are converted to the API schema format."""
+        with patch("better_notion.utils.personal.workspace.DatabaseCollection") as collection:
+            collection.return_value.create = AsyncMock(
+                return_value={"id": "db-1", "object": "database", "title": [], "properties": {}}
+            )
+
+            await initializer._create_database(
+                "page-123",
+                "Projects",
+                [
+                    {"name": "Name", "type": "title"},
+                    {"name": "Progress", "type": "number", "number": {"format": "percent"}},
+                    {"name": "Estimate", "type": "number"},
+                    {"name": "Done", "type": "checkbox"},
+                    {"name": "Domain", "type": "relation", "relation": {
+                        "data_source_id": "domains-db",
+                        "single_property": {},
+                    }},
+                ],
+            )
+
+        properties = collection.return_value.create.call_args.kwargs["properties"]
+        assert properties == {
+            "Name": {"type": "title", "title": {}},
+            "Progress": {"type": "number", "number": {"format": "percent"}},
+            "Estimate": {"type": "number", "number": {"format": "number"}},
+            "Done": {"type": "checkbox"},
+            "Domain": {"type": "relation", "relation": {
+                "database_id": "domains-db",
+                "single_property": {},
+            }},
+        }
+
+    @pytest.mark.asyncio
+    async def test_create_database_leaves_rate_limit_retries_to_api(self, initializer):
+        """Test a rate-limited create is not retried on top of the API client."""
+        from better_notion._api.errors import RateLimitedError
+
+        with patch("better_notion.utils.personal.workspace.DatabaseCollection") as collection:
+            collection.return_value.create = AsyncMock(side_effect=RateLimitedError(retry_after=2))
+
+            with pytest.raises(RateLimitedError):
+                await initializer._create_database("page-123", "Tags", [])
+
+        assert collection.return_value.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_create_database_limits_concurrent_creates(self, mock_client):
+        """Test no more than max_concurrency creates run at once."""
+        initializer = PersonalWorkspaceInitializer(mock_client, max_concurrency=2)
+        running = 0
+        peak = 0
+
+        async def create(**kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return {"id": f"{kwargs['title']}-db", "object": "database", "title": [], "properties": {}}
+
+        with patch("better_notion.utils.personal.workspace.DatabaseCollection") as collection:
+            collection.return_value.create = create
+            await asyncio.gather(*(
+                initializer._create_database("page-123", title, [])
+                for title in PersonalWorkspaceInitializer.EXPECTED_DATABASES
+            ))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_create_database_does_not_retry_bad_request(self, initializer):
+        """Test validation errors are raised without retrying."""
+        from better_notion._api.errors import BadRequestError
+
+        with patch("better_notion.utils.personal.workspace.DatabaseCollection") as collection:
+            collection.return_value.create = AsyncMock(side_effect=BadRequestError())
+
+            with pytest.raises(BadRequestError):
+                await initializer._create_database("page-123", "Tags", [])
+
+        assert collection.return_value.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_initialize_workspace_relates_to_created_databases(self, initializer):
+        """Test relation properties point at the databases created before them."""
+        initializer._create_database = AsyncMock(
+            side_effect=lambda parent_page_id, title, properties: MagicMock(id=f"{title.lower()}-db")
+        )
+        initializer.save_database_ids = MagicMock()
+
+        await initializer.initialize_workspace(parent_page_id="page-123")
+
+        schemas = {
+            call.args[1]: {prop["name"]: prop for prop in call.args[2]}
+            for call in initializer._create_database.call_args_list
+        }
+        assert schemas["Projects"]["Domain"]["relation"]["data_source_id"] == "domains-db"
+        assert schemas["Tasks"]["Tags"]["relation"]["data_source_id"] == "tags-db"
+        assert schemas["Agenda"]["Linked Task"]["relation"]["data_source_id"] == "tasks-db"
+        assert schemas["Agenda"]["Linked Project"]["relation"]["data_source_id"] == "projects-db"
+
+    @pytest.mark.asyncio
+    async def test_initialize_workspace_creates_independent_databases_concurrently(
+        self, initializer
+    ):
+        """Test databases without relations between them are created together."""
+        started = []
+        both_started = asyncio.Event()
+
+        async def create_database(parent_page_id, title, properties):
+            started.append(title)
+            if title in ("Domains", "Tags"):
+                if len(started) == 2:
+                    both_started.set()
+                await asyncio.wait_for(both_started.wait(), timeout=1)
+            return MagicMock(id=f"{title.lower()}-db")
+
+        initializer._create_database = create_database
+        initializer.save_database_ids = MagicMock()
+
+        result = await initializer.initialize_workspace(parent_page_id="page-123")
+
+        assert set(started[:2]) == {"Domains", "Tags"}
+        assert started[-1] == "Agenda"
+        assert result == {
+            "domains": "domains-db",
+            "tags": "tags-db",
+            "projects": "projects-db",
+            "tasks": "tasks-db",
+            "routines": "routines-db",
+            "agenda": "agenda-db",
+        }
+
 
 @pytest.mark.integration
 class TestPersonalWorkspaceDetection:
@@ -246,7 +644,6 @@ class TestPersonalWorkspaceDetection:
     async def test_auto_detect_existing_workspace(self):
         """Test that existing workspace is auto-detected."""
         from better_notion._sdk.models.page import Page
-        from better_notion.plugins.official.personal_cli import get_client
         from better_notion.utils.personal.metadata import PersonalWorkspaceMetadata
 
         # Mock page
@@ -53,6 +53,16 @@ class TestNotionAPI:
         api = NotionAPI(auth="secret_test", timeout=60.0)
         assert api._timeout == 60.0
 
+    def test_default_max_connections(self):
+        """Test the HTTP pool keeps a single connection by default."""
+        api = NotionAPI(auth="secret_test")
+        assert api._max_connections == 1
+
+    def test_custom_max_connections(self):
+        """Test the HTTP pool size can be raised."""
+        api = NotionAPI(auth="secret_test", max_connections=5)
+        assert api._max_connections == 5
+
     def test_collections_initialized(self):
         """Test all collections are initialized."""
         api = NotionAPI(auth="secret_test")
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -53,6 +54,29 @@ class TestPageCollection:
         assert isinstance(page, Page)
         assert page.id == "5c6a28216bb14a7eb6e1c50111515c3d"
 
+    @pytest.mark.asyncio
+    async def test_get_many_pages(self, mock_api, sample_page_data):
+        """Test retrieving several pages keeps order and bounds concurrency."""
+        running = 0
+        peak = 0
+
+        async def request(method, path, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return {**sample_page_data, "id": path.rsplit("/", 1)[-1]}
+
+        mock_api._request = request
+        ids = [f"page-{i}" for i in range(5)]
+
+        pages = await mock_api.pages.get_many(ids, concurrency=2)
+
+        assert [page.id for page in pages] == ids
+        assert all(isinstance(page, Page) for page in pages)
+        assert peak == 2
+
     @pytest.mark.asyncio
     async def test_get_page_not_found(self, mock_api):
         """Test retrieving a non-existent page raises NotFoundError."""